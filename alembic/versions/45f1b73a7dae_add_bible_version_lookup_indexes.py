@@ -0,0 +1,45 @@
+"""Add bible version lookup indexes
+
+Revision ID: 45f1b73a7dae
+Revises: 5976b6478979
+Create Date: 2026-10-17 14:03:27.614052
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '45f1b73a7dae'
+down_revision = '5976b6478979'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.create_index(
+        'bible_versions_lower_command_idx',
+        'bible_versions',
+        [sa.text('lower(command) text_pattern_ops')],
+    )
+    op.create_index(
+        'bible_versions_lower_abbr_idx',
+        'bible_versions',
+        [sa.text('lower(abbr) text_pattern_ops')],
+    )
+    op.create_index(
+        'bible_versions_lower_name_trgm_idx',
+        'bible_versions',
+        [sa.text('lower(name) gin_trgm_ops')],
+        postgresql_using='gin',
+    )
+
+
+def downgrade():
+    op.drop_index('bible_versions_lower_name_trgm_idx', table_name='bible_versions')
+    op.drop_index('bible_versions_lower_abbr_idx', table_name='bible_versions')
+    op.drop_index('bible_versions_lower_command_idx', table_name='bible_versions')
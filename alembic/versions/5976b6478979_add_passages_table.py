@@ -0,0 +1,41 @@
+"""Add passages table
+
+Revision ID: 5976b6478979
+Revises: 48f1f9cd0bee
+Create Date: 2026-10-17 09:12:44.518230
+
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+from erasmus.db.types import DateTime
+
+# revision identifiers, used by Alembic.
+revision = '5976b6478979'
+down_revision = '48f1f9cd0bee'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        'passages',
+        sa.Column(
+            'bible_id',
+            sa.Integer,
+            sa.ForeignKey('bible_versions.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column('osis', sa.Text, primary_key=True),
+        sa.Column('text', sa.Text, nullable=False),
+        sa.Column('expires_at', DateTime(timezone=True), nullable=False),
+    )
+    op.create_index('passages_expires_at_idx', 'passages', ['expires_at'])
+
+
+def downgrade():
+    op.drop_index('passages_expires_at_idx', table_name='passages')
+    op.drop_table('passages')
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from time import monotonic
+from typing import overload
+
+from attrs import define, field
+
+
+@define(eq=False)
+class LRUCache[K, V]:
+    maxsize: int = 1024
+    ttl: float | None = None
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    _storage: OrderedDict[K, tuple[float | None, V]] = field(
+        init=False, factory=lambda: OrderedDict[K, tuple[float | None, V]]()
+    )
+
+    def __len__(self, /) -> int:
+        return len(self._storage)
+
+    def __contains__(self, key: K, /) -> bool:
+        if key not in self._storage:
+            return False
+
+        expires, _ = self._storage[key]
+
+        return expires is None or expires > monotonic()
+
+    @overload
+    def get(self, key: K, /) -> V | None: ...
+
+    @overload
+    def get[D](self, key: K, default: D, /) -> V | D: ...
+
+    def get[D](self, key: K, default: D | None = None, /) -> V | D | None:
+        entry = self._storage.get(key)
+
+        if entry is not None:
+            expires, value = entry
+
+            if expires is None or expires > monotonic():
+                self._storage.move_to_end(key)
+                self.hits += 1
+                return value
+
+            del self._storage[key]
+
+        self.misses += 1
+
+        return default
+
+    def set(self, key: K, value: V, /) -> None:
+        expires = None if self.ttl is None else monotonic() + self.ttl
+
+        self._storage[key] = (expires, value)
+        self._storage.move_to_end(key)
+
+        while len(self._storage) > self.maxsize:
+            self._storage.popitem(last=False)
+
+    def discard(self, key: K, /) -> None:
+        self._storage.pop(key, None)
+
+    def clear(self, /) -> None:
+        self._storage.clear()
+
+    @property
+    def hit_ratio(self, /) -> float:
+        total = self.hits + self.misses
+
+        return self.hits / total if total else 0.0
@@ -10,10 +10,12 @@ import discord
 from botus_receptus import GroupCog, utils
 from botus_receptus.app_commands import admin_guild_only
 from discord import app_commands
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from .. import checks
-from ..db import Session
+from ..db import Session, pool_metrics
 from ..erasmus import Erasmus, _extensions as _extension_names
+from ..services.parse_executor import parse_metrics
 from ..types import Refreshable
 
 if TYPE_CHECKING:
@@ -241,6 +243,33 @@ class Admin(GroupCog[Erasmus], group_name='admin', group_description='Admin comm
                 if isinstance(cog, Refreshable):
                     await cog.refresh(session)
 
+    @app_commands.command(name='db-pool')
+    @checks.is_owner()
+    @app_commands.describe(reset='Whether to reset the metrics after showing them')
+    async def db_pool(self, itx: discord.Interaction, /, reset: bool = False) -> None:
+        """Show database connection pool metrics"""
+
+        engine = Session.kw.get('bind')
+        pool = engine.sync_engine.pool if isinstance(engine, AsyncEngine) else None
+
+        await utils.send_embed(
+            itx, description=f'```\n{pool_metrics.report(pool)}\n```'
+        )
+
+        if reset:
+            pool_metrics.reset()
+
+    @app_commands.command()
+    @checks.is_owner()
+    @app_commands.describe(reset='Whether to reset the metrics after showing them')
+    async def parsing(self, itx: discord.Interaction, /, reset: bool = False) -> None:
+        """Show how long parsing service responses took"""
+
+        await utils.send_embed(itx, description=f'```\n{parse_metrics.report()}\n```')
+
+        if reset:
+            parse_metrics.reset()
+
     @app_commands.command(name='reload-translations')
     @checks.is_owner()
     async def reload_translations(self, itx: discord.Interaction, /) -> None:
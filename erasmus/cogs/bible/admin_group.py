@@ -11,9 +11,9 @@ from discord import app_commands
 from sqlalchemy.exc import IntegrityError
 
 from ...data import SectionFlag
-from ...db import BibleVersion, Session
+from ...db import BibleVersion, Session, StoredPassage, bible_versions
 from ...exceptions import ErasmusError
-from .bible_lookup import bible_lookup
+from .bible_lookup import bible_lookup  # noqa: TC001
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
@@ -69,8 +69,7 @@ class BibleAdminGroup(app_commands.Group, name='bibleadmin'):
     ) -> None:
         """Get information for a Bible version"""
 
-        async with Session() as session:
-            existing = await BibleVersion.get_by_command(session, version)
+        existing = bible_versions.get_by_command(version)
 
         await utils.send_embed(
             itx,
@@ -168,9 +167,11 @@ class BibleAdminGroup(app_commands.Group, name='bibleadmin'):
 
         async with Session.begin() as session:
             existing = await BibleVersion.get_by_command(session, version)
-            bible_lookup.discard(existing.command)
             await session.delete(existing)
 
+        async with Session() as session:
+            await self.refresh_data(session)
+
         await utils.send_embed(
             itx,
             description=f'Removed `{existing.command}`',
@@ -251,9 +252,13 @@ class BibleAdminGroup(app_commands.Group, name='bibleadmin'):
                     books=books,
                     book_mapping=book_mapping,
                 )
+                # Stored passages may have been fetched with the old service settings
+                await StoredPassage.delete_for_bible(session, bible.id)
 
                 await session.commit()
 
+            self.service_manager.passage_cache.clear()
+
             async with Session() as session:
                 await self.refresh_data(session)
         except orjson.JSONDecodeError:
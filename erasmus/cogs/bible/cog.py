@@ -4,13 +4,12 @@ import logging
 from typing import TYPE_CHECKING, Final, cast, override
 
 import discord
-from attrs import field, frozen
 from botus_receptus import Cog, formatting, utils
 from discord import app_commands
 from discord.ext import commands, tasks
 
-from ...data import Passage, SearchResults, VerseRange
-from ...db import BibleVersion, Session
+from ...data import SearchResults, VerseRange
+from ...db import BibleVersion, Session, bible_versions, preference_cache
 from ...exceptions import (
     BibleNotSupportedError,
     BookMappingInvalid,
@@ -46,7 +45,6 @@ if TYPE_CHECKING:
 
     from ...erasmus import Erasmus
     from ...l10n import Localizer
-    from ...types import Bible as _BibleType
 
 _log: Final = logging.getLogger(__name__)
 
@@ -55,22 +53,6 @@ _shared_cooldown = app_commands.checks.cooldown(
 )
 
 
-@frozen
-class PassageFetcher:
-    verse_range: VerseRange
-    service_manager: ServiceManager
-    passage_map: dict[int, Passage] = field(init=False, factory=dict[int, Passage])
-
-    async def __call__(self, bible: _BibleType, /) -> Passage:
-        if bible.id in self.passage_map:
-            return self.passage_map[bible.id]
-
-        passage = await self.service_manager.get_passage(bible, self.verse_range)
-        self.passage_map[bible.id] = passage
-
-        return passage
-
-
 class Bible(Cog['Erasmus']):
     service_manager: ServiceManager
     localizer: Localizer
@@ -83,6 +65,7 @@ class Bible(Cog['Erasmus']):
 
     __lookup_cooldown: commands.CooldownMapping[discord.Message]
     __daily_bread_task: tasks.Loop[Callable[[], Coroutine[None]]]
+    __purge_passages_task: tasks.Loop[Callable[[], Coroutine[None]]]
 
     def __init__(self, bot: Erasmus, /) -> None:
         self.service_manager = ServiceManager.from_config(bot.config, bot.session)
@@ -100,11 +83,13 @@ class Bible(Cog['Erasmus']):
         self.testing_server_preferences.initialize_from_parent(self)
 
     async def refresh(self, session: AsyncSession, /) -> None:
+        await bible_versions.refresh(session)
+
         bible_lookup.clear()
         bible_lookup.update(
             [
                 _BibleOption.create(version)  # pyright: ignore[reportArgumentType]
-                async for version in BibleVersion.get_all(session, ordered=True)
+                for version in bible_versions
             ]
         )
 
@@ -114,14 +99,31 @@ class Bible(Cog['Erasmus']):
         self.__daily_bread_task.start()
         await self.__daily_bread_task()
 
+        self.__purge_passages_task = tasks.loop(hours=6)(self.__purge_passages)
+        self.__purge_passages_task.start()
+
         async with Session() as session:
             await self.refresh(session)
 
     @override
     async def cog_unload(self) -> None:
         bible_lookup.clear()
+        bible_versions.clear()
+        preference_cache.clear()
 
         self.__daily_bread_task.cancel()
+        self.__purge_passages_task.cancel()
+
+        await self.service_manager.close()
+
+    async def __purge_passages(self) -> None:
+        if self.service_manager.passage_store is None:
+            return
+
+        try:
+            await self.service_manager.passage_store.purge_expired()
+        except Exception:  # noqa: BLE001
+            _log.exception('An error occurred while purging expired passages')
 
     def __get_cooldown_bucket(self, message: discord.Message, /) -> commands.Cooldown:
         bucket = self.__lookup_cooldown.get_bucket(message)
@@ -265,9 +267,7 @@ class Bible(Cog['Erasmus']):
                         raise verse_range  # noqa: TRY301
 
                     if verse_range.version is not None:
-                        bible = await BibleVersion.get_by_abbr(
-                            session, verse_range.version
-                        )
+                        bible = bible_versions.get_by_abbr(verse_range.version)
 
                     if bible is None:
                         bible = user_bible
@@ -299,11 +299,11 @@ class Bible(Cog['Erasmus']):
         if version is not None:
             reference = reference.with_version(version)
 
-        async with Session() as session:
-            if reference.version is not None:
-                bible = await BibleVersion.get_by_abbr(session, reference.version)
+        if reference.version is not None:
+            bible = bible_versions.get_by_abbr(reference.version)
 
-            if bible is None:
+        if bible is None:
+            async with Session() as session:
                 bible = await BibleVersion.get_for(
                     session, user=itx.user, guild=itx.guild
                 )
@@ -327,11 +327,11 @@ class Bible(Cog['Erasmus']):
 
         bible: BibleVersion | None = None
 
-        async with Session() as session:
-            if version is not None:
-                bible = await BibleVersion.get_by_abbr(session, version)
+        if version is not None:
+            bible = bible_versions.get_by_abbr(version)
 
-            if bible is None:
+        if bible is None:
+            async with Session() as session:
                 bible = await BibleVersion.get_for(
                     session, user=itx.user, guild=itx.guild
                 )
@@ -361,11 +361,9 @@ class Bible(Cog['Erasmus']):
     async def bibles(self, itx: discord.Interaction, /) -> None:
         """List which Bible versions are available for lookup and search"""
 
-        async with Session() as session:
-            lines = [self.localizer.format('bibles.prefix', locale=itx.locale), ''] + [
-                f'  {version.name} (`{version.command}`)'
-                async for version in BibleVersion.get_all(session, ordered=True)
-            ]
+        lines = [self.localizer.format('bibles.prefix', locale=itx.locale), ''] + [
+            f'  {version.name} (`{version.command}`)' for version in bible_versions
+        ]
 
         output = '\n'.join(lines)
         await utils.send_embed(itx, description=output)
@@ -381,8 +379,7 @@ class Bible(Cog['Erasmus']):
     ) -> None:
         """Get information about a Bible version"""
 
-        async with Session() as session:
-            existing = await BibleVersion.get_by_command(session, version)
+        existing = bible_versions.get_by_command(version)
 
         localizer = self.localizer.for_message('bibleinfo', locale=itx.locale)
 
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Final
 
 import discord
 import pendulum
-from attrs import field, frozen
+from attrs import frozen
 from botus_receptus import re, utils
 from bs4 import BeautifulSoup
 from bs4.filter import SoupStrainer
@@ -14,7 +14,7 @@ from discord import app_commands
 from discord.ext import tasks
 
 from ....data import Passage, VerseRange
-from ....db import BibleVersion, DailyBread, Session
+from ....db import BibleVersion, DailyBread, Session, bible_versions
 from ....exceptions import (
     BookNotInVersionError,
     DailyBreadNotInVersionError,
@@ -46,19 +46,12 @@ _shared_cooldown: Final = app_commands.checks.cooldown(
 class PassageFetcher:
     verse_range: VerseRange
     service_manager: ServiceManager
-    passage_map: dict[int, Passage] = field(init=False, factory=dict[int, Passage])
 
     def verse_range_in_bible(self, bible: Bible, /) -> bool:
         return self.verse_range.book_mask in bible.books
 
     async def __call__(self, bible: Bible, /) -> Passage:
-        if bible.id in self.passage_map:
-            return self.passage_map[bible.id]
-
-        passage = await self.service_manager.get_passage(bible, self.verse_range)
-        self.passage_map[bible.id] = passage
-
-        return passage
+        return await self.service_manager.get_passage(bible, self.verse_range)
 
 
 @app_commands.guild_only()
@@ -262,11 +255,11 @@ class DailyBreadGroup(
 
         bible: BibleVersion | None = None
 
-        async with Session() as session:
-            if version is not None:
-                bible = await BibleVersion.get_by_abbr(session, version)
+        if version is not None:
+            bible = bible_versions.get_by_abbr(version)
 
-            if bible is None:
+        if bible is None:
+            async with Session() as session:
                 bible = await BibleVersion.get_for(
                     session, user=itx.user, guild=itx.guild
                 )
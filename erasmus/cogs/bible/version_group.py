@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from botus_receptus import utils
 from discord import app_commands
 
-from ...db import BibleVersion, GuildPref, Session, UserPref
+from ...db import Session, UserPref, bible_versions, preference_cache
 from .bible_lookup import bible_lookup  # noqa: TC001
 
 if TYPE_CHECKING:
@@ -35,10 +35,13 @@ class VersionGroup(
         """Set your default Bible version"""
         version = version.lower()
 
+        existing = bible_versions.get_by_command(version)
+
         async with Session.begin() as session:
-            existing = await BibleVersion.get_by_command(session, version)
             await existing.set_for_user(session, itx.user)
 
+        preference_cache.set_user(itx.user.id, existing.id)
+
         await utils.send_embed(
             itx,
             description=self.localizer.format(
@@ -63,6 +66,8 @@ class VersionGroup(
             else:
                 attribute_id = 'already-deleted'
 
+        preference_cache.set_user(itx.user.id, None)
+
         await utils.send_embed(
             itx,
             description=self.localizer.format(
@@ -79,37 +84,30 @@ class VersionGroup(
         localizer = self.localizer.for_message('show', locale=itx.locale)
 
         async with Session() as session:
-            display_version: BibleVersion | None = None
-            user_prefs = await UserPref.for_user(session, itx.user)
+            user_bible_id, guild_bible_id = await preference_cache.get(
+                session,
+                itx.user.id,
+                itx.guild.id if itx.guild is not None else None,
+            )
+
+        if (user_version := bible_versions.get(user_bible_id)) is not None:
+            output = localizer.format('user-set', data={'version': user_version.name})
+        else:
+            output = localizer.format('user-not-set')
 
-            if user_prefs is not None and user_prefs.bible_version is not None:
-                display_version = user_prefs.bible_version
-                output = localizer.format(
-                    'user-set', data={'version': display_version.name}
+        if itx.guild is not None:
+            if (guild_version := bible_versions.get(guild_bible_id)) is not None:
+                guild_output = localizer.format(
+                    'guild-set', data={'version': guild_version.name}
                 )
             else:
-                output = localizer.format('user-not-set')
+                guild_output = localizer.format('guild-not-set')
 
-            if itx.guild is not None:
-                guild_prefs = await GuildPref.for_guild(session, itx.guild)
+            output = f'{output}\n{guild_output}'
 
-                if guild_prefs is not None and guild_prefs.bible_version is not None:
-                    guild_output = localizer.format(
-                        'guild-set', data={'version': guild_prefs.bible_version.name}
-                    )
-
-                    if display_version is None:
-                        display_version = guild_prefs.bible_version
-                else:
-                    guild_output = localizer.format('guild-not-set')
-
-                output = f'{output}\n{guild_output}'
-
-            if display_version is None:
-                display_version = await BibleVersion.get_for(session)
-
-            output = f'{output}\n\n' + localizer.format(
-                'display-version', data={'version': display_version.name}
-            )
+        display_version = bible_versions.resolve(user_bible_id, guild_bible_id)
+        output = f'{output}\n\n' + localizer.format(
+            'display-version', data={'version': display_version.name}
+        )
 
         await utils.send_embed(itx, description=output, ephemeral=True)
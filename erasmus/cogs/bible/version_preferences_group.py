@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING
 from botus_receptus import utils
 from discord import app_commands
 
-from ...db import BibleVersion, GuildPref, Session
+from ...db import GuildPref, Session, bible_versions, preference_cache
 from .bible_lookup import bible_lookup  # noqa: TC001
 
 if TYPE_CHECKING:
@@ -41,10 +41,13 @@ class VersionPreferencesGroup(
 
         version = version.lower()
 
+        existing = bible_versions.get_by_command(version)
+
         async with Session.begin() as session:
-            existing = await BibleVersion.get_by_command(session, version)
             await existing.set_for_guild(session, itx.guild)
 
+        preference_cache.set_guild(itx.guild.id, existing.id)
+
         await utils.send_embed(
             itx,
             description=self.localizer.format(
@@ -74,6 +77,8 @@ class VersionPreferencesGroup(
             else:
                 attribute_id = 'already-deleted'
 
+        preference_cache.set_guild(itx.guild.id, None)
+
         await utils.send_embed(
             itx,
             description=self.localizer.format(
@@ -93,11 +98,11 @@ class VersionPreferencesGroup(
             assert itx.guild is not None
 
         async with Session() as session:
-            guild_prefs = await GuildPref.for_guild(session, itx.guild)
+            _, guild_bible_id = await preference_cache.get(session, None, itx.guild.id)
 
-        if guild_prefs is not None and guild_prefs.bible_version is not None:
+        if (bible := bible_versions.get(guild_bible_id)) is not None:
             attribute_id = 'set'
-            data = {'version': guild_prefs.bible_version.name}
+            data = {'version': bible.name}
         else:
             attribute_id = 'not-set'
             data = None
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from itertools import pairwise
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Final, NamedTuple, Self, cast, override
 
 import discord
-from attrs import frozen
+from attrs import define, field, frozen
 from botus_receptus import re, utils
 from botus_receptus.cog import GroupCog
 from botus_receptus.formatting import EmbedPaginator, bold, escape, underline
@@ -15,16 +16,18 @@ from ..db import (
     ConfessionType,
     NumberingType,
     Section,
+    SectionPage,
     Session,
+    search_cache,
 )
 from ..exceptions import InvalidConfessionError, NoSectionError
 from ..format import alpha_to_int, int_to_alpha, int_to_roman, roman_to_int
-from ..page_source import FieldPageSource, ListPageSource, Pages
+from ..page_source import AsyncCallback, AsyncPageSource, FieldPageSource, Pages
 from ..ui_pages import UIPages
 from ..utils import AutoCompleter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Sequence
+    from collections.abc import Callable, Iterable, Mapping, Sequence
     from re import Match
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -98,9 +101,7 @@ def _format_section_number(confession: ConfessionRecord, section: Section, /) ->
     return result
 
 
-async def _get_output(
-    session: AsyncSession, confession: ConfessionRecord, match: Match[str], /
-) -> tuple[str | None, str]:
+def _parse_section_number(match: Match[str], /) -> tuple[int, int | None]:
     if match['section_arabic']:
         section_number = int(match['section_arabic'])
     elif match['section_roman']:
@@ -117,36 +118,79 @@ async def _get_output(
     else:
         subsection_number = None
 
-    section = await confession.get_section(session, section_number, subsection_number)
-    formatted_section_number = _format_section_number(confession, section)
+    return section_number, subsection_number
 
+
+def _render_section(section: Section, section_str: str, /) -> tuple[str | None, str]:
     if section.title is not None:
-        return f'{formatted_section_number}. {section.title}', section.text
+        return f'{section_str}. {section.title}', section.text
+
+    return None, f'{bold(section_str)}. {section.text}'
+
+
+@define(eq=False)
+class _SectionSearch:
+    confession: ConfessionRecord
+    terms: str
+    # The last section before each offset that has been fetched
+    _last_sections: dict[int, Section] = field(init=False, factory=dict)
+
+    async def __call__(self, *, per_page: int, page_number: int) -> SectionPage:
+        async with Session() as session:
+            page = await self.confession.search_page(
+                session,
+                self.terms,
+                limit=per_page,
+                offset=page_number,
+                after=self._last_sections.get(page_number),
+            )
+
+        if page.sections:
+            self._last_sections[page_number + len(page.sections)] = page.sections[-1]
 
-    return None, f'{bold(formatted_section_number)}. {section.text}'
+        return page
+
+
+@frozen
+class _RankedSectionSearch:
+    terms: str
+    confession_id: int | None
+
+    async def __call__(self, *, per_page: int, page_number: int) -> SectionPage:
+        async with Session() as session:
+            return await Section.search_ranked(
+                session,
+                self.terms,
+                limit=per_page,
+                offset=page_number,
+                confession_id=self.confession_id,
+            )
 
 
 class ConfessionSearchSource(
-    FieldPageSource['Sequence[Section]'], ListPageSource[Section]
+    FieldPageSource['Sequence[Section]'], AsyncPageSource[Section]
 ):
     terms: str
-    confession: ConfessionRecord
+    confession: ConfessionRecord | None
+    confessions: Mapping[int, ConfessionRecord]
     localizer: MessageLocalizer
 
     def __init__(
         self,
-        entries: list[Section],
+        callback: AsyncCallback[Section],
         /,
         *,
         terms: str,
         per_page: int,
-        confession: ConfessionRecord,
+        confession: ConfessionRecord | None,
+        confessions: Mapping[int, ConfessionRecord],
         localizer: MessageLocalizer,
     ) -> None:
-        super().__init__(entries, per_page=per_page)
+        super().__init__(callback, per_page=per_page)
 
         self.terms = terms
         self.confession = confession
+        self.confessions = confessions
         self.localizer = localizer
 
     @override
@@ -154,7 +198,12 @@ class ConfessionSearchSource(
         self, entries: Sequence[Section], /
     ) -> Iterable[tuple[str, str]]:
         for entry in entries:
-            section_number = _format_section_number(self.confession, entry)
+            confession = self.confessions[entry.confession_id]
+            section_number = _format_section_number(confession, entry)
+
+            if self.confession is None:
+                section_number = f'{confession.name} {section_number}'
+
             title = (
                 section_number
                 if entry.title is None
@@ -177,8 +226,12 @@ class ConfessionSearchSource(
 
     @override
     async def set_page_text(self, page: Sequence[Section] | None, /) -> None:
-        self.embed.title = self.localizer.format(
-            'title', data={'confession_name': self.confession.name}
+        self.embed.title = (
+            self.localizer.format('title-all')
+            if self.confession is None
+            else self.localizer.format(
+                'title', data={'confession_name': self.confession.name}
+            )
         )
 
         if page is None:
@@ -210,11 +263,30 @@ class _ConfessionOption:
     name_lower: str
     type: ConfessionType
     section_info: list[_SectionInfo]
+    # The rendered title and text of each section, keyed by number and subsection
+    # number. A number without a subsection number also cites its lowest
+    # subsection, so chapters can be cited by their number alone.
+    citations: Mapping[tuple[int, int | None], tuple[str | None, str]]
 
     @property
     def key(self) -> str:
         return self.command
 
+    def cite(
+        self, number: int, subsection_number: int | None = None, /
+    ) -> tuple[str | None, str]:
+        citation = self.citations.get((number, subsection_number))
+
+        if citation is None:
+            formatted_number = f'{number}'
+
+            if subsection_number is not None:
+                formatted_number = f'{formatted_number}.{subsection_number}'
+
+            raise NoSectionError(self.name, formatted_number, self.type)
+
+        return citation
+
     def matches(self, text: str, /) -> bool:
         return text in self.name_lower or text in self.command_lower
 
@@ -224,9 +296,14 @@ class _ConfessionOption:
     @classmethod
     def create(cls, confession: ConfessionRecord, /) -> Self:
         section_info: list[_SectionInfo] = []
+        citations: dict[tuple[int, int | None], tuple[str | None, str]] = {}
 
         for section in confession.sections:
             section_str = _format_section_number(confession, section)
+            citation = _render_section(section, section_str)
+            citations[section.number, section.subsection_number] = citation
+            # Sections are ordered by subsection number, so the first one wins
+            citations.setdefault((section.number, None), citation)
             section_value = f'{section.number}'
 
             if section.subsection_number is not None:
@@ -254,6 +331,7 @@ class _ConfessionOption:
             command_lower=confession.command.lower(),
             type=confession.type,
             section_info=section_info,
+            citations=MappingProxyType(citations),
         )
 
 
@@ -313,23 +391,28 @@ class Confession(
 ):
     base_localizer: Localizer
     localizer: GroupLocalizer
+    # Every confession by id, for labelling search results from all of them
+    confessions: dict[int, ConfessionRecord]
 
     def __init__(self, bot: Erasmus, /) -> None:
         self.base_localizer = bot.localizer
         self.localizer = bot.localizer.for_group(self)
+        self.confessions = {}
 
         super().__init__(bot)
 
     async def refresh(self, session: AsyncSession, /) -> None:
+        records = [
+            confession
+            async for confession in ConfessionRecord.get_all(
+                session, order_by_name=True, load_sections=True
+            )
+        ]
+        options = [_ConfessionOption.create(record) for record in records]
+
+        self.confessions = {record.id: record for record in records}
         _confession_lookup.clear()
-        _confession_lookup.update(
-            [
-                _ConfessionOption.create(confession)
-                async for confession in ConfessionRecord.get_all(
-                    session, order_by_name=True, load_sections=True
-                )
-            ]
-        )
+        _confession_lookup.update(options)
 
     @override
     async def cog_load(self) -> None:
@@ -339,6 +422,8 @@ class Confession(
     @override
     async def cog_unload(self) -> None:
         _confession_lookup.clear()
+        self.confessions = {}
+        search_cache.clear()
 
     @override
     async def cog_app_command_error(  # pyright: ignore[reportIncompatibleMethodOverride]
@@ -385,27 +470,42 @@ class Confession(
         rate=2, per=30.0, key=lambda i: (i.guild_id, i.user.id)
     )
     @app_commands.describe(
-        source='The confession or catechism to search in', terms='Terms to search for'
+        terms='Terms to search for',
+        source='The confession or catechism to search in (all of them if omitted)',
+        ranked='Order results by relevance instead of by section',
     )
     async def search(
         self,
         itx: discord.Interaction,
         /,
-        source: app_commands.Transform[str, _confession_lookup],
         terms: str,
+        source: app_commands.Transform[str | None, _confession_lookup] = None,
+        ranked: bool = False,
     ) -> None:
         """Search for terms in a confession or catechism"""
 
-        async with Session() as session:
-            confession = await ConfessionRecord.get_by_command(session, source)
-            results = await confession.search(session, terms)
+        if source is None:
+            confession = None
+            confessions = self.confessions
+        else:
+            async with Session() as session:
+                confession = await ConfessionRecord.get_by_command(session, source)
+
+            confessions = {confession.id: confession}
+
+        callback: AsyncCallback[Section] = (
+            _RankedSectionSearch(terms, None if confession is None else confession.id)
+            if confession is None or ranked
+            else _SectionSearch(confession, terms)
+        )
 
         localizer = self.localizer.for_message('search', itx.locale)
         search_source = ConfessionSearchSource(
-            results,
+            callback,
             terms=discord.utils.escape_markdown(terms),
             per_page=5,
             confession=confession,
+            confessions=confessions,
             localizer=localizer,
         )
         pages = UIPages(itx, search_source, localizer=localizer)
@@ -427,13 +527,15 @@ class Confession(
     ) -> None:
         """Cite a section from a confession or catechism"""
 
-        async with Session() as session:
-            confession = await ConfessionRecord.get_by_command(session, source)
+        confession = _confession_lookup.get(source.lower())
+
+        if confession is None:
+            raise InvalidConfessionError(source)
 
-            if (match := _reference_re.match(section)) is None:
-                raise NoSectionError(confession.name, section, confession.type)
+        if (match := _reference_re.match(section)) is None:
+            raise NoSectionError(confession.name, section, confession.type)
 
-            section_title, output = await _get_output(session, confession, match)
+        section_title, output = confession.cite(*_parse_section_number(match))
 
         paginator = EmbedPaginator()
 
@@ -1,13 +1,27 @@
 from __future__ import annotations
 
-from typing import NotRequired, TypedDict
+from typing import Literal, NotRequired, TypedDict
 
 from botus_receptus import Config as BaseConfig
 
 
 class ServiceConfig(TypedDict):
     api_key: NotRequired[str]
+    data_dir: NotRequired[str]
+    passage_store: NotRequired[bool]
 
 
 class Config(BaseConfig):
     services: dict[str, ServiceConfig]
+    db_pool_size: NotRequired[int]
+    db_max_overflow: NotRequired[int]
+    db_pool_timeout: NotRequired[float]
+    db_pool_pre_ping: NotRequired[bool]
+    db_statement_cache_size: NotRequired[int]
+    passage_cache_size: NotRequired[int]
+    passage_cache_ttl: NotRequired[float]
+    passage_store: NotRequired[bool]
+    passage_store_ttl: NotRequired[float]
+    parse_executor: NotRequired[Literal['inline', 'thread', 'process']]
+    parse_workers: NotRequired[int]
+    parse_threshold: NotRequired[int]
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from enum import Flag, auto
 from pathlib import Path
-from typing import TYPE_CHECKING, Final, Self, TypedDict, override
+from typing import TYPE_CHECKING, Final, Literal, Self, TypedDict, overload, override
 
 import orjson
-from attrs import evolve, frozen
+from attrs import frozen
 from botus_receptus import re
 from more_itertools import unique_everseen
 
@@ -14,10 +14,11 @@ from .exceptions import (
     BookNotUnderstoodError,
     ReferenceNotUnderstoodError,
 )
+from .reference_scanner import ReferenceMatch, ReferenceScanner, could_contain_reference
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
-    from re import Match, Pattern
+    from collections.abc import Iterable, Iterator
+    from re import Match
 
     import discord
 
@@ -107,13 +108,16 @@ class _RawBookDict(TypedDict):
     alt: list[str]
 
 
-@frozen
+# Books are only created when books.json is loaded, so they compare and hash by
+# identity
+@frozen(eq=False)
 class Book:
     name: str
     osis: str
     paratext: str | None
     alt: frozenset[str]
     section: SectionFlag
+    index: int
 
     @override
     def __str__(self) -> str:
@@ -128,6 +132,10 @@ class Book:
 
         return book
 
+    @classmethod
+    def from_index(cls, index: int, /) -> Book:
+        return _books[index]
+
 
 def __populate_maps() -> tuple[
     dict[str, Book], dict[str, Book], dict[SectionFlag, Book]
@@ -153,6 +161,7 @@ def __populate_maps() -> tuple[
                 raw_book['paratext'],
                 frozenset(raw_book['alt']),
                 section,
+                len(osis_map),
             )
 
             if book.section not in book_mask_map:
@@ -172,11 +181,76 @@ _book_map: Final
 _osis_map: Final
 _book_mask_map: Final
 
+_books: Final = tuple(_osis_map.values())
+_book_name_indexes: Final = {name: book.index for name, book in _book_map.items()}
 
-@frozen
-class Verse:
-    chapter: int
-    verse: int
+
+@frozen(eq=False)
+class BookTable:
+    """A Bible version's book mapping, indexed by `Book.index`"""
+
+    books: tuple[Book, ...]
+
+    def __getitem__(self, book: Book, /) -> Book:
+        return self.books[book.index]
+
+    @classmethod
+    def from_mapping(
+        cls, version: str, book_mapping: dict[str, str] | None, /
+    ) -> Self | None:
+        if not book_mapping:
+            return None
+
+        books = list(_books)
+
+        for from_osis, to_osis in book_mapping.items():
+            if (from_book := _osis_map.get(from_osis)) is None:
+                continue
+
+            if (to_book := _osis_map.get(to_osis)) is None:
+                raise BookMappingInvalid(version, from_book, to_osis)
+
+            books[from_book.index] = to_book
+
+        return cls(tuple(books))
+
+
+# (string index, book index, start chapter, start verse, end chapter, end verse)
+type CompactReference = tuple[int, int, int, int, int, int]
+
+
+_verse_bits: Final = 10
+_verse_mask: Final = (1 << _verse_bits) - 1
+
+
+class Verse(int):
+    """A chapter and verse packed into `chapter << 10 | verse`"""
+
+    __slots__ = ()
+
+    def __new__(cls, chapter: int, verse: int, /) -> Self:
+        if chapter < 0 or not 0 <= verse <= _verse_mask:
+            raise ReferenceNotUnderstoodError(f'{chapter}:{verse}')
+
+        return super().__new__(cls, (chapter << _verse_bits) | verse)
+
+    @property
+    def chapter(self, /) -> int:
+        return self >> _verse_bits
+
+    @property
+    def verse(self, /) -> int:
+        return self & _verse_mask
+
+    @override
+    def __getnewargs__(  # pyright: ignore[reportIncompatibleMethodOverride]
+        self, /
+    ) -> tuple[int, int]:
+        return self.chapter, self.verse
+
+    @override
+    def __repr__(self, /) -> str:
+        return f'Verse(chapter={self.chapter}, verse={self.verse})'
 
     @override
     def __str__(self, /) -> str:
@@ -227,33 +301,7 @@ _reference_with_version_re: Final = re.compile(
     flags=re.IGNORECASE,
 )
 
-_reference_or_bracketed_with_version_re: Final = re.compile(
-    re.optional(
-        re.named_group('bracket')(re.LEFT_BRACKET, re.any_number_of(re.WHITESPACE))
-    ),
-    _reference_re,
-    re.if_group(
-        'bracket',
-        re.group(
-            re.optional(
-                re.one_or_more(re.WHITESPACE),
-                _version_group(re.one_or_more(re.ALPHANUMERICS)),
-            ),
-            re.any_number_of(re.WHITESPACE),
-            re.RIGHT_BRACKET,
-        ),
-    ),
-    flags=re.IGNORECASE,
-)
-
-_bracketed_reference_with_version_re: Final = re.compile(
-    re.LEFT_BRACKET,
-    re.any_number_of(re.WHITESPACE),
-    _reference_with_version_re,
-    re.any_number_of(re.WHITESPACE),
-    re.RIGHT_BRACKET,
-    flags=re.IGNORECASE,
-)
+_reference_scanner: Final = ReferenceScanner.from_book_names(_book_map.keys())
 
 _search_reference_re: Final = re.compile(
     re.START, _reference_re, re.END, flags=re.IGNORECASE
@@ -283,6 +331,15 @@ class VerseRange:
     def paratext(self) -> str | None:
         return self.book.paratext
 
+    @property
+    def osis_range(self, /) -> str:
+        start = f'{self.osis}.{self.start.chapter}.{self.start.verse}'
+
+        if self.end is None:
+            return start
+
+        return f'{start}-{self.osis}.{self.end.chapter}.{self.end.verse}'
+
     @property
     def verses(self, /) -> str:
         verse = str(self.start)
@@ -296,19 +353,18 @@ class VerseRange:
         return verse
 
     def for_bible(self, bible: Bible, /) -> Self:
-        if bible.book_mapping is not None and self.osis in bible.book_mapping:
-            osis = bible.book_mapping[self.osis]
-            book = _osis_map.get(osis)
-
-            if book is None:
-                raise BookMappingInvalid(bible.name, self.book, osis)
+        book_table = bible.book_table
 
-            return evolve(self, book=book)
+        if book_table is None or (book := book_table[self.book]) is self.book:
+            return self
 
-        return self
+        return type(self)(book, self.start, self.end, self.version)
 
     def with_version(self, version: str | None, /) -> Self:
-        return evolve(self, version=version)
+        if version == self.version:
+            return self
+
+        return type(self)(self.book, self.start, self.end, version)
 
     @override
     def __str__(self, /) -> str:
@@ -348,48 +404,122 @@ class VerseRange:
     def from_match(cls, match: Match[str], /) -> Self:
         groups = match.groupdict()
 
-        chapter_start_int = int(groups['chapter_start'])
-        start = Verse(chapter_start_int, int(groups['verse_start']))
+        return cls.from_reference_match(
+            ReferenceMatch(
+                book=groups['book'],
+                chapter_start=groups['chapter_start'],
+                verse_start=groups['verse_start'],
+                chapter_end=groups['chapter_end'],
+                verse_end=groups['verse_end'],
+                version=groups.get('version'),
+                start=match.start(),
+                end=match.end(),
+            )
+        )
+
+    @classmethod
+    def from_reference_match(cls, match: ReferenceMatch, /) -> Self:
+        chapter_start_int = int(match.chapter_start)
+        start = Verse(chapter_start_int, int(match.verse_start))
 
         end: Verse | None = None
-        end_str = groups['verse_end']
 
-        if end_str is not None:
-            end_int = int(end_str)
+        if match.verse_end is not None:
+            end_int = int(match.verse_end)
             chapter_end_int = chapter_start_int
 
-            chapter_end_str = groups['chapter_end']
-            if chapter_end_str is not None:
-                chapter_end_int = int(chapter_end_str)
+            if match.chapter_end is not None:
+                chapter_end_int = int(match.chapter_end)
 
             end = Verse(chapter_end_int, end_int)
 
-        version: str | None = groups.get('version')
-
-        return cls.create(groups['book'], start, end, version)
+        return cls.create(match.book, start, end, match.version)
 
     @classmethod
     def get_all_from_string(
         cls, string: str, /, *, only_bracketed: bool = False
     ) -> list[VerseRange | Exception]:
-        ranges: list[VerseRange | Exception] = []
-        lookup_pattern: Pattern[str]
-
-        if only_bracketed:
-            lookup_pattern = _bracketed_reference_with_version_re
-        else:
-            lookup_pattern = _reference_or_bracketed_with_version_re
+        return [
+            result
+            for _, result in cls.parse_many([string], only_bracketed=only_bracketed)
+        ]
 
-        if (match := lookup_pattern.search(string)) is not None:
-            while match:
-                try:
-                    ranges.append(cls.from_match(match))
-                except Exception as exc:  # noqa: BLE001
-                    ranges.append(exc)
+    @overload
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        /,
+        *,
+        only_bracketed: bool = False,
+        compact: Literal[False] = False,
+    ) -> Iterator[tuple[int, VerseRange | Exception]]: ...
 
-                match = lookup_pattern.search(string, match.end())
+    @overload
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        /,
+        *,
+        only_bracketed: bool = False,
+        compact: Literal[True],
+    ) -> Iterator[CompactReference]: ...
 
-        return ranges
+    @classmethod
+    def parse_many(
+        cls,
+        strings: Iterable[str],
+        /,
+        *,
+        only_bracketed: bool = False,
+        compact: bool = False,
+    ) -> Iterator[tuple[int, VerseRange | Exception] | CompactReference]:
+        """Parse the references in each string, in order
+
+        Yields `(string index, range or exception)` pairs. With `compact=True`, yields
+        `CompactReference` tuples without creating any objects; the end chapter and
+        verse are 0 for a single verse, and references with an unknown book are
+        skipped.
+        """
+
+        for index, string in enumerate(strings):
+            if not could_contain_reference(string, only_bracketed=only_bracketed):
+                continue
+
+            for match in _reference_scanner.scan(string, only_bracketed=only_bracketed):
+                if not compact:
+                    try:
+                        yield index, cls.from_reference_match(match)
+                    except Exception as exc:  # noqa: BLE001
+                        yield index, exc
+
+                    continue
+
+                book_index = _book_name_indexes.get(match.book.lower())
+
+                if book_index is None:
+                    continue
+
+                chapter_start = int(match.chapter_start)
+                chapter_end = verse_end = 0
+
+                if match.verse_end is not None:
+                    verse_end = int(match.verse_end)
+                    chapter_end = (
+                        chapter_start
+                        if match.chapter_end is None
+                        else int(match.chapter_end)
+                    )
+
+                yield (
+                    index,
+                    book_index,
+                    chapter_start,
+                    int(match.verse_start),
+                    chapter_end,
+                    verse_end,
+                )
 
     @classmethod
     async def transform(cls, itx: discord.Interaction, value: str, /) -> Self:
@@ -1,20 +1,41 @@
 from __future__ import annotations
 
 from .base import Session
-from .bible import BibleVersion, DailyBread, GuildPref, UserPref
-from .confession import Confession, Section
+from .bible import (
+    BibleVersion,
+    BibleVersionRegistry,
+    DailyBread,
+    GuildPref,
+    PreferenceCache,
+    UserPref,
+    bible_versions,
+    preference_cache,
+)
+from .confession import Confession, Section, SectionPage, search_cache
 from .enums import ConfessionType, NumberingType
 from .misc import Notification
+from .passage import StoredPassage
+from .pool import MeteredPool, PoolMetrics, pool_metrics
 
 __all__ = (
     'BibleVersion',
+    'BibleVersionRegistry',
     'Confession',
     'ConfessionType',
     'DailyBread',
     'GuildPref',
+    'MeteredPool',
     'Notification',
     'NumberingType',
+    'PoolMetrics',
+    'PreferenceCache',
     'Section',
+    'SectionPage',
     'Session',
+    'StoredPassage',
     'UserPref',
+    'bible_versions',
+    'pool_metrics',
+    'preference_cache',
+    'search_cache',
 )
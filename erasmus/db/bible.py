@@ -1,23 +1,45 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from functools import cached_property
+from typing import TYPE_CHECKING, Final
 
 import pendulum
-from sqlalchemy import Computed, ForeignKey, Index, func, select, text
+from attrs import define, field
+from sqlalchemy import (
+    Computed,
+    ForeignKey,
+    Index,
+    String,
+    bindparam,
+    func,
+    select,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB, insert
-from sqlalchemy.orm import Mapped, declared_attr, foreign, mapped_column, relationship
-
-from ..data import SectionFlag
-from ..exceptions import InvalidVersionError
+from sqlalchemy.orm import (
+    Mapped,
+    declared_attr,
+    foreign,
+    mapped_column,
+    relationship,
+    validates,
+)
+
+from ..cache import LRUCache
+from ..data import BookTable, SectionFlag
+from ..exceptions import BookMappingInvalid, InvalidVersionError
 from .base import Base, Snowflake
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
 
     import discord
     from botus_receptus.types import Coroutine
     from sqlalchemy.ext.asyncio import AsyncSession
 
+_log: Final = logging.getLogger(__name__)
+
 
 class BibleVersion(Base):
     __tablename__ = 'bible_versions'
@@ -25,7 +47,7 @@ class BibleVersion(Base):
     id: Mapped[int] = mapped_column(primary_key=True, init=False)
     command: Mapped[str] = mapped_column(unique=True)
     name: Mapped[str] = mapped_column()
-    abbr: Mapped[str]
+    abbr: Mapped[str] = mapped_column()
     service: Mapped[str]
     service_version: Mapped[str]
     rtl: Mapped[bool | None]
@@ -50,8 +72,39 @@ class BibleVersion(Base):
             'bible_versions_sortable_name_order_idx',
             sortable_name.asc(),
         ),
+        # text_pattern_ops serves both equality and prefix LIKE in any collation
+        Index(
+            'bible_versions_lower_command_idx',
+            func.lower(command).label('lower_command'),
+            postgresql_ops={'lower_command': 'text_pattern_ops'},
+        ),
+        Index(
+            'bible_versions_lower_abbr_idx',
+            func.lower(abbr).label('lower_abbr'),
+            postgresql_ops={'lower_abbr': 'text_pattern_ops'},
+        ),
+        Index(
+            'bible_versions_lower_name_trgm_idx',
+            func.lower(name).label('lower_name'),
+            postgresql_using='gin',
+            postgresql_ops={'lower_name': 'gin_trgm_ops'},
+        ),
     )
 
+    @cached_property
+    def book_table(self) -> BookTable | None:
+        return BookTable.from_mapping(self.name, self.book_mapping)
+
+    @validates('book_mapping')
+    def _validate_book_mapping(
+        self, key: str, book_mapping: dict[str, str] | None
+    ) -> dict[str, str] | None:
+        # Raises BookMappingInvalid when an admin adds or updates a version rather
+        # than when the mapping is first used for a lookup
+        self.__dict__['book_table'] = BookTable.from_mapping(self.name, book_mapping)
+
+        return book_mapping
+
     async def set_for_user(
         self, session: AsyncSession, user: discord.User | discord.Member, /
     ) -> None:
@@ -86,7 +139,7 @@ class BibleVersion(Base):
         rtl: bool,
         book_mapping: dict[str, str] | None,
     ) -> BibleVersion:
-        return BibleVersion(
+        bible = BibleVersion(
             command=command,
             name=name,
             abbr=abbr,
@@ -94,8 +147,13 @@ class BibleVersion(Base):
             service_version=service_version,
             rtl=rtl,
             books=SectionFlag.from_book_names(books),
-            book_mapping=book_mapping,
+            book_mapping=None,
         )
+        # Assigned once the version is constructed so that the validator builds
+        # the book table with this version's name
+        bible.book_mapping = book_mapping
+
+        return bible
 
     @staticmethod
     async def get_all(
@@ -132,9 +190,7 @@ class BibleVersion(Base):
     @staticmethod
     async def get_by_command(session: AsyncSession, command: str, /) -> BibleVersion:
         bible: BibleVersion | None = (
-            await session.scalars(
-                select(BibleVersion).where(BibleVersion.command == command)
-            )
+            await session.scalars(_select_bible_by_command, {'command': command})
         ).first()
 
         if bible is None:
@@ -144,11 +200,7 @@ class BibleVersion(Base):
 
     @staticmethod
     async def get_by_abbr(session: AsyncSession, abbr: str, /) -> BibleVersion | None:
-        return (
-            await session.scalars(
-                select(BibleVersion).where(BibleVersion.command.ilike(abbr))
-            )
-        ).first()
+        return (await session.scalars(_select_bible_by_abbr, {'abbr': abbr})).first()
 
     @staticmethod
     async def get_for(
@@ -158,19 +210,167 @@ class BibleVersion(Base):
         user: discord.User | discord.Member | discord.Object | None = None,
         guild: discord.Guild | discord.Object | None = None,
     ) -> BibleVersion:
-        if user is not None:
-            user_pref = await session.get(UserPref, user.id)
+        user_bible_id, guild_bible_id = await preference_cache.get(
+            session,
+            user.id if user is not None else None,
+            guild.id if guild is not None else None,
+        )
+
+        return bible_versions.resolve(user_bible_id, guild_bible_id)
+
+
+_default_command: Final = 'esv'
+
+
+@define(eq=False)
+class BibleVersionRegistry:
+    """Every Bible version, kept in memory so that resolving a version does not
+    query the database
+
+    Versions are detached from their session and are rebuilt by `refresh()`
+    whenever a version is added, updated or deleted.
+    """
+
+    _versions: tuple[BibleVersion, ...] = field(init=False, default=())
+    _by_id: dict[int, BibleVersion] = field(init=False, factory=dict)
+    _by_command: dict[str, BibleVersion] = field(init=False, factory=dict)
+    _by_command_lower: dict[str, BibleVersion] = field(init=False, factory=dict)
+
+    def __iter__(self, /) -> Iterator[BibleVersion]:
+        return iter(self._versions)
+
+    def __len__(self, /) -> int:
+        return len(self._versions)
+
+    def get(self, bible_id: int | None, /) -> BibleVersion | None:
+        return self._by_id.get(bible_id) if bible_id is not None else None
+
+    def get_by_command(self, command: str, /) -> BibleVersion:
+        bible = self._by_command.get(command)
+
+        if bible is None:
+            raise InvalidVersionError(command)
+
+        return bible
+
+    def get_by_abbr(self, abbr: str, /) -> BibleVersion | None:
+        return self._by_command_lower.get(abbr.lower())
+
+    def resolve(self, /, *bible_ids: int | None) -> BibleVersion:
+        """Return the first of the given versions that exists, or the default"""
+
+        for bible_id in bible_ids:
+            if (bible := self.get(bible_id)) is not None:
+                return bible
+
+        return self.get_by_command(_default_command)
+
+    def set(self, versions: Iterable[BibleVersion], /) -> None:
+        self._versions = tuple(versions)
+
+        # Build the book tables of versions loaded from the database now rather
+        # than on their first lookup
+        for version in self._versions:
+            try:
+                _ = version.book_table
+            except BookMappingInvalid:
+                _log.exception(f'Invalid book mapping for {version.name}')
+
+        self._by_id = {version.id: version for version in self._versions}
+        self._by_command = {version.command: version for version in self._versions}
+        self._by_command_lower = {
+            version.command.lower(): version for version in reversed(self._versions)
+        }
+
+    def clear(self, /) -> None:
+        self.set(())
+
+    async def refresh(self, session: AsyncSession, /) -> None:
+        self.set(
+            [version async for version in BibleVersion.get_all(session, ordered=True)]
+        )
+
+
+bible_versions: Final = BibleVersionRegistry()
+
+
+_preference_cache_size: Final = 10000
 
-            if user_pref is not None and user_pref.bible_version is not None:
-                return user_pref.bible_version
 
-        if guild is not None:
-            guild_pref = await session.get(GuildPref, guild.id)
+def _preference_lru() -> LRUCache[int, int | None]:
+    return LRUCache[int, int | None](maxsize=_preference_cache_size)
 
-            if guild_pref is not None and guild_pref.bible_version is not None:
-                return guild_pref.bible_version
 
-        return await BibleVersion.get_by_command(session, 'esv')
+@define(eq=False)
+class PreferenceCache:
+    """The bible_id preferred by recently seen users and guilds
+
+    `None` records that a user or guild has no preference. Commands that change a
+    preference write the new value through with `set_user` or `set_guild` after
+    committing it. Each write bumps a generation so that a load that was already
+    running when it happened does not overwrite it with the old value.
+    """
+
+    users: LRUCache[int, int | None] = field(factory=_preference_lru)
+    guilds: LRUCache[int, int | None] = field(factory=_preference_lru)
+    _user_generation: int = field(init=False, default=0)
+    _guild_generation: int = field(init=False, default=0)
+
+    def set_user(self, user_id: int, bible_id: int | None, /) -> None:
+        self._user_generation += 1
+        self.users.set(user_id, bible_id)
+
+    def set_guild(self, guild_id: int, bible_id: int | None, /) -> None:
+        self._guild_generation += 1
+        self.guilds.set(guild_id, bible_id)
+
+    async def get(
+        self, session: AsyncSession, user_id: int | None, guild_id: int | None, /
+    ) -> tuple[int | None, int | None]:
+        load_user = user_id is not None and user_id not in self.users
+        load_guild = guild_id is not None and guild_id not in self.guilds
+        user_bible_id: int | None = None
+        guild_bible_id: int | None = None
+        user_generation = self._user_generation
+        guild_generation = self._guild_generation
+
+        if load_user or load_guild:
+            # Load every miss in a single round trip
+            user_bible_id, guild_bible_id = (
+                await session.execute(
+                    _select_preferences,
+                    {
+                        'user_id': user_id if load_user else None,
+                        'guild_id': guild_id if load_guild else None,
+                    },
+                )
+            ).one()
+
+        if user_id is not None:
+            if not load_user:
+                user_bible_id = self.users.get(user_id)
+            elif user_generation == self._user_generation:
+                self.users.set(user_id, user_bible_id)
+            else:
+                # A preference was written while loading, so the load may be stale
+                user_bible_id = self.users.get(user_id, user_bible_id)
+
+        if guild_id is not None:
+            if not load_guild:
+                guild_bible_id = self.guilds.get(guild_id)
+            elif guild_generation == self._guild_generation:
+                self.guilds.set(guild_id, guild_bible_id)
+            else:
+                guild_bible_id = self.guilds.get(guild_id, guild_bible_id)
+
+        return user_bible_id, guild_bible_id
+
+    def clear(self, /) -> None:
+        self.users.clear()
+        self.guilds.clear()
+
+
+preference_cache: Final = PreferenceCache()
 
 
 class _BibleVersionBase(Base):
@@ -237,9 +437,28 @@ class DailyBread(Base):
     async def scheduled(session: AsyncSession, /) -> Sequence[DailyBread]:
         return (
             await session.scalars(
-                select(DailyBread).where(
-                    DailyBread.next_scheduled
-                    <= pendulum.now(pendulum.UTC).set(second=0, microsecond=0)
-                )
+                _select_scheduled_daily_breads,
+                {'now': pendulum.now(pendulum.UTC).set(second=0, microsecond=0)},
             )
         ).fetchall()
+
+
+# Statements for frequent queries are built once so that SQLAlchemy reuses their
+# cache keys and asyncpg sees the same SQL and reuses its prepared statements
+_select_bible_by_command: Final = select(BibleVersion).where(
+    BibleVersion.command == bindparam('command')
+)
+_select_bible_by_abbr: Final = select(BibleVersion).where(
+    func.lower(BibleVersion.command) == func.lower(bindparam('abbr', type_=String))
+)
+_select_preferences: Final = select(
+    select(UserPref.bible_id)
+    .where(UserPref.user_id == bindparam('user_id'))
+    .scalar_subquery(),
+    select(GuildPref.bible_id)
+    .where(GuildPref.guild_id == bindparam('guild_id'))
+    .scalar_subquery(),
+)
+_select_scheduled_daily_breads: Final = select(DailyBread).where(
+    DailyBread.next_scheduled <= bindparam('now')
+)
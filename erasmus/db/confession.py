@@ -1,29 +1,39 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Final
 
+from attrs import frozen
 from sqlalchemy import (
     Computed,
     ForeignKey,
     Function,
     Index,
+    Integer,
     SQLColumnExpression,
+    String,
     Text as _sa_Text,
+    bindparam,
     cast,
     func,
     select,
     text as _sa_text,
+    tuple_,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 
+from ..cache import LRUCache
 from ..exceptions import InvalidConfessionError, NoSectionError
 from .base import Base, Text, TSVector
 from .enums import ConfessionType, NumberingType
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Callable, Iterator
 
+    from sqlalchemy import Select, Subquery, UnaryExpression
     from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.sql.selectable import ExecutableReturnsRows
+
+_search_cache_size: Final = 256
 
 
 def _remove_markdown_links(column: SQLColumnExpression[str]) -> Function[str]:
@@ -35,6 +45,56 @@ def _remove_markdown_links(column: SQLColumnExpression[str]) -> Function[str]:
     )
 
 
+def _headline(
+    column: SQLColumnExpression[str | None], options: str, /
+) -> Function[str]:
+    return func.ts_headline(
+        _sa_text("'english'"), column, _tsquery, _sa_text(f"'{options}'")
+    )
+
+
+def _normalize_terms(terms: str, /) -> str:
+    return ' '.join(terms.lower().split())
+
+
+def _by_number(sections: Subquery, /) -> tuple[UnaryExpression[Any], ...]:
+    return (sections.c.number.asc(), sections.c.subsection_number.asc().nulls_first())
+
+
+def _by_rank(sections: Subquery, /) -> tuple[UnaryExpression[Any], ...]:
+    return (
+        func.ts_rank_cd(sections.c.search_vector, _tsquery).desc(),
+        sections.c.id.asc(),
+    )
+
+
+# The subquery's order is not kept by the outer query, so `order_by` orders the
+# outer query the same way
+def _with_headlines(
+    stmt: Select[tuple[Section]],
+    order_by: Callable[[Subquery], tuple[UnaryExpression[Any], ...]],
+    /,
+) -> ExecutableReturnsRows:
+    sections = stmt.subquery()
+
+    return select(Section).from_statement(
+        select(
+            sections.c.id,
+            sections.c.confession_id,
+            sections.c.number,
+            sections.c.subsection_number,
+            sections.c.text,
+            _headline(
+                sections.c.title, 'HighlightAll=true, StartSel=*, StopSel=*'
+            ).label('title'),
+            _headline(sections.c.text_stripped, 'StartSel=**, StopSel=**').label(
+                'text_stripped'
+            ),
+            sections.c.search_vector,
+        ).order_by(*order_by(sections))
+    )
+
+
 class Section(Base):
     __tablename__ = 'confession_sections'
 
@@ -74,6 +134,49 @@ class Section(Base):
         ),
     )
 
+    @staticmethod
+    async def search_ranked(
+        session: AsyncSession,
+        terms: str,
+        /,
+        *,
+        limit: int,
+        offset: int = 0,
+        confession_id: int | None = None,
+    ) -> SectionPage:
+        terms = _normalize_terms(terms)
+        key = (confession_id, terms, 'ranked', offset, limit)
+        page = search_cache.get(key)
+
+        if page is None:
+            params: dict[str, Any] = {'terms': terms}
+
+            if confession_id is None:
+                count_stmt = _count_matches
+                stmt = _search_ranked
+            else:
+                count_stmt = _count_search
+                stmt = _search_ranked_in_confession
+                params['confession_id'] = confession_id
+
+            total = await session.scalar(count_stmt, params)
+            result = await session.scalars(
+                stmt, params | {'limit': limit, 'offset': offset}
+            )
+            page = SectionPage(list(result), total or 0)
+            search_cache.set(key, page)
+
+        return page
+
+
+@frozen
+class SectionPage:
+    sections: list[Section]
+    total: int
+
+    def __iter__(self, /) -> Iterator[Section]:
+        yield from self.sections
+
 
 class Confession(Base):
     __tablename__ = 'confessions'
@@ -111,42 +214,50 @@ class Confession(Base):
     def subsection_numbering(self) -> NumberingType:
         return self._subsection_numbering or self.numbering
 
-    async def search(self, session: AsyncSession, terms: str, /) -> list[Section]:
-        tsquery = func.plainto_tsquery(_sa_text("'english'"), terms)
-        section_query = (
-            select(Section)
-            .where(Section.confession_id == self.id)
-            .where(Section.search_vector.bool_op('@@')(tsquery))
-            .order_by(
-                Section.number.asc(), Section.subsection_number.asc().nulls_first()
-            )
-            .subquery()
-        )
-
-        headline_query = select(
-            section_query.c.id,
-            section_query.c.confession_id,
-            section_query.c.number,
-            section_query.c.subsection_number,
-            section_query.c.text,
-            func.ts_headline(
-                _sa_text("'english'"),
-                section_query.c.title,
-                tsquery,
-                _sa_text("'HighlightAll=true, StartSel=*, StopSel=*'"),
-            ).label('title'),
-            func.ts_headline(
-                _sa_text("'english'"),
-                section_query.c.text_stripped,
-                tsquery,
-                _sa_text("'StartSel=**, StopSel=**'"),
-            ).label('text_stripped'),
-            section_query.c.search_vector,
-        )
+    async def search_page(
+        self,
+        session: AsyncSession,
+        terms: str,
+        /,
+        *,
+        limit: int,
+        offset: int = 0,
+        after: Section | None = None,
+    ) -> SectionPage:
+        """Search for one page of sections with headlines
+
+        If given, `after` must be the section just before `offset`. The page is then
+        found with a keyset condition instead of by skipping `offset` rows.
+        """
+
+        terms = _normalize_terms(terms)
+        key = (self.id, terms, 'headlines', offset, limit)
+        page = search_cache.get(key)
+
+        if page is None:
+            params: dict[str, Any] = {'confession_id': self.id, 'terms': terms}
+            total = await session.scalar(_count_search, params)
+
+            if after is None:
+                stmt = _search_page
+                params |= {'limit': limit, 'offset': offset}
+            else:
+                stmt = _search_page_after
+                params |= {
+                    'limit': limit,
+                    'after_number': after.number,
+                    'after_subsection_number': (
+                        -1
+                        if after.subsection_number is None
+                        else after.subsection_number
+                    ),
+                }
 
-        result = await session.scalars(select(Section).from_statement(headline_query))
+            result = await session.scalars(stmt, params)
+            page = SectionPage(list(result), total or 0)
+            search_cache.set(key, page)
 
-        return list(result)
+        return page
 
     async def get_section(
         self,
@@ -155,16 +266,18 @@ class Confession(Base):
         subsection_number: int | None = None,
         /,
     ) -> Section:
-        stmt = (
-            select(Section)
-            .where(Section.confession_id == self.id)
-            .where(Section.number == number)
-        )
-
-        if subsection_number is not None:
-            stmt = stmt.where(Section.subsection_number == subsection_number)
+        if subsection_number is None:
+            stmt = _select_section
+            params = {'confession_id': self.id, 'number': number}
+        else:
+            stmt = _select_subsection
+            params = {
+                'confession_id': self.id,
+                'number': number,
+                'subsection_number': subsection_number,
+            }
 
-        result: Section | None = (await session.scalars(stmt.limit(1))).first()
+        result: Section | None = (await session.scalars(stmt, params)).first()
 
         if result is None:
             formatted_number = f'{number}'
@@ -203,14 +316,96 @@ class Confession(Base):
     async def get_by_command(
         session: AsyncSession, command: str, /, *, load_sections: bool = False
     ) -> Confession:
-        stmt = select(Confession).where(Confession.command == command.lower())
-
-        if load_sections:
-            stmt = stmt.options(selectinload(Confession.sections))
-
-        c: Confession | None = (await session.scalars(stmt.limit(1))).first()
+        stmt = (
+            _select_confession_with_sections_by_command
+            if load_sections
+            else _select_confession_by_command
+        )
+        c: Confession | None = (
+            await session.scalars(stmt, {'command': command.lower()})
+        ).first()
 
         if c is None:
             raise InvalidConfessionError(command)
 
         return c
+
+
+# Keyed by confession id (None for all confessions), normalized terms, kind of
+# search, offset and limit
+search_cache: Final = LRUCache[
+    tuple[int | None, str, str, int, int | None], SectionPage
+](maxsize=_search_cache_size)
+
+# Statements for frequent queries are built once so that SQLAlchemy reuses their
+# cache keys and asyncpg sees the same SQL and reuses its prepared statements
+_select_section: Final = (
+    select(Section)
+    .where(Section.confession_id == bindparam('confession_id'))
+    .where(Section.number == bindparam('number'))
+    .limit(1)
+)
+_select_subsection: Final = (
+    select(Section)
+    .where(Section.confession_id == bindparam('confession_id'))
+    .where(Section.number == bindparam('number'))
+    .where(Section.subsection_number == bindparam('subsection_number'))
+    .limit(1)
+)
+_select_confession_by_command: Final = (
+    select(Confession).where(Confession.command == bindparam('command')).limit(1)
+)
+_select_confession_with_sections_by_command: Final = (
+    _select_confession_by_command.options(selectinload(Confession.sections))
+)
+
+_tsquery: Final = func.plainto_tsquery(
+    _sa_text("'english'"), bindparam('terms', type_=String)
+)
+_search_sections: Final = (
+    select(Section)
+    .where(Section.confession_id == bindparam('confession_id'))
+    .where(Section.search_vector.bool_op('@@')(_tsquery))
+    .order_by(Section.number.asc(), Section.subsection_number.asc().nulls_first())
+)
+_search_page: Final = _with_headlines(
+    _search_sections.limit(bindparam('limit', type_=Integer)).offset(
+        bindparam('offset', type_=Integer)
+    ),
+    _by_number,
+)
+# Sections without a subsection number sort first, so they are keyed as -1
+_search_page_after: Final = _with_headlines(
+    _search_sections.where(
+        tuple_(Section.number, func.coalesce(Section.subsection_number, -1))
+        > tuple_(
+            bindparam('after_number', type_=Integer),
+            bindparam('after_subsection_number', type_=Integer),
+        )
+    ).limit(bindparam('limit', type_=Integer)),
+    _by_number,
+)
+_count_matches: Final = (
+    select(func.count())
+    .select_from(Section)
+    .where(Section.search_vector.bool_op('@@')(_tsquery))
+)
+_count_search: Final = (
+    select(func.count())
+    .select_from(Section)
+    .where(Section.confession_id == bindparam('confession_id'))
+    .where(Section.search_vector.bool_op('@@')(_tsquery))
+)
+# ORDER BY ... LIMIT lets PostgreSQL keep only the top ranked rows while sorting
+_ranked_sections: Final = (
+    select(Section)
+    .where(Section.search_vector.bool_op('@@')(_tsquery))
+    .order_by(func.ts_rank_cd(Section.search_vector, _tsquery).desc(), Section.id.asc())
+    .limit(bindparam('limit', type_=Integer))
+    .offset(bindparam('offset', type_=Integer))
+)
+_search_ranked: Final = _with_headlines(_ranked_sections, _by_rank)
+_search_ranked_in_confession: Final = _with_headlines(
+    _ranked_sections.where(Section.confession_id == bindparam('confession_id')),
+    _by_rank,
+)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final
+
+import pendulum
+from sqlalchemy import ForeignKey, Index, bindparam, delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, Text
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class StoredPassage(Base):
+    __tablename__ = 'passages'
+
+    bible_id: Mapped[int] = mapped_column(
+        ForeignKey('bible_versions.id', ondelete='CASCADE'), primary_key=True
+    )
+    osis: Mapped[Text] = mapped_column(primary_key=True)
+    text: Mapped[Text] = mapped_column()
+    expires_at: Mapped[pendulum.DateTime] = mapped_column()
+
+    __table_args__ = (Index('passages_expires_at_idx', expires_at.asc()),)
+
+    @staticmethod
+    async def get(
+        session: AsyncSession, bible_id: int, osis: str, /
+    ) -> StoredPassage | None:
+        return (
+            await session.scalars(
+                _select_stored_passage,
+                {'bible_id': bible_id, 'osis': osis, 'now': pendulum.now(pendulum.UTC)},
+            )
+        ).first()
+
+    @staticmethod
+    async def put(
+        session: AsyncSession,
+        bible_id: int,
+        osis: str,
+        text: str,
+        expires_at: pendulum.DateTime,
+        /,
+    ) -> None:
+        await session.execute(
+            insert(StoredPassage)
+            .values(bible_id=bible_id, osis=osis, text=text, expires_at=expires_at)
+            .on_conflict_do_update(
+                index_elements=['bible_id', 'osis'],
+                set_={'text': text, 'expires_at': expires_at},
+            )
+        )
+
+    @staticmethod
+    async def delete_for_bible(session: AsyncSession, bible_id: int, /) -> None:
+        await session.execute(
+            delete(StoredPassage).where(StoredPassage.bible_id == bible_id)
+        )
+
+    @staticmethod
+    async def delete_expired(session: AsyncSession, /) -> None:
+        await session.execute(
+            delete(StoredPassage).where(
+                StoredPassage.expires_at <= pendulum.now(pendulum.UTC)
+            )
+        )
+
+
+# Built once so that SQLAlchemy reuses its cache key and asyncpg its prepared
+# statement
+_select_stored_passage: Final = (
+    select(StoredPassage)
+    .where(StoredPassage.bible_id == bindparam('bible_id'))
+    .where(StoredPassage.osis == bindparam('osis'))
+    .where(StoredPassage.expires_at > bindparam('now'))
+)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from time import perf_counter
+from typing import TYPE_CHECKING, Final, override
+
+from attrs import define, field
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+if TYPE_CHECKING:
+    from sqlalchemy.pool import Pool, PoolProxiedConnection
+
+# Upper bounds, in seconds, of the checkout wait time histogram buckets
+_wait_buckets: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+
+def _format_seconds(seconds: float, /) -> str:
+    return f'{seconds * 1000:g}ms' if seconds < 1 else f'{seconds:g}s'
+
+
+@define(eq=False)
+class PoolMetrics:
+    checkouts: int = 0
+    overflow_checkouts: int = 0
+    timeouts: int = 0
+    max_wait: float = 0.0
+    wait_counts: list[int] = field(factory=lambda: [0] * (len(_wait_buckets) + 1))
+
+    def record_checkout(self, wait: float, /, *, overflow: bool) -> None:
+        self.checkouts += 1
+        self.max_wait = max(self.max_wait, wait)
+        self.wait_counts[bisect_left(_wait_buckets, wait)] += 1
+
+        if overflow:
+            self.overflow_checkouts += 1
+
+    def record_timeout(self, /) -> None:
+        self.timeouts += 1
+
+    def histogram(self, /) -> list[tuple[str, int]]:
+        return [
+            (f'<= {_format_seconds(bound)}', count)
+            for bound, count in zip(_wait_buckets, self.wait_counts, strict=False)
+        ] + [(f'> {_format_seconds(_wait_buckets[-1])}', self.wait_counts[-1])]
+
+    def report(self, pool: Pool | None = None, /) -> str:
+        lines: list[str] = []
+
+        if isinstance(pool, QueuePool):
+            lines.append(
+                f'Pool size: {pool.size()}, checked out: {pool.checkedout()}, '
+                f'checked in: {pool.checkedin()}, overflow: {max(pool.overflow(), 0)}'
+            )
+
+        lines.append(
+            f'Checkouts: {self.checkouts}, using overflow: '
+            f'{self.overflow_checkouts}, timeouts: {self.timeouts}, '
+            f'max wait: {self.max_wait * 1000:.1f}ms'
+        )
+        lines.extend(f'{label:>9}: {count}' for label, count in self.histogram())
+
+        return '\n'.join(lines)
+
+    def reset(self, /) -> None:
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.max_wait = 0.0
+        self.wait_counts = [0] * len(self.wait_counts)
+
+
+pool_metrics: Final = PoolMetrics()
+
+
+class MeteredPool(AsyncAdaptedQueuePool):
+    """An `AsyncAdaptedQueuePool` that records checkouts in `pool_metrics`
+
+    The recorded wait includes waiting for a free connection, opening new
+    connections and any pre-ping. A checkout uses overflow when it leaves more
+    connections checked out than the pool's size.
+    """
+
+    @override
+    def connect(self) -> PoolProxiedConnection:
+        start = perf_counter()
+
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.record_timeout()
+            raise
+
+        pool_metrics.record_checkout(
+            perf_counter() - start, overflow=self.checkedout() > self.size()
+        )
+
+        return connection
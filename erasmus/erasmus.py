@@ -15,7 +15,7 @@ from discord import app_commands
 from discord.ext import commands
 
 from . import json
-from .db import Session
+from .db import MeteredPool, Session
 from .exceptions import ErasmusError
 from .l10n import Localizer
 from .translator import Translator
@@ -28,6 +28,12 @@ _log: Final = logging.getLogger(__name__)
 _extensions: Final = ('admin', 'bible', 'confession', 'creeds', 'misc')
 _version: Final = metadata.version('erasmus')
 
+# SQLAlchemy's and asyncpg's defaults
+_default_pool_size: Final = 5
+_default_max_overflow: Final = 10
+_default_pool_timeout: Final = 30.0
+_default_statement_cache_size: Final = 100
+
 
 class Erasmus(sa.AutoShardedBot, topgg.AutoShardedBot):
     config: Config  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -43,8 +49,16 @@ class Erasmus(sa.AutoShardedBot, topgg.AutoShardedBot):
             engine_kwargs={
                 'json_serializer': json.serialize,
                 'json_deserializer': json.deserialize,
+                'poolclass': MeteredPool,
+                'pool_size': config.get('db_pool_size', _default_pool_size),
+                'max_overflow': config.get('db_max_overflow', _default_max_overflow),
+                'pool_timeout': config.get('db_pool_timeout', _default_pool_timeout),
+                'pool_pre_ping': config.get('db_pool_pre_ping', False),
                 'connect_args': {
                     'server_settings': {'timezone': 'utc'},
+                    'prepared_statement_cache_size': config.get(
+                        'db_statement_cache_size', _default_statement_cache_size
+                    ),
                 },
             },
             help_command=None,
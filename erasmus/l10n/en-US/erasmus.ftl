@@ -205,10 +205,13 @@ confess__cite = cite
 confess__search = search
     .description = Search for terms in a confession or catechism
     .PARAM--source--name = source
-    .PARAM--source--description = The confession or catechism to search within
+    .PARAM--source--description = The confession or catechism to search within (all of them if omitted)
     .PARAM--terms--name = terms
     .PARAM--terms--description = Terms to search for
+    .PARAM--ranked--name = ranked
+    .PARAM--ranked--description = Order results by relevance instead of by section
     .title = Results from { $confession_name }
+    .title-all = Results from all confessions and catechisms
     .terms = Search terms: _{ $terms }_
     .no-results = I found 0 results for _{ $terms }_
     .footer = Page { $current_page }/{ $max_pages } ({ $total } entries)
@@ -192,7 +192,7 @@ class AsyncPageSource[T](PageSourceBase[Sequence[T]], ABC):
         if len(items) == self._total:
             for page in range(self._max_pages):
                 page_start = page * self.per_page
-                self._cache[page] = items[page_start : page_start * self.per_page]
+                self._cache[page] = items[page_start : page_start + self.per_page]
         else:
             self._cache[0] = items
 
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Final
+
+import pendulum
+from attrs import field, frozen
+
+from .db import Session, StoredPassage
+
+if TYPE_CHECKING:
+    from .data import VerseRange
+    from .types import Bible
+
+_log: Final = logging.getLogger(__name__)
+
+
+@frozen
+class PassageStore:
+    ttl: float
+    _pending: set[asyncio.Task[None]] = field(
+        init=False, factory=set[asyncio.Task[None]]
+    )
+
+    async def get(self, bible: Bible, verses: VerseRange, /) -> str | None:
+        try:
+            async with Session() as session:
+                stored = await StoredPassage.get(session, bible.id, verses.osis_range)
+        except Exception:  # noqa: BLE001
+            _log.exception(f'Error reading stored passage {verses} ({bible.abbr})')
+            return None
+
+        return None if stored is None else stored.text
+
+    async def __write(self, bible_id: int, osis: str, text: str, /) -> None:
+        expires_at = pendulum.now(pendulum.UTC).add(seconds=int(self.ttl))
+
+        try:
+            async with Session.begin() as session:
+                await StoredPassage.put(session, bible_id, osis, text, expires_at)
+        except Exception:  # noqa: BLE001
+            _log.exception(f'Error storing passage {osis} ({bible_id})')
+
+    def put(self, bible: Bible, verses: VerseRange, text: str, /) -> None:
+        task = asyncio.create_task(self.__write(bible.id, verses.osis_range, text))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def purge_expired(self, /) -> None:
+        async with Session.begin() as session:
+            await StoredPassage.delete_expired(session)
+
+    async def close(self, /) -> None:
+        if self._pending:
+            await asyncio.gather(*self._pending)
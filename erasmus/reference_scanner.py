@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Final, Self
+
+from attrs import frozen
+from botus_receptus import re
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Characters besides the upper case form that a lower case letter matches when
+# matching with re.IGNORECASE
+_case_equivalents: Final = {'i': '\u0130\u0131', 'k': '\u212a', 's': '\u017f'}
+_dashes: Final = frozenset('-\u2013\u2014')
+_version_re: Final = re.compile(re.one_or_more(re.ALPHANUMERICS), flags=re.IGNORECASE)
+_chapter_verse_re: Final = re.compile(
+    re.DIGIT,
+    re.any_number_of(re.WHITESPACE),
+    ':',
+    re.any_number_of(re.WHITESPACE),
+    re.DIGIT,
+)
+
+# A trie node maps characters to child nodes; the empty string marks a terminal
+type _Node = dict[str, _Node]
+
+
+def _skip_whitespace(string: str, index: int, /) -> int:
+    length = len(string)
+
+    while index < length and string[index].isspace():
+        index += 1
+
+    return index
+
+
+def _skip_whitespace_back(string: str, index: int, stop: int, /) -> int:
+    while index > stop and string[index - 1].isspace():
+        index -= 1
+
+    return index
+
+
+def _skip_digits(string: str, index: int, /) -> int:
+    length = len(string)
+
+    while index < length and string[index].isdecimal():
+        index += 1
+
+    return index
+
+
+def _skip_digits_back(string: str, index: int, stop: int, /) -> int:
+    while index > stop and string[index - 1].isdecimal():
+        index -= 1
+
+    return index
+
+
+def _char_at(string: str, index: int, /) -> str:
+    return string[index] if index < len(string) else ''
+
+
+def _read_range(string: str, index: int, /) -> tuple[str | None, str | None, int]:
+    dash = _skip_whitespace(string, index)
+
+    if _char_at(string, dash) not in _dashes:
+        return None, None, index
+
+    start = _skip_whitespace(string, dash + 1)
+    end = _skip_digits(string, start)
+
+    if end == start:
+        return None, None, index
+
+    colon = _skip_whitespace(string, end)
+
+    if _char_at(string, colon) == ':':
+        verse_start = _skip_whitespace(string, colon + 1)
+        verse_end = _skip_digits(string, verse_start)
+
+        if verse_end > verse_start:
+            return string[start:end], string[verse_start:verse_end], verse_end
+
+    return None, string[start:end], end
+
+
+def could_contain_reference(string: str, /, *, only_bracketed: bool = False) -> bool:
+    """Cheaply check whether a string could contain a reference
+
+    Every reference has a `chapter:verse` and bracketed references have both
+    brackets, so a `False` result means `ReferenceScanner.scan()` finds nothing.
+    """
+
+    if only_bracketed and ('[' not in string or ']' not in string):
+        return False
+
+    return ':' in string and _chapter_verse_re.search(string) is not None
+
+
+@frozen
+class ReferenceMatch:
+    book: str
+    chapter_start: str
+    verse_start: str
+    chapter_end: str | None
+    verse_end: str | None
+    version: str | None
+    start: int
+    end: int
+
+
+@frozen(eq=False)
+class ReferenceScanner:
+    """Finds Bible references in text
+
+    Produces the same matches as searching with the reference regular expressions
+    in `erasmus.data`, but only does any work around a colon. From each colon the
+    scanner reads the chapter backwards and looks the book name up in a trie of
+    reversed book names, then reads the verses, range and version forwards.
+    """
+
+    _books: _Node
+
+    def __book_start(self, string: str, end: int, stop: int, /) -> int:
+        node = self._books
+        index = end
+        start = -1
+
+        while index > stop and (child := node.get(string[index - 1])) is not None:
+            node = child
+            index -= 1
+
+            if '' in node:
+                start = index
+
+        return start
+
+    def __find_book(
+        self, string: str, chapter_start: int, position: int, /
+    ) -> tuple[int, int] | None:
+        book_end = _skip_whitespace_back(string, chapter_start, position)
+
+        if book_end == chapter_start:
+            return None
+
+        book_start = self.__book_start(string, book_end, position)
+
+        if book_end - 1 > position and string[book_end - 1] == '.':
+            dotted_start = self.__book_start(string, book_end - 1, position)
+
+            if dotted_start != -1 and (book_start == -1 or dotted_start < book_start):
+                return dotted_start, book_end - 1
+
+        if book_start == -1:
+            return None
+
+        return book_start, book_end
+
+    def __bracket_end(
+        self, string: str, index: int, /, *, only_bracketed: bool
+    ) -> tuple[int, str | None] | None:
+        version_start = _skip_whitespace(string, index)
+
+        if (only_bracketed or version_start > index) and (
+            version := _version_re.match(string, version_start)
+        ) is not None:
+            end = _skip_whitespace(string, version.end())
+
+            if _char_at(string, end) == ']':
+                return end + 1, version[0]
+
+        end = _skip_whitespace(string, index)
+
+        if _char_at(string, end) == ']':
+            return end + 1, None
+
+        return None
+
+    def __match_at(
+        self, string: str, colon: int, position: int, /, *, only_bracketed: bool
+    ) -> ReferenceMatch | None:
+        verse_start = _skip_whitespace(string, colon + 1)
+        verse_end = _skip_digits(string, verse_start)
+
+        if verse_end == verse_start:
+            return None
+
+        chapter_end = _skip_whitespace_back(string, colon, position)
+        chapter_start = _skip_digits_back(string, chapter_end, position)
+
+        if chapter_start == chapter_end:
+            return None
+
+        if (book := self.__find_book(string, chapter_start, position)) is None:
+            return None
+
+        book_start, book_end = book
+        range_chapter, range_verse, end = _read_range(string, verse_end)
+        start = book_start
+        version: str | None = None
+        bracket = _skip_whitespace_back(string, book_start, position)
+
+        if bracket > position and string[bracket - 1] == '[':
+            bracket_end = self.__bracket_end(string, end, only_bracketed=only_bracketed)
+
+            if bracket_end is not None:
+                start = bracket - 1
+                end, version = bracket_end
+            elif only_bracketed:
+                return None
+        elif only_bracketed:
+            return None
+
+        return ReferenceMatch(
+            book=string[book_start:book_end],
+            chapter_start=string[chapter_start:chapter_end],
+            verse_start=string[verse_start:verse_end],
+            chapter_end=range_chapter,
+            verse_end=range_verse,
+            version=version,
+            start=start,
+            end=end,
+        )
+
+    def scan(
+        self, string: str, /, *, only_bracketed: bool = False
+    ) -> Iterator[ReferenceMatch]:
+        position = 0
+        colon = string.find(':')
+
+        while colon != -1:
+            match = self.__match_at(
+                string, colon, position, only_bracketed=only_bracketed
+            )
+
+            if match is None:
+                colon = string.find(':', colon + 1)
+            else:
+                yield match
+
+                position = match.end
+                colon = string.find(':', position)
+
+    @classmethod
+    def from_book_names(cls, book_names: Iterable[str], /) -> Self:
+        root: _Node = {}
+
+        for book_name in book_names:
+            node = root
+
+            for char in reversed(book_name.lower()):
+                child = node.get(char)
+
+                if child is None:
+                    child = {}
+
+                    for variant in {
+                        char,
+                        char.upper(),
+                        *_case_equivalents.get(char, ''),
+                    }:
+                        node[variant] = child
+
+                node = child
+
+            node[''] = {}
+
+        return cls(root)
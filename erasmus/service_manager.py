@@ -4,25 +4,42 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any, Final, TypeIs, cast
 
-from attrs import field, frozen
+from attrs import define, field, frozen
 
 from . import services
+from .cache import LRUCache
+from .data import Passage
 from .exceptions import (
     ServiceLookupTimeout,
     ServiceNotSupportedError,
     ServiceSearchTimeout,
 )
+from .passage_store import PassageStore
+from .services.parse_executor import ParseExecutor
+from .types import Closable
 
 if TYPE_CHECKING:
     import aiohttp
 
     from .config import Config
-    from .data import Passage, SearchResults, VerseRange
+    from .data import SearchResults, VerseRange
     from .services.base_service import BaseService
     from .types import Bible, Service
 
 _log: Final = logging.getLogger(__name__)
 
+_default_passage_cache_size: Final = 1024
+_default_passage_cache_ttl: Final = 3600.0
+_default_passage_store_ttl: Final = 30 * 24 * 60 * 60.0
+
+type PassageCacheKey = tuple[int, VerseRange]
+
+
+@define(eq=False)
+class _InflightLookup:
+    task: asyncio.Task[Passage]
+    waiters: int = 0
+
 
 def _is_service_cls(obj: object, /) -> TypeIs[type[BaseService]]:
     return hasattr(obj, 'from_config') and callable(cast('Any', obj).from_config)
@@ -32,6 +49,18 @@ def _is_service_cls(obj: object, /) -> TypeIs[type[BaseService]]:
 class ServiceManager:
     service_map: dict[str, Service] = field(factory=dict[str, 'Service'])
     timeout: float = 10
+    passage_cache: LRUCache[PassageCacheKey, Passage] = field(
+        factory=lambda: LRUCache[PassageCacheKey, 'Passage'](
+            maxsize=_default_passage_cache_size, ttl=_default_passage_cache_ttl
+        )
+    )
+    passage_store: PassageStore | None = None
+    # Services whose passages are never read from or written to the passage store
+    unstored_services: frozenset[str] = frozenset()
+    parse_executor: ParseExecutor = field(factory=ParseExecutor)
+    _inflight: dict[PassageCacheKey, _InflightLookup] = field(
+        init=False, factory=dict[PassageCacheKey, _InflightLookup]
+    )
 
     def __contains__(self, key: str, /) -> bool:
         return key in self.service_map
@@ -39,20 +68,93 @@ class ServiceManager:
     def __len__(self, /) -> int:
         return len(self.service_map)
 
+    async def __fetch_passage(
+        self,
+        service: Service,
+        bible: Bible,
+        verses: VerseRange,
+        key: PassageCacheKey,
+        /,
+    ) -> Passage:
+        passage_store = (
+            None if bible.service in self.unstored_services else self.passage_store
+        )
+
+        if (
+            passage_store is not None
+            and (text := await passage_store.get(bible, verses)) is not None
+        ):
+            _log.debug(f'Passage store hit for {verses} ({bible.abbr})')
+            passage = Passage(text=text, range=verses, version=bible.abbr)
+            self.passage_cache.set(key, passage)
+            return passage
+
+        _log.debug(f'Getting passage {verses} ({bible.abbr})')
+        passage = await service.get_passage(bible, verses)
+        _log.debug(f'Got passage {passage.citation}')
+
+        self.passage_cache.set(key, passage)
+
+        if passage_store is not None:
+            passage_store.put(bible, verses, passage.text)
+
+        return passage
+
+    def __join_lookup(
+        self,
+        service: Service,
+        bible: Bible,
+        verses: VerseRange,
+        key: PassageCacheKey,
+        /,
+    ) -> _InflightLookup:
+        lookup = self._inflight.get(key)
+
+        if lookup is None:
+            lookup = _InflightLookup(
+                asyncio.create_task(self.__fetch_passage(service, bible, verses, key))
+            )
+            self._inflight[key] = lookup
+            lookup.task.add_done_callback(lambda _: self.__leave_lookup(key, lookup))
+
+        lookup.waiters += 1
+
+        return lookup
+
+    def __leave_lookup(self, key: PassageCacheKey, lookup: _InflightLookup, /) -> None:
+        if self._inflight.get(key) is lookup:
+            del self._inflight[key]
+
     async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage:
         service = self.service_map.get(bible.service)
 
         if service is None:
             raise ServiceNotSupportedError(bible)
 
+        # The version has already been resolved to `bible`, so it is not part of
+        # the key
+        key = (bible.id, verses.with_version(None))
+
+        if (passage := self.passage_cache.get(key)) is not None:
+            _log.debug(f'Passage cache hit for {verses} ({bible.abbr})')
+            return passage
+
+        # Concurrent lookups of the same passage share one upstream request. Each
+        # caller waits on it with its own timeout, and the request is only
+        # cancelled once every caller has given up on it.
+        lookup = self.__join_lookup(service, bible, verses, key)
+
         try:
-            _log.debug(f'Getting passage {verses} ({bible.abbr})')
             async with asyncio.timeout(self.timeout):
-                passage = await service.get_passage(bible, verses)
-                _log.debug(f'Got passage {passage.citation}')
-                return passage
+                return await asyncio.shield(lookup.task)
         except TimeoutError as e:
             raise ServiceLookupTimeout(bible, verses) from e
+        finally:
+            lookup.waiters -= 1
+
+            if lookup.waiters == 0 and not lookup.task.done():
+                self.__leave_lookup(key, lookup)
+                lookup.task.cancel()
 
     async def search(
         self, bible: Bible, terms: list[str], /, *, limit: int = 20, offset: int = 0
@@ -68,16 +170,52 @@ class ServiceManager:
         except TimeoutError as e:
             raise ServiceSearchTimeout(bible, terms) from e
 
+    async def close(self, /) -> None:
+        for service in self.service_map.values():
+            if isinstance(service, Closable):
+                await service.close()
+
+        if self.passage_store is not None:
+            await self.passage_store.close()
+
+        self.parse_executor.shutdown()
+
     @classmethod
     def from_config(
         cls, config: Config, session: aiohttp.ClientSession, /
     ) -> ServiceManager:
         service_configs = config.get('services', {})
+        parse_executor = ParseExecutor.from_config(config)
+        passage_store: PassageStore | None = None
+        service_classes = {
+            name: service_cls
+            for name, service_cls in services.__dict__.items()
+            if _is_service_cls(service_cls)
+        }
+
+        if config.get('passage_store', True):
+            passage_store = PassageStore(
+                ttl=config.get('passage_store_ttl', _default_passage_store_ttl)
+            )
 
         return cls(
             {
-                name: service_cls.from_config(service_configs.get(name), session)
-                for name, service_cls in services.__dict__.items()
-                if _is_service_cls(service_cls)
-            }
+                name: service_cls.from_config(
+                    service_configs.get(name), session, parse_executor=parse_executor
+                )
+                for name, service_cls in service_classes.items()
+            },
+            passage_cache=LRUCache(
+                maxsize=config.get('passage_cache_size', _default_passage_cache_size),
+                ttl=config.get('passage_cache_ttl', _default_passage_cache_ttl),
+            ),
+            passage_store=passage_store,
+            unstored_services=frozenset(
+                name
+                for name, service_cls in service_classes.items()
+                if not service_configs.get(name, {}).get(
+                    'passage_store', service_cls.store_passages
+                )
+            ),
+            parse_executor=parse_executor,
         )
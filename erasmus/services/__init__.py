@@ -2,5 +2,6 @@ from __future__ import annotations
 
 from .apibible import ApiBible
 from .biblegateway import BibleGateway
+from .localbible import LocalBible
 
-__all__ = ('ApiBible', 'BibleGateway')
+__all__ = ('ApiBible', 'BibleGateway', 'LocalBible')
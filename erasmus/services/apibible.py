@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import asyncio
-import contextlib
 from typing import TYPE_CHECKING, Final, Literal, Self, TypedDict, override
 
 import orjson
-from attrs import field, frozen
+from attrs import Factory, field, frozen
 from botus_receptus import re
 from yarl import URL
 
@@ -13,12 +11,17 @@ from ..data import Passage, SearchResults, VerseRange
 from ..exceptions import BookNotInVersionError, DoNotUnderstandError
 from ..json import get
 from .base_service import BaseService
+from .fums import FumsReporter
+from .parse_executor import inline_parse_executor
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
     import aiohttp
 
     from ..config import ServiceConfig
     from ..types import Bible
+    from .parse_executor import ParseExecutor
 
 _img_re: Final = re.compile('src="', re.named_group('src')('[^"]+'), '"')
 
@@ -69,6 +72,66 @@ class _Response(TypedDict):
     meta: _Meta | None
 
 
+type _Item = _Paragraph | _VerseNumber | _Char | _Text
+
+# The text written before and after the items of a char or verse tag by style
+_style_markup: Final = {
+    'add': ('__ITALIC__', '__ITALIC__'),
+    'v': (' __BOLD__', '.__BOLD__ '),
+}
+_no_markup: Final = ('', '')
+
+
+def _transform_content(content: list[_Paragraph], /) -> str:
+    strings: list[str] = []
+    # The items of each open tag that are left to walk and the text that closes it
+    stack: list[tuple[Iterator[_Item], str]] = [(iter(content), '')]
+
+    while stack:
+        items, closing = stack[-1]
+
+        for item in items:
+            if item.get('type') == 'text' and 'text' in item:
+                strings.append(item['text'])
+                continue
+
+            name = item.get('name')
+
+            if name == 'para' and 'items' in item:
+                stack.append((iter(item['items']), ''))
+                break
+
+            if name in {'char', 'verse'} and 'attrs' in item and 'items' in item:
+                opening, item_closing = _style_markup.get(
+                    item['attrs']['style'], _no_markup
+                )
+                strings.append(opening)
+                stack.append((iter(item['items']), item_closing))
+                break
+        else:
+            stack.pop()
+            strings.append(closing)
+
+    return ''.join(strings)
+
+
+# These run in the service's parse executor, so they are module level and only
+# return plain data
+def _load_passage(body: bytes, /) -> tuple[str, str | None]:
+    json: _Response = orjson.loads(body)
+
+    return (
+        _transform_content(json['data']['content']).strip(),
+        get(json, 'meta.fumsNoScript'),
+    )
+
+
+def _load_search(body: bytes, /) -> tuple[_Data, str | None]:
+    json: _Response = orjson.loads(body)
+
+    return json['data'], get(json, 'meta.fumsNoScript')
+
+
 @frozen
 class ApiBible(BaseService):
     headers: dict[str, str]
@@ -84,77 +147,44 @@ class ApiBible(BaseService):
             'https://api.scripture.api.bible/v1/bibles/{bibleId}/search'
         ),
     )
+    _fums_reporter: FumsReporter = field(
+        init=False,
+        default=Factory(lambda self: FumsReporter(self.session), takes_self=True),
+    )
 
     def __get_passage_id(self, bible: Bible, verses: VerseRange, /) -> str:
-        mapped_verses = verses.for_bible(bible)
+        # Only the mapped book is needed, so look it up in the Bible's book table
+        # rather than building a mapped VerseRange
+        book_table = bible.book_table
+        book = verses.book if book_table is None else book_table[verses.book]
 
-        if mapped_verses.paratext is None:
+        if book.paratext is None:
             raise BookNotInVersionError(verses.book.name, verses.version or 'default')
 
-        passage_id: str = (
-            f'{mapped_verses.paratext}.'
-            f'{mapped_verses.start.chapter}.{mapped_verses.start.verse}'
-        )
+        passage_id = f'{book.paratext}.{verses.start.chapter}.{verses.start.verse}'
 
-        if mapped_verses.end is not None:
-            passage_id = (
-                f'{passage_id}-{mapped_verses.paratext}.'
-                f'{mapped_verses.end.chapter}.{mapped_verses.end.verse}'
-            )
+        if verses.end is None:
+            return passage_id
 
-        return passage_id
-
-    def __transform_item(
-        self, item: _Paragraph | _VerseNumber | _Char | _Text, strings: list[str], /
-    ) -> None:
-        match item:
-            case {'type': 'text', 'text': text}:
-                strings.append(text)
-            case {'name': 'para', 'items': items}:
-                for child_item in items:
-                    self.__transform_item(child_item, strings)
-            case {'name': 'char' | 'verse', 'attrs': attrs, 'items': items}:
-                if attrs['style'] == 'add':
-                    strings.append('__ITALIC__')
-                elif attrs['style'] == 'v':
-                    strings.append(' __BOLD__')
-
-                for child_item in items:
-                    self.__transform_item(child_item, strings)
-
-                if attrs['style'] == 'add':
-                    strings.append('__ITALIC__')
-                elif attrs['style'] == 'v':
-                    strings.append('.__BOLD__ ')
-            case _:
-                pass
-
-    def __transform_verse(
-        self, bible: Bible, verses: VerseRange, content: list[_Paragraph], /
-    ) -> Passage:
-        strings: list[str] = []
-
-        for paragraph in content:
-            self.__transform_item(paragraph, strings)
-
-        text = self.replace_special_escapes(bible, ''.join(strings).strip())
-
-        return Passage(text=text, range=verses, version=bible.abbr)
-
-    async def __process_response(self, response: aiohttp.ClientResponse, /) -> _Data:
+        return f'{passage_id}-{book.paratext}.{verses.end.chapter}.{verses.end.verse}'
+
+    async def __process_response[T](
+        self,
+        response: aiohttp.ClientResponse,
+        load: Callable[[bytes], tuple[T, str | None]],
+        /,
+    ) -> T:
         if response.status != 200:
             raise DoNotUnderstandError
 
-        json: _Response = await response.json(loads=orjson.loads, content_type=None)
+        body = await response.read()
+        data, meta = await self.parse_executor.run(len(body), load, body)
 
-        # Make a request for the image to report to the Fair Use Management System
-        meta: str | None = get(json, 'meta.fumsNoScript')
+        # Queue a request for the image to report to the Fair Use Management System
         if meta and (match := _img_re.search(meta)) is not None:
-            with contextlib.suppress(asyncio.TimeoutError):
-                async with self.session.get(match.group('src')) as fums_response:
-                    await fums_response.read()
+            self._fums_reporter.report(match.group('src'))
 
-        return json['data']
+        return data
 
     @override
     async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage:
@@ -175,9 +205,13 @@ class ApiBible(BaseService):
             ),
             headers=self.headers,
         ) as response:
-            data = await self.__process_response(response)
+            text = await self.__process_response(response, _load_passage)
 
-            return self.__transform_verse(bible, verses, data['content'])
+            return Passage(
+                text=self.replace_special_escapes(bible, text),
+                range=verses,
+                version=bible.abbr,
+            )
 
     @override
     async def search(
@@ -202,7 +236,7 @@ class ApiBible(BaseService):
             ),
             headers=self.headers,
         ) as response:
-            data = await self.__process_response(response)
+            data = await self.__process_response(response, _load_search)
 
             total: int = get(data, 'total') or 0
 
@@ -217,11 +251,19 @@ class ApiBible(BaseService):
 
             return SearchResults(passages, total)
 
+    async def close(self, /) -> None:
+        await self._fums_reporter.close()
+
     @override
     @classmethod
     def from_config(
-        cls, config: ServiceConfig | None, session: aiohttp.ClientSession, /
+        cls,
+        config: ServiceConfig | None,
+        session: aiohttp.ClientSession,
+        /,
+        *,
+        parse_executor: ParseExecutor = inline_parse_executor,
     ) -> Self:
         headers = {'api-key': config.get('api_key', '')} if config else {}
 
-        return cls(session, config, headers)
+        return cls(session, config, headers, parse_executor=parse_executor)
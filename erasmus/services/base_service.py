@@ -2,11 +2,13 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Final, Self
+from typing import TYPE_CHECKING, ClassVar, Final, Self
 
-from attrs import frozen
+from attrs import field, frozen
 from botus_receptus import re
 
+from .parse_executor import ParseExecutor, inline_parse_executor
+
 if TYPE_CHECKING:
     import aiohttp
 
@@ -16,13 +18,8 @@ if TYPE_CHECKING:
 
 _log: Final = logging.getLogger(__name__)
 
-_whitespace_re: Final = re.compile(re.one_or_more(re.WHITESPACE))
-_punctuation_re: Final = re.compile(
-    re.one_or_more(re.WHITESPACE), re.capture(r'[,.;:]'), re.one_or_more(re.WHITESPACE)
-)
-_bold_re: Final = re.compile(r'__BOLD__')
-_italic_re: Final = re.compile(r'__ITALIC__')
-_specials_re: Final = re.compile(re.capture(r'[\*`]'))
+_punctuation_re: Final = re.compile(' ', re.capture(r'[,.;:]'), ' ')
+_spaced_punctuation: Final = (' , ', ' . ', ' ; ', ' : ')
 _number_re: Final = re.compile(
     re.capture(r'\*\*', re.one_or_more(re.DIGIT), re.DOT, r'\*\*')
 )
@@ -30,8 +27,12 @@ _number_re: Final = re.compile(
 
 @frozen
 class BaseService(ABC):
+    # Whether passages from this service are kept in the passage store by default
+    store_passages: ClassVar[bool] = True
+
     session: aiohttp.ClientSession
     config: ServiceConfig | None
+    parse_executor: ParseExecutor = field(default=inline_parse_executor, kw_only=True)
 
     @abstractmethod
     async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage: ...
@@ -42,11 +43,17 @@ class BaseService(ABC):
     ) -> SearchResults: ...
 
     def replace_special_escapes(self, bible: Bible, text: str, /) -> str:
-        text = _whitespace_re.sub(' ', text.strip())
-        text = _punctuation_re.sub(r'\1 ', text)
-        text = _specials_re.sub(r'\\\1', text)
-        text = _bold_re.sub('**', text)
-        text = _italic_re.sub('_', text)
+        # str.split() and \s agree on what is whitespace, and splitting avoids a
+        # regular expression match for every space
+        text = ' '.join(text.split())
+
+        # Once whitespace is collapsed, punctuation between spaces is rare and
+        # cheaper to look for as plain substrings
+        if any(punctuation in text for punctuation in _spaced_punctuation):
+            text = _punctuation_re.sub(r'\1 ', text)
+
+        text = text.replace('*', r'\*').replace('`', r'\`')
+        text = text.replace('__BOLD__', '**').replace('__ITALIC__', '_')
 
         if bible.rtl:
             # wrap in [RTL embedding]text[Pop directional formatting]
@@ -56,6 +63,11 @@ class BaseService(ABC):
 
     @classmethod
     def from_config(
-        cls, config: ServiceConfig | None, session: aiohttp.ClientSession, /
+        cls,
+        config: ServiceConfig | None,
+        session: aiohttp.ClientSession,
+        /,
+        *,
+        parse_executor: ParseExecutor = inline_parse_executor,
     ) -> Self:
-        return cls(session, config)
+        return cls(session, config, parse_executor=parse_executor)
@@ -1,13 +1,15 @@
 # Service for querying biblegateway.com
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
+from contextlib import suppress
+from enum import Flag, auto
+from html.entities import html5
+from html.parser import HTMLParser
 from typing import TYPE_CHECKING, Final, override
 
-from attrs import field, frozen
+from attrs import define, field, frozen
 from botus_receptus import re
-from bs4 import BeautifulSoup, Tag
-from bs4.element import NavigableString
-from bs4.filter import SoupStrainer
 from yarl import URL
 
 from ..data import Passage, SearchResults, VerseRange
@@ -21,6 +23,464 @@ _total_re: Final = re.compile(
     re.START, re.named_group('total')(re.one_or_more(re.DIGITS))
 )
 
+# The parsers below build text the way BeautifulSoup's html.parser tree builder
+# would have built the tree that the extracted text came from before
+_void_elements: Final = frozenset(
+    {
+        'area',
+        'base',
+        'basefont',
+        'bgsound',
+        'br',
+        'col',
+        'command',
+        'embed',
+        'frame',
+        'hr',
+        'image',
+        'img',
+        'input',
+        'isindex',
+        'keygen',
+        'link',
+        'menuitem',
+        'meta',
+        'nextid',
+        'param',
+        'source',
+        'spacer',
+        'track',
+        'wbr',
+    }
+)
+_string_container_elements: Final = frozenset(
+    {'rp', 'rt', 'script', 'style', 'template'}
+)
+_preserve_whitespace_elements: Final = frozenset({'pre', 'textarea'})
+_ascii_whitespace: Final = ' \n\t\x0c\r'
+_no_classes: Final[frozenset[str]] = frozenset()
+
+_passage_classes: Final = frozenset(
+    {'result-text-style-normal', 'result-text-style-rtl'}
+)
+_search_classes: Final = frozenset({'search-result-list', 'showing-results'})
+_removed_classes: Final = frozenset(
+    {'footnotes', 'footnote', 'crossrefs', 'crossreference', 'full-chap-link'}
+)
+
+
+class _StopParsing(Exception):
+    pass
+
+
+class _Action(Flag):
+    NONE = 0
+    HIDE = auto()
+    UPPER = auto()
+    BOLD = auto()
+    BOLD_HEADING = auto()
+    VERSE_NUMBER = auto()
+    ITALIC = auto()
+
+
+@define(eq=False)
+class _VerseText:
+    for_search: bool
+    _parts: list[str] = field(init=False, factory=list)
+    _actions: list[_Action] = field(init=False, factory=list)
+    _hidden: int = field(init=False, default=0)
+    _upper: int = field(init=False, default=0)
+    _verse_number: list[str] | None = field(init=False, default=None)
+
+    def _write(self, text: str, /) -> None:
+        if self._verse_number is not None:
+            self._verse_number.append(text)
+        else:
+            self._parts.append(text)
+
+    def _markup(self, markup: str, /) -> None:
+        # Verse numbers only keep their text
+        if self._verse_number is None:
+            self._parts.append(markup)
+
+    def start(self, name: str, classes: frozenset[str], /) -> None:
+        if (
+            self._hidden
+            or name == 'h1'
+            or (name == 'h3' and not self.for_search)
+            or not classes.isdisjoint(_removed_classes)
+        ):
+            # Remove headings and footnotes
+            self._hidden += 1
+            self._actions.append(_Action.HIDE)
+            return
+
+        if name == 'span' and 'chapternum' in classes:
+            self._markup('__BOLD__1.__BOLD__ ')
+            self._hidden += 1
+            self._actions.append(_Action.HIDE)
+            return
+
+        action = _Action.NONE
+
+        if 'small-caps' in classes:
+            self._upper += 1
+            action |= _Action.UPPER
+
+        if name in {'b', 'h4'}:
+            self._markup('__BOLD__')
+            action |= _Action.BOLD_HEADING if name == 'h4' else _Action.BOLD
+        elif name == 'sup' and 'versenum' in classes and self._verse_number is None:
+            # Add a period after verse numbers
+            self._verse_number = []
+            action |= _Action.VERSE_NUMBER
+        elif name == 'br':
+            self._write('\n')
+        elif name in {'i', 'h3'} or 'selah' in classes:
+            self._markup('__ITALIC__')
+            action |= _Action.ITALIC
+
+        self._actions.append(action)
+
+    def end(self) -> None:
+        action = self._actions.pop()
+
+        if _Action.HIDE in action:
+            self._hidden -= 1
+        if _Action.UPPER in action:
+            self._upper -= 1
+        if _Action.BOLD in action:
+            self._markup('__BOLD__')
+        if _Action.BOLD_HEADING in action:
+            self._markup('__BOLD__ ')
+        if _Action.VERSE_NUMBER in action:
+            number = ''.join(self._verse_number or ()).strip()
+            self._verse_number = None
+            self._markup(f'__BOLD__{number}.__BOLD__ ')
+        if _Action.ITALIC in action:
+            self._markup('__ITALIC__')
+
+    def text(self, text: str, /) -> None:
+        if self._hidden:
+            return
+
+        self._write(text.upper() if self._upper else text)
+
+    def get_text(self) -> str:
+        return ''.join(self._parts)
+
+
+class _StrainedParser(HTMLParser, ABC):
+    """Walks the elements accepted by `_accept` and their contents in one pass
+
+    Only elements that are not inside another accepted element are passed to
+    `_accept`. Text outside of accepted elements is dropped.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=False)
+        self._open: list[str] = []
+        self._data: list[str] = []
+        self._string_containers = 0
+        self._preserve_whitespace = 0
+
+    @abstractmethod
+    def _accept(self, name: str, classes: frozenset[str], /) -> bool: ...
+
+    @abstractmethod
+    def _start(self, name: str, classes: frozenset[str], depth: int, /) -> None: ...
+
+    @abstractmethod
+    def _end(self, depth: int, /) -> None: ...
+
+    @abstractmethod
+    def _text(self, text: str, depth: int, /) -> None: ...
+
+    def parse(self, text: str, /) -> None:
+        try:
+            self.feed(text)
+            self.close()
+            self._flush()
+
+            while self._open:
+                self._pop()
+        except _StopParsing:
+            pass
+
+    def _flush(self) -> None:
+        if not self._data:
+            return
+
+        text = ''.join(self._data)
+        self._data.clear()
+
+        if not self._preserve_whitespace and not text.strip(_ascii_whitespace):
+            text = '\n' if '\n' in text else ' '
+
+        if not self._string_containers:
+            self._text(text, len(self._open))
+
+    def _push(self, name: str, classes: frozenset[str], /) -> None:
+        depth = len(self._open)
+        self._open.append(name)
+
+        if name in _string_container_elements:
+            self._string_containers += 1
+        if name in _preserve_whitespace_elements:
+            self._preserve_whitespace += 1
+
+        self._start(name, classes, depth)
+
+    def _pop(self) -> None:
+        name = self._open.pop()
+
+        if name in _string_container_elements:
+            self._string_containers -= 1
+        if name in _preserve_whitespace_elements:
+            self._preserve_whitespace -= 1
+
+        self._end(len(self._open))
+
+    def _handle_start(
+        self, name: str, attrs: list[tuple[str, str | None]], /, *, close: bool
+    ) -> None:
+        self._flush()
+        classes = _no_classes
+
+        for key, value in attrs:
+            if key == 'class':
+                classes = frozenset(value.split()) if value else _no_classes
+
+        if not self._open and not self._accept(name, classes):
+            return
+
+        self._push(name, classes)
+
+        if close:
+            self._pop()
+
+    @override
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._handle_start(tag, attrs, close=tag in _void_elements)
+
+    @override
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._handle_start(tag, attrs, close=True)
+
+    @override
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+
+        if tag in _void_elements:
+            return
+
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index] == tag:
+                while len(self._open) > index:
+                    self._pop()
+                return
+
+    @override
+    def handle_data(self, data: str) -> None:
+        if self._open:
+            self._data.append(data)
+
+    @override
+    def handle_charref(self, name: str) -> None:
+        value = int(name.lstrip('xX'), 16) if name.startswith(('x', 'X')) else int(name)
+        data: str | None = None
+
+        if value < 256:
+            # Numeric references below 256 are often meant as windows-1252
+            with suppress(UnicodeDecodeError):
+                data = bytes((value,)).decode('windows-1252')
+
+        if data is None:
+            data = '\N{REPLACEMENT CHARACTER}'
+
+            with suppress(ValueError, OverflowError):
+                data = chr(value)
+
+        self.handle_data(data)
+
+    @override
+    def handle_entityref(self, name: str) -> None:
+        data = html5.get(f'{name};') or html5.get(name) or f'&{name}'
+        self.handle_data(data)
+
+    @override
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    @override
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    @override
+    def unknown_decl(self, data: str) -> None:
+        self._flush()
+
+    @override
+    def handle_pi(self, data: str) -> None:
+        self._flush()
+
+
+class _PassageParser(_StrainedParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.verse_text: _VerseText | None = None
+
+    @override
+    def _accept(self, name: str, classes: frozenset[str], /) -> bool:
+        return self.verse_text is None and not classes.isdisjoint(_passage_classes)
+
+    @override
+    def _start(self, name: str, classes: frozenset[str], depth: int, /) -> None:
+        if depth == 0:
+            self.verse_text = _VerseText(for_search=False)
+        elif self.verse_text is not None:
+            self.verse_text.start(name, classes)
+
+    @override
+    def _end(self, depth: int, /) -> None:
+        if depth == 0:
+            # Everything needed has been read once the verse block closes
+            raise _StopParsing
+
+        if self.verse_text is not None:
+            self.verse_text.end()
+
+    @override
+    def _text(self, text: str, depth: int, /) -> None:
+        if self.verse_text is not None:
+            self.verse_text.text(text)
+
+
+@define(eq=False)
+class _SearchItem:
+    depth: int
+    title: list[str] | None = None
+    verse_text: _VerseText | None = None
+    title_depth: int | None = None
+    text_depth: int | None = None
+    extras_depth: int | None = None
+    extras_seen: bool = False
+
+
+class _SearchParser(_StrainedParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.items: list[_SearchItem] = []
+        self.total: str | None = None
+        self._total_parts: list[str] | None = None
+        self._total_depth: int | None = None
+        self._list_depths: list[int] = []
+        self._item: _SearchItem | None = None
+
+    @override
+    def _accept(self, name: str, classes: frozenset[str], /) -> bool:
+        return not classes.isdisjoint(_search_classes)
+
+    @override
+    def _start(self, name: str, classes: frozenset[str], depth: int, /) -> None:
+        if self._total_parts is None and 'showing-results' in classes:
+            self._total_parts = []
+            self._total_depth = depth
+
+        if (item := self._item) is None:
+            if self._list_depths and 'bible-item' in classes:
+                self._item = _SearchItem(depth)
+        elif item.extras_depth is not None:
+            pass
+        elif not item.extras_seen and 'bible-item-extras' in classes:
+            item.extras_seen = True
+            item.extras_depth = depth
+        elif (
+            item.text_depth is not None and (verse_text := item.verse_text) is not None
+        ):
+            verse_text.start(name, classes)
+        elif item.title_depth is not None:
+            pass
+        elif item.verse_text is None and 'bible-item-text' in classes:
+            item.verse_text = _VerseText(for_search=True)
+            item.text_depth = depth
+        elif item.title is None and 'bible-item-title' in classes:
+            item.title = []
+            item.title_depth = depth
+
+        if 'search-result-list' in classes:
+            self._list_depths.append(depth)
+
+    @override
+    def _end(self, depth: int, /) -> None:
+        if self._list_depths and self._list_depths[-1] == depth:
+            self._list_depths.pop()
+
+        if self._total_depth == depth:
+            self.total = ' '.join(self._total_parts or ())
+            self._total_depth = None
+
+        if (item := self._item) is None:
+            return
+
+        if item.extras_depth is not None:
+            if item.extras_depth == depth:
+                item.extras_depth = None
+        elif item.text_depth is not None:
+            if item.text_depth == depth:
+                item.text_depth = None
+            elif (verse_text := item.verse_text) is not None:
+                verse_text.end()
+        elif item.title_depth == depth:
+            item.title_depth = None
+
+        if item.depth == depth:
+            self.items.append(item)
+            self._item = None
+
+    @override
+    def _text(self, text: str, depth: int, /) -> None:
+        if (
+            self._total_depth is not None
+            and (total_parts := self._total_parts) is not None
+            and (stripped := text.strip())
+        ):
+            total_parts.append(stripped)
+
+        if (item := self._item) is None or item.extras_depth is not None:
+            return
+
+        if item.text_depth is not None:
+            if (verse_text := item.verse_text) is not None:
+                verse_text.text(text)
+        elif item.title_depth is not None and (title := item.title) is not None:
+            title.append(text)
+
+
+def _parse_passage(text: str, /) -> str | None:
+    parser = _PassageParser()
+    parser.parse(text)
+
+    return None if parser.verse_text is None else parser.verse_text.get_text()
+
+
+def _parse_search(text: str, /) -> tuple[list[tuple[str, str]], str] | None:
+    parser = _SearchParser()
+    parser.parse(text)
+
+    if not parser.items or parser.total is None:
+        return None
+
+    results: list[tuple[str, str]] = []
+
+    for item in parser.items:
+        if item.verse_text is None or item.title is None:
+            raise DoNotUnderstandError
+
+        results.append((''.join(item.title).strip(), item.verse_text.get_text()))
+
+    return results, parser.total
+
 
 @frozen
 class BibleGateway(BaseService):
@@ -31,52 +491,10 @@ class BibleGateway(BaseService):
         init=False, factory=lambda: URL('https://www.biblegateway.com/quicksearch/')
     )
 
-    def __transform_verse_node(
-        self,
-        bible: Bible,
-        verses: VerseRange,
-        verse_node: Tag,
-        /,
-        *,
-        for_search: bool = False,
+    def __create_passage(
+        self, bible: Bible, verses: VerseRange, text: str, /
     ) -> Passage:
-        for node in verse_node.select(
-            f'h1, {"h3, " if not for_search else ""}.footnotes, .footnote, .crossrefs, '
-            '.crossreference, .full-chap-link'
-        ):
-            # Remove headings and footnotes
-            node.decompose()
-
-        for number in verse_node.select('span.chapternum'):
-            number.insert_before('__BOLD__')
-            number.insert_after('__BOLD__ ')
-            number.string = '1.'
-            number.unwrap()
-        for small_caps in verse_node.select('.small-caps'):
-            for descendant in list(small_caps.descendants):
-                if isinstance(descendant, NavigableString):
-                    descendant.replace_with(
-                        descendant.string.upper()  # pyright: ignore[reportArgumentType]
-                    )
-            small_caps.unwrap()
-        for bold in verse_node.select('b, h4'):
-            bold.insert_before('__BOLD__')
-            bold.insert_after('__BOLD__' + (' ' if bold.name == 'h4' else ''))
-            bold.unwrap()
-        for number in verse_node.select('sup.versenum'):
-            # Add a period after verse numbers
-            number.insert_before('__BOLD__')
-            number.insert_after('__BOLD__ ')
-            number.string = f'{number.string.strip()}.'  # pyright: ignore[reportOptionalMemberAccess]
-            number.unwrap()
-        for br in verse_node.select('br'):
-            br.replace_with('\n')  # pyright: ignore[reportArgumentType]
-        for italic in verse_node.select('.selah, i, h3'):
-            italic.insert_before('__ITALIC__')
-            italic.insert_after('__ITALIC__')
-            italic.unwrap()
-
-        text = self.replace_special_escapes(bible, verse_node.get_text(''))
+        text = self.replace_special_escapes(bible, text)
 
         return Passage(text=text, range=verses, version=bible.abbr)
 
@@ -92,23 +510,12 @@ class BibleGateway(BaseService):
             )
         ) as response:
             text = await response.text(errors='replace')
-            strainer = SoupStrainer(
-                class_=re.compile(
-                    re.WORD_BOUNDARY,
-                    'result-text-style-',
-                    re.either('normal', 'rtl'),
-                    re.WORD_BOUNDARY,
-                )
-            )
-            soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
-            verse_block = soup.select_one(
-                '.result-text-style-normal, .result-text-style-rtl'
-            )
+            verse_text = await self.parse_executor.run(len(text), _parse_passage, text)
 
-            if verse_block is None:
+            if verse_text is None:
                 raise DoNotUnderstandError
 
-            return self.__transform_verse_node(bible, verses, verse_block)
+            return self.__create_passage(bible, verses, verse_text)
 
     @override
     async def search(
@@ -132,37 +539,19 @@ class BibleGateway(BaseService):
             )
         ) as response:
             text = await response.text(errors='replace')
-            strainer = SoupStrainer(class_=['search-result-list', 'showing-results'])
-            soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
-
-            verse_nodes = soup.select('.search-result-list .bible-item')
-            total_node = soup.select_one('.showing-results')
+            parsed = await self.parse_executor.run(len(text), _parse_search, text)
 
-            if not verse_nodes or total_node is None:
+            if parsed is None:
                 return SearchResults([], 0)
 
-            if (match := _total_re.match(total_node.get_text(' ', strip=True))) is None:
-                raise DoNotUnderstandError
-
-            def mapper(node: Tag, /) -> Passage:
-                extras_node = node.select_one('.bible-item-extras')
-                if extras_node:
-                    extras_node.decompose()
+            results, total = parsed
 
-                verse_text_node = node.select_one('.bible-item-text')
-                verse_reference_node = node.select_one('.bible-item-title')
-
-                if verse_text_node is None or verse_reference_node is None:
-                    raise DoNotUnderstandError
-
-                verse = VerseRange.from_string(
-                    verse_reference_node.string.strip()  # pyright: ignore[reportOptionalMemberAccess]
-                )
-
-                return self.__transform_verse_node(
-                    bible, verse, verse_text_node, for_search=True
-                )
+            if (match := _total_re.match(total)) is None:
+                raise DoNotUnderstandError
 
-            passages = list(map(mapper, verse_nodes))
+            passages = [
+                self.__create_passage(bible, VerseRange.from_string(title), verse_text)
+                for title, verse_text in results
+            ]
 
             return SearchResults(passages, int(match.group('total')))
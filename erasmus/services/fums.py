@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Final
+
+import aiohttp
+from attrs import Factory, define, field
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+_log: Final = logging.getLogger(__name__)
+
+_default_queue_size: Final = 256
+_default_batch_size: Final = 16
+_default_request_timeout: Final = 5.0
+_default_flush_timeout: Final = 10.0
+
+
+@define(eq=False)
+class FumsReporter:
+    """Reports API.Bible responses to the Fair Use Management System
+
+    Reports are queued and requested by a background task, so a passage does not
+    wait on its report. Up to `batch_size` queued reports are requested together
+    and identical URLs in a batch are only requested once. When the queue is
+    full, new reports are dropped.
+    """
+
+    session: aiohttp.ClientSession
+    queue_size: int = _default_queue_size
+    batch_size: int = _default_batch_size
+    request_timeout: float = _default_request_timeout
+    flush_timeout: float = _default_flush_timeout
+    _queue: asyncio.Queue[str] = field(
+        init=False,
+        default=Factory(
+            lambda self: asyncio.Queue[str](self.queue_size), takes_self=True
+        ),
+    )
+    _worker: asyncio.Task[None] | None = field(init=False, default=None)
+
+    def report(self, url: str, /) -> None:
+        try:
+            self._queue.put_nowait(url)
+        except asyncio.QueueFull:
+            _log.warning(f'FUMS queue is full, dropped report {url}')
+            return
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self.__run())
+
+    async def __request(self, url: str, /) -> None:
+        try:
+            async with (
+                asyncio.timeout(self.request_timeout),
+                self.session.get(url) as response,
+            ):
+                await response.read()
+        except (TimeoutError, aiohttp.ClientError) as e:
+            _log.warning(f'Error reporting to FUMS: {e!r}')
+
+    async def __request_all(self, urls: Iterable[str], /) -> None:
+        await asyncio.gather(*(self.__request(url) for url in dict.fromkeys(urls)))
+
+    async def __run(self, /) -> None:
+        while True:
+            urls = [await self._queue.get()]
+
+            while len(urls) < self.batch_size and not self._queue.empty():
+                urls.append(self._queue.get_nowait())
+
+            try:
+                await self.__request_all(urls)
+            finally:
+                for _ in urls:
+                    self._queue.task_done()
+
+    async def close(self, /) -> None:
+        if self._worker is None:
+            return
+
+        # Give the queued reports a chance to be sent before stopping the worker
+        if not self._worker.done():
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(self.flush_timeout):
+                    await self._queue.join()
+
+        self._worker.cancel()
+
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._worker
+
+        self._worker = None
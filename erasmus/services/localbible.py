@@ -0,0 +1,324 @@
+# Service for Bible versions stored on the local filesystem
+from __future__ import annotations
+
+import asyncio
+import mmap
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, ClassVar, Final, Self, override
+
+from attrs import field, frozen
+from botus_receptus import re
+
+from ..data import Passage, SearchResults, Verse, VerseRange, _verse_bits, _verse_mask
+from ..exceptions import (
+    BibleNotSupportedError,
+    BookNotInVersionError,
+    DoNotUnderstandError,
+)
+from .base_service import BaseService
+from .parse_executor import inline_parse_executor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import aiohttp
+
+    from ..config import ServiceConfig
+    from ..types import Bible
+    from .parse_executor import ParseExecutor
+
+# Corpus layout (native byte order):
+#   magic, book count, book OSIS names (length prefixed), padding to 4 bytes,
+#   verse count, verse keys, verse byte offsets (verse count + 1), UTF-8 text
+#
+# Verse keys are `book index << _book_shift | Verse(chapter, verse)` and are sorted,
+# so a verse range is a contiguous run of verses found with two binary searches.
+# Chapters get as many bits as verses.
+_book_shift: Final = 2 * _verse_bits
+_chapter_mask: Final = (1 << (_book_shift - _verse_bits)) - 1
+_magic: Final = b'ERBC'
+_default_data_dir: Final = 'bibles'
+
+_markup_re: Final = re.compile(r'__(?:BOLD|ITALIC)__')
+_token_re: Final = re.compile(r'[^\W_]+')
+_phrase_re: Final = re.compile(r'"([^"]*)"?|(\S+)')
+
+# Postings are `verse index << 16 | token position` so that each token's postings
+# are sorted in canonical verse order and a phrase is a run of adjacent positions
+_position_bits: Final = 16
+_position_mask: Final = (1 << _position_bits) - 1
+
+
+def _key(book: int, verse: Verse, /) -> int:
+    return (book << _book_shift) | verse
+
+
+def _align(buffer: bytearray, /) -> None:
+    buffer.extend(b'\0' * (-len(buffer) % 4))
+
+
+@frozen(eq=False)
+class Corpus:
+    books: dict[str, int]
+    book_osis: list[str]
+    keys: memoryview
+    offsets: memoryview
+    text: memoryview
+
+    def __len__(self, /) -> int:
+        return len(self.keys)
+
+    def find(self, book: int, verses: VerseRange, /) -> range:
+        end = verses.end or verses.start
+
+        return range(
+            bisect_left(self.keys, _key(book, verses.start)),
+            bisect_right(self.keys, _key(book, end)),
+        )
+
+    def verse_number(self, index: int, /) -> int:
+        return self.keys[index] & _verse_mask
+
+    def verse_range(self, index: int, /) -> VerseRange:
+        key = self.keys[index]
+
+        return VerseRange.create(
+            self.book_osis[key >> _book_shift],
+            Verse((key >> _verse_bits) & _chapter_mask, key & _verse_mask),
+        )
+
+    def verse_text(self, index: int, /) -> str:
+        return str(self.text[self.offsets[index] : self.offsets[index + 1]], 'utf-8')
+
+    @classmethod
+    def load(cls, path: Path, /) -> Self:
+        with path.open('rb') as f:
+            text = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        view = memoryview(text)
+
+        if view[:4].tobytes() != _magic:
+            raise ValueError(f'{path} is not a Bible corpus')
+
+        position = 4
+        book_count = view[position : position + 4].cast('I')[0]
+        position += 4
+        books: dict[str, int] = {}
+
+        for index in range(book_count):
+            length = view[position]
+            books[bytes(view[position + 1 : position + 1 + length]).decode()] = index
+            position += 1 + length
+
+        position += -position % 4
+        verse_count = view[position : position + 4].cast('I')[0]
+        position += 4
+        keys = view[position : position + verse_count * 4].cast('I')
+        position += verse_count * 4
+        offsets = view[position : position + (verse_count + 1) * 4].cast('I')
+        position += (verse_count + 1) * 4
+
+        return cls(books, list(books), keys, offsets, view[position:])
+
+
+def _tokenize(text: str, /) -> list[str]:
+    return _token_re.findall(_markup_re.sub(' ', text).casefold())
+
+
+@frozen(eq=False)
+class SearchIndex:
+    postings: dict[str, array[int]]
+
+    def __phrase_postings(self, tokens: list[str], /) -> set[int]:
+        postings = set(self.postings.get(tokens[0], ()))
+
+        for offset, token in enumerate(tokens[1:], 1):
+            if not postings:
+                break
+
+            postings &= {
+                posting - offset
+                for posting in self.postings.get(token, ())
+                if posting & _position_mask >= offset
+            }
+
+        return postings
+
+    def search(self, query: str, /) -> list[int]:
+        """Return the indexes of verses containing every word and quoted phrase
+
+        Results are in canonical order.
+        """
+
+        phrases = [
+            tokens
+            for match in _phrase_re.finditer(query)
+            if (tokens := _tokenize(match[1] or match[2] or ''))
+        ]
+
+        if not phrases:
+            return []
+
+        verse_sets = sorted(
+            (
+                {
+                    posting >> _position_bits
+                    for posting in self.__phrase_postings(tokens)
+                }
+                for tokens in phrases
+            ),
+            key=len,
+        )
+
+        return sorted(verse_sets[0].intersection(*verse_sets[1:]))
+
+    @classmethod
+    def build(cls, corpus: Corpus, /) -> Self:
+        postings: defaultdict[str, array[int]] = defaultdict(lambda: array('Q'))
+
+        for index in range(len(corpus)):
+            for position, token in enumerate(_tokenize(corpus.verse_text(index))):
+                postings[token].append(
+                    (index << _position_bits) | min(position, _position_mask)
+                )
+
+        return cls(dict(postings))
+
+
+def build_corpus(path: Path, verses: Iterable[tuple[str, int, int, str]], /) -> None:
+    """Write a corpus from `(osis, chapter, verse, text)` tuples in canonical order
+
+    Verse text may contain `__BOLD__` and `__ITALIC__` markup.
+    """
+
+    books: dict[str, int] = {}
+    keys = array('I')
+    offsets = array('I', [0])
+    text = bytearray()
+
+    for osis, chapter, verse, verse_text in verses:
+        book = books.setdefault(osis, len(books))
+        keys.append(_key(book, Verse(chapter, verse)))
+        text.extend(verse_text.encode())
+        offsets.append(len(text))
+
+    header = bytearray(_magic)
+    header.extend(array('I', [len(books)]).tobytes())
+
+    for osis in books:
+        encoded = osis.encode()
+        header.append(len(encoded))
+        header.extend(encoded)
+
+    _align(header)
+    header.extend(array('I', [len(keys)]).tobytes())
+
+    with path.open('wb') as f:
+        f.write(header)
+        f.write(keys.tobytes())
+        f.write(offsets.tobytes())
+        f.write(text)
+
+
+@frozen
+class LocalBible(BaseService):
+    # Passages are already read from local files, so storing them only adds work
+    store_passages: ClassVar[bool] = False
+
+    data_dir: Path
+    _corpora: dict[str, Corpus] = field(init=False, factory=dict[str, Corpus])
+    _indexes: dict[str, SearchIndex] = field(init=False, factory=dict[str, SearchIndex])
+
+    def _get_corpus(self, bible: Bible, /) -> Corpus:
+        corpus = self._corpora.get(bible.service_version)
+
+        if corpus is None:
+            path = self.data_dir / f'{bible.service_version}.bin'
+
+            if not path.is_file():
+                raise BibleNotSupportedError(bible.abbr)
+
+            corpus = self._corpora[bible.service_version] = Corpus.load(path)
+
+        return corpus
+
+    async def _get_index(self, bible: Bible, corpus: Corpus, /) -> SearchIndex:
+        index = self._indexes.get(bible.service_version)
+
+        if index is None:
+            index = await asyncio.to_thread(SearchIndex.build, corpus)
+            index = self._indexes.setdefault(bible.service_version, index)
+
+        return index
+
+    @override
+    async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage:
+        corpus = self._get_corpus(bible)
+        mapped_verses = verses.for_bible(bible)
+        book = corpus.books.get(mapped_verses.osis)
+
+        if book is None:
+            raise BookNotInVersionError(verses.book.name, bible.name)
+
+        indexes = corpus.find(book, mapped_verses)
+
+        if not indexes:
+            raise DoNotUnderstandError
+
+        strings: list[str] = []
+
+        for index in indexes:
+            strings.append(f' __BOLD__{corpus.verse_number(index)}.__BOLD__ ')
+            strings.append(corpus.verse_text(index))
+
+        text = self.replace_special_escapes(bible, ''.join(strings))
+
+        return Passage(text=text, range=verses, version=bible.abbr)
+
+    @override
+    async def search(
+        self,
+        bible: Bible,
+        terms: list[str],
+        /,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> SearchResults:
+        corpus = self._get_corpus(bible)
+        search_index = await self._get_index(bible, corpus)
+        matches = search_index.search(' '.join(terms))
+
+        return SearchResults(
+            [
+                Passage(
+                    text=self.replace_special_escapes(bible, corpus.verse_text(index)),
+                    range=corpus.verse_range(index),
+                    version=bible.abbr,
+                )
+                for index in matches[offset : offset + limit]
+            ],
+            len(matches),
+        )
+
+    @override
+    @classmethod
+    def from_config(
+        cls,
+        config: ServiceConfig | None,
+        session: aiohttp.ClientSession,
+        /,
+        *,
+        parse_executor: ParseExecutor = inline_parse_executor,
+    ) -> Self:
+        data_dir = config.get('data_dir') if config else None
+
+        return cls(
+            session,
+            config,
+            Path(data_dir if isinstance(data_dir, str) else _default_data_dir),
+            parse_executor=parse_executor,
+        )
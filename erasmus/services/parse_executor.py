@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import TYPE_CHECKING, Final, Self
+
+from attrs import define, frozen
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..config import Config
+
+# Responses smaller than this, in bytes or characters, are parsed on the event
+# loop because handing them to a worker costs more than parsing them
+_default_parse_threshold: Final = 16 * 1024
+# Parsing holds the GIL, so more threads only compete with the event loop for it
+_default_thread_workers: Final = 1
+
+
+def _timed[*Ts, T](func: Callable[[*Ts], T], /, *args: *Ts) -> tuple[T, float]:
+    start = perf_counter()
+    result = func(*args)
+
+    return result, perf_counter() - start
+
+
+@define(eq=False)
+class ParseMetrics:
+    inline_parses: int = 0
+    inline_time: float = 0.0
+    max_inline_time: float = 0.0
+    offloaded_parses: int = 0
+    offloaded_time: float = 0.0
+    max_offloaded_time: float = 0.0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    def record_inline(self, elapsed: float, /) -> None:
+        self.inline_parses += 1
+        self.inline_time += elapsed
+        self.max_inline_time = max(self.max_inline_time, elapsed)
+
+    def record_offloaded(self, elapsed: float, wait: float, /) -> None:
+        self.offloaded_parses += 1
+        self.offloaded_time += elapsed
+        self.max_offloaded_time = max(self.max_offloaded_time, elapsed)
+        self.wait_time += wait
+        self.max_wait_time = max(self.max_wait_time, wait)
+
+    def report(self, /) -> str:
+        return (
+            f'Inline: {self.inline_parses} parses, loop blocked '
+            f'{self.inline_time * 1000:.1f}ms (max {self.max_inline_time * 1000:.1f}ms)'
+            f'\nOffloaded: {self.offloaded_parses} parses, '
+            f'{self.offloaded_time * 1000:.1f}ms in workers '
+            f'(max {self.max_offloaded_time * 1000:.1f}ms), '
+            f'{self.wait_time * 1000:.1f}ms until parsed '
+            f'(max {self.max_wait_time * 1000:.1f}ms)'
+        )
+
+    def reset(self, /) -> None:
+        self.inline_parses = 0
+        self.inline_time = 0.0
+        self.max_inline_time = 0.0
+        self.offloaded_parses = 0
+        self.offloaded_time = 0.0
+        self.max_offloaded_time = 0.0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+
+
+parse_metrics: Final = ParseMetrics()
+
+
+@frozen
+class ParseExecutor:
+    """Runs services' parsing and transforming of responses
+
+    Work is done on the event loop when there is no executor or the response is
+    smaller than `threshold`. A thread pool does not take the work off the GIL, so
+    the event loop still competes with it; only a process pool runs it in
+    parallel. Everything run in a process pool must be picklable.
+    """
+
+    executor: Executor | None = None
+    threshold: int = _default_parse_threshold
+
+    async def run[*Ts, T](
+        self, size: int, func: Callable[[*Ts], T], /, *args: *Ts
+    ) -> T:
+        if self.executor is None or size < self.threshold:
+            start = perf_counter()
+            result = func(*args)
+            parse_metrics.record_inline(perf_counter() - start)
+
+            return result
+
+        start = perf_counter()
+        result, elapsed = await asyncio.get_running_loop().run_in_executor(
+            self.executor, _timed, func, *args
+        )
+        parse_metrics.record_offloaded(elapsed, perf_counter() - start)
+
+        return result
+
+    def shutdown(self, /) -> None:
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def from_config(cls, config: Config, /) -> Self:
+        workers = config.get('parse_workers')
+        threshold = config.get('parse_threshold')
+        executor: Executor | None
+
+        if not isinstance(workers, int):
+            workers = None
+        if not isinstance(threshold, int):
+            threshold = _default_parse_threshold
+
+        match config.get('parse_executor'):
+            case 'inline':
+                executor = None
+            case 'process':
+                # Forking a process that is running an event loop is unsafe
+                executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            case _:
+                # Anything other than the other two uses the default thread pool
+                executor = ThreadPoolExecutor(
+                    max_workers=workers or _default_thread_workers,
+                    thread_name_prefix='erasmus-parse',
+                )
+
+        return cls(executor, threshold)
+
+
+inline_parse_executor: Final = ParseExecutor()
@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
-    from .data import Passage, SearchResults, SectionFlag, VerseRange
+    from .data import BookTable, Passage, SearchResults, SectionFlag, VerseRange
 
 
 class Bible(Protocol):
@@ -36,6 +36,9 @@ class Bible(Protocol):
     @property
     def book_mapping(self) -> dict[str, str] | None: ...
 
+    @property
+    def book_table(self) -> BookTable | None: ...
+
 
 class Service(Protocol):
     async def get_passage(self, bible: Bible, verses: VerseRange, /) -> Passage: ...
@@ -54,3 +57,8 @@ class Service(Protocol):
 @runtime_checkable
 class Refreshable(Protocol):
     async def refresh(self, session: AsyncSession, /) -> None: ...
+
+
+@runtime_checkable
+class Closable(Protocol):
+    async def close(self, /) -> None: ...
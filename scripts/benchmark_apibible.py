@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+from typing import Final
+
+import click
+import orjson
+import yaml
+
+from erasmus.services.apibible import _load_passage
+
+_cassettes: Final = Path(__file__).parent.parent / 'tests/services/cassettes'
+
+
+# The recursive transform and decoding that ApiBible used before the iterative
+# transform
+def _transform_item(item: object, strings: list[str], /) -> None:
+    match item:
+        case {'type': 'text', 'text': text}:
+            strings.append(text)
+        case {'name': 'para', 'items': items}:
+            for child_item in items:
+                _transform_item(child_item, strings)
+        case {'name': 'char' | 'verse', 'attrs': attrs, 'items': items}:
+            if attrs['style'] == 'add':
+                strings.append('__ITALIC__')
+            elif attrs['style'] == 'v':
+                strings.append(' __BOLD__')
+
+            for child_item in items:
+                _transform_item(child_item, strings)
+
+            if attrs['style'] == 'add':
+                strings.append('__ITALIC__')
+            elif attrs['style'] == 'v':
+                strings.append('.__BOLD__ ')
+        case _:
+            pass
+
+
+def _recursive(body: bytes, /) -> tuple[str, str | None]:
+    json = orjson.loads(body.decode())
+    strings: list[str] = []
+
+    for paragraph in json['data']['content']:
+        _transform_item(paragraph, strings)
+
+    return ''.join(strings).strip(), (json.get('meta') or {}).get('fumsNoScript')
+
+
+def _load_bodies() -> list[bytes]:
+    # The recorded passage responses, skipping searches, errors and the images
+    # requested for FUMS
+    bodies: list[bytes] = []
+
+    for path in sorted((_cassettes / 'test_apibible').glob('*.yaml')):
+        for interaction in yaml.safe_load(path.read_text())['interactions']:
+            response = interaction['response']
+            body = response['body']['string']
+
+            if (
+                response['status']['code'] == 200
+                and isinstance(body, str)
+                and 'content' in orjson.loads(body)['data']
+            ):
+                bodies.append(body.encode())
+
+    return bodies
+
+
+def _chapter(bodies: list[bytes], paragraphs: int, /) -> bytes:
+    # A synthetic long passage made by repeating the recorded paragraphs
+    json = orjson.loads(bodies[0])
+    recorded = [
+        paragraph
+        for body in bodies
+        for paragraph in orjson.loads(body)['data']['content']
+    ]
+    json['data']['content'] = [
+        recorded[index % len(recorded)] for index in range(paragraphs)
+    ]
+
+    return orjson.dumps(json)
+
+
+@click.command()
+@click.option('--number', default=500, help='Passes over the responses')
+@click.option('--paragraphs', default=200, help='Paragraphs in the long passage')
+def main(number: int, paragraphs: int) -> None:
+    bodies = _load_bodies()
+    chapter = _chapter(bodies, paragraphs)
+
+    for body in [*bodies, chapter]:
+        if _recursive(body) != _load_passage(body):
+            raise click.ClickException(f'Outputs differ for {body[:40]!r}')
+
+    click.echo(f'{len(bodies)} recorded passages, identical output')
+
+    cases = {
+        'recorded passages': bodies,
+        f'{paragraphs} paragraph passage ({len(chapter)} bytes)': [chapter],
+    }
+
+    for name, case_bodies in cases.items():
+        before, after = (
+            timeit.timeit(
+                lambda load=load, case_bodies=case_bodies: [
+                    load(body) for body in case_bodies
+                ],
+                number=number,
+            )
+            / (number * len(case_bodies))
+            for load in (_recursive, _load_passage)
+        )
+        click.echo(
+            f'{name}: {before * 1e6:.1f} -> {after * 1e6:.1f} '
+            f'\N{MICRO SIGN}s per response ({before / after:.2f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
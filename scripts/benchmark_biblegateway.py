@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import timeit
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import click
+import yaml
+from botus_receptus import re
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString
+from bs4.filter import SoupStrainer
+
+from erasmus.services.biblegateway import _PassageParser, _SearchParser
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+type _Search = tuple[list[tuple[str, str]], str | None]
+
+_cassettes: Final = (
+    Path(__file__).parent.parent / 'tests/services/cassettes/test_biblegateway'
+)
+
+
+# The BeautifulSoup extraction that BibleGateway used before its parsers
+def _transform_verse_node(verse_node: Tag, /, *, for_search: bool = False) -> str:
+    for node in verse_node.select(
+        f'h1, {"h3, " if not for_search else ""}.footnotes, .footnote, .crossrefs, '
+        '.crossreference, .full-chap-link'
+    ):
+        node.decompose()
+
+    for number in verse_node.select('span.chapternum'):
+        number.insert_before('__BOLD__')
+        number.insert_after('__BOLD__ ')
+        number.string = '1.'
+        number.unwrap()
+    for small_caps in verse_node.select('.small-caps'):
+        for descendant in list(small_caps.descendants):
+            if isinstance(descendant, NavigableString):
+                descendant.replace_with(
+                    descendant.string.upper()  # pyright: ignore[reportArgumentType]
+                )
+        small_caps.unwrap()
+    for bold in verse_node.select('b, h4'):
+        bold.insert_before('__BOLD__')
+        bold.insert_after('__BOLD__' + (' ' if bold.name == 'h4' else ''))
+        bold.unwrap()
+    for number in verse_node.select('sup.versenum'):
+        number.insert_before('__BOLD__')
+        number.insert_after('__BOLD__ ')
+        number.string = f'{number.string.strip()}.'  # pyright: ignore[reportOptionalMemberAccess]
+        number.unwrap()
+    for br in verse_node.select('br'):
+        br.replace_with('\n')  # pyright: ignore[reportArgumentType]
+    for italic in verse_node.select('.selah, i, h3'):
+        italic.insert_before('__ITALIC__')
+        italic.insert_after('__ITALIC__')
+        italic.unwrap()
+
+    return verse_node.get_text('')
+
+
+def _soup_passage(text: str, /) -> str | None:
+    strainer = SoupStrainer(
+        class_=re.compile(
+            re.WORD_BOUNDARY,
+            'result-text-style-',
+            re.either('normal', 'rtl'),
+            re.WORD_BOUNDARY,
+        )
+    )
+    soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
+    verse_block = soup.select_one('.result-text-style-normal, .result-text-style-rtl')
+
+    return None if verse_block is None else _transform_verse_node(verse_block)
+
+
+def _soup_search(text: str, /) -> _Search:
+    strainer = SoupStrainer(class_=['search-result-list', 'showing-results'])
+    soup = BeautifulSoup(text, 'html.parser', parse_only=strainer)
+    total_node = soup.select_one('.showing-results')
+    items: list[tuple[str, str]] = []
+
+    for node in soup.select('.search-result-list .bible-item'):
+        if extras_node := node.select_one('.bible-item-extras'):
+            extras_node.decompose()
+
+        verse_text_node = node.select_one('.bible-item-text')
+        verse_reference_node = node.select_one('.bible-item-title')
+        if verse_text_node is None or verse_reference_node is None:
+            raise click.ClickException('Search result without a title or text')
+
+        items.append(
+            (
+                verse_reference_node.string.strip(),  # pyright: ignore[reportOptionalMemberAccess]
+                _transform_verse_node(verse_text_node, for_search=True),
+            )
+        )
+
+    return items, None if total_node is None else total_node.get_text(' ', strip=True)
+
+
+def _parser_passage(text: str, /) -> str | None:
+    parser = _PassageParser()
+    parser.parse(text)
+
+    return None if parser.verse_text is None else parser.verse_text.get_text()
+
+
+def _parser_search(text: str, /) -> _Search:
+    parser = _SearchParser()
+    parser.parse(text)
+
+    return [
+        (
+            ''.join(item.title or ()).strip(),
+            '' if item.verse_text is None else item.verse_text.get_text(),
+        )
+        for item in parser.items
+    ], parser.total
+
+
+def _load_pages() -> dict[str, str]:
+    pages: dict[str, str] = {}
+
+    for path in sorted(_cassettes.glob('*.yaml')):
+        cassette = yaml.safe_load(path.read_text())
+
+        for interaction in cassette['interactions']:
+            if interaction['request']['uri'].startswith(
+                'https://www.biblegateway.com/'
+            ):
+                pages[path.stem.removeprefix('TestBibleGateway.')] = interaction[
+                    'response'
+                ]['body']['string']
+
+    return pages
+
+
+@click.command()
+@click.option('--number', default=20, help='Parses of each recorded page')
+def main(number: int) -> None:
+    for name, page in _load_pages().items():
+        if 'search' in name:
+            soup, parser = _soup_search, _parser_search
+        else:
+            soup, parser = _soup_passage, _parser_passage
+
+        if soup(page) != parser(page):
+            raise click.ClickException(f'BeautifulSoup and parser disagree on {name}')
+
+        before = timeit.timeit(lambda soup=soup, page=page: soup(page), number=number)
+        after = timeit.timeit(
+            lambda parser=parser, page=page: parser(page), number=number
+        )
+
+        click.echo(
+            f'{name:>50}: {before / number * 1e3:7.2f}ms -> '
+            f'{after / number * 1e3:7.2f}ms ({before / after:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
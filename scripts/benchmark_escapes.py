@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import timeit
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any, Final, cast
+
+import click
+import orjson
+import yaml
+from attrs import frozen
+from botus_receptus import re
+
+from erasmus.services import apibible, biblegateway
+from erasmus.services.biblegateway import BibleGateway
+
+_cassettes: Final = Path(__file__).parent.parent / 'tests/services/cassettes'
+
+# The regular expression passes that BaseService.replace_special_escapes made
+# before it used string methods
+_whitespace_re: Final = re.compile(re.one_or_more(re.WHITESPACE))
+_punctuation_re: Final = re.compile(
+    re.one_or_more(re.WHITESPACE), re.capture(r'[,.;:]'), re.one_or_more(re.WHITESPACE)
+)
+_bold_re: Final = re.compile(r'__BOLD__')
+_italic_re: Final = re.compile(r'__ITALIC__')
+_specials_re: Final = re.compile(re.capture(r'[\*`]'))
+_number_re: Final = re.compile(
+    re.capture(r'\*\*', re.one_or_more(re.DIGIT), re.DOT, r'\*\*')
+)
+
+
+@frozen
+class _Bible:
+    rtl: bool
+
+
+_service: Final = BibleGateway(cast('Any', None), None)
+
+
+def _multi_pass(text: str, /, *, rtl: bool) -> str:
+    text = _whitespace_re.sub(' ', text.strip())
+    text = _punctuation_re.sub(r'\1 ', text)
+    text = _specials_re.sub(r'\\\1', text)
+    text = _bold_re.sub('**', text)
+    text = _italic_re.sub('_', text)
+
+    if rtl:
+        text = _number_re.sub('\u202b\\1\u202c', text)
+
+    return text
+
+
+def _current(text: str, /, *, rtl: bool) -> str:
+    return _service.replace_special_escapes(cast('Any', _Bible(rtl)), text)
+
+
+def _bodies(service: str, /) -> list[str]:
+    bodies: list[str] = []
+
+    for path in sorted((_cassettes / f'test_{service}').glob('*.yaml')):
+        for interaction in yaml.safe_load(path.read_text())['interactions']:
+            response = interaction['response']
+            body = response['body']['string']
+
+            # Skip errors and the images requested for FUMS
+            if response['status']['code'] == 200 and isinstance(body, str):
+                bodies.append(body)
+
+    return bodies
+
+
+def _load_passages() -> list[str]:
+    # The unescaped text of every passage and search result in the cassettes
+    passages: list[str] = []
+
+    for body in _bodies('biblegateway'):
+        if (text := biblegateway._parse_passage(body)) is not None:
+            passages.append(text)
+        if (results := biblegateway._parse_search(body)) is not None:
+            passages.extend(text for _, text in results[0])
+
+    for body in _bodies('apibible'):
+        data = orjson.loads(body)['data']
+
+        if 'content' in data:
+            passages.append(apibible._load_passage(body.encode())[0])
+        else:
+            passages.extend(verse['text'] for verse in data.get('verses', []))
+
+    return passages
+
+
+def _chapter(passages: list[str], verses: int, /) -> str:
+    return '\n'.join(
+        f'__BOLD__{number}.__BOLD__ {text}'
+        for number, text in enumerate(islice(cycle(passages), verses), 1)
+    )
+
+
+@click.command()
+@click.option('--number', default=200, help='Passes over the passages')
+@click.option('--verses', default=176, help='Verses in the long chapter')
+def main(number: int, verses: int) -> None:
+    passages = _load_passages()
+    chapter = _chapter(passages, verses)
+
+    for rtl in (False, True):
+        for text in [*passages, chapter]:
+            if _multi_pass(text, rtl=rtl) != _current(text, rtl=rtl):
+                raise click.ClickException(f'Outputs differ for {text[:40]!r}')
+
+    click.echo(
+        f'{len(passages)} recorded passages, identical output with and without RTL'
+    )
+
+    cases = {
+        'recorded passages': passages,
+        f'{verses} verse chapter ({len(chapter)} chars)': [chapter],
+    }
+
+    for name, texts in cases.items():
+        for rtl in (False, True):
+            before, after = (
+                timeit.timeit(
+                    lambda replace=replace, texts=texts, rtl=rtl: [
+                        replace(text, rtl=rtl) for text in texts
+                    ],
+                    number=number,
+                )
+                / (number * len(texts))
+                for replace in (_multi_pass, _current)
+            )
+            click.echo(
+                f'{name} (rtl={rtl}): {before * 1e6:.1f} -> {after * 1e6:.1f} '
+                f'\N{MICRO SIGN}s per text ({before / after:.1f}x)'
+            )
+
+
+if __name__ == '__main__':
+    main()
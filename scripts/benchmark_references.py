@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import timeit
+from typing import TYPE_CHECKING, Final
+
+import click
+from botus_receptus import re
+
+from erasmus.data import _reference_re, _reference_scanner, _version_group
+from erasmus.reference_scanner import could_contain_reference
+
+if TYPE_CHECKING:
+    from re import Pattern
+
+# The regular expression that VerseRange.get_all_from_string used before the
+# reference scanner
+_reference_or_bracketed_with_version_re: Final = re.compile(
+    re.optional(
+        re.named_group('bracket')(re.LEFT_BRACKET, re.any_number_of(re.WHITESPACE))
+    ),
+    _reference_re,
+    re.if_group(
+        'bracket',
+        re.group(
+            re.optional(
+                re.one_or_more(re.WHITESPACE),
+                _version_group(re.one_or_more(re.ALPHANUMERICS)),
+            ),
+            re.any_number_of(re.WHITESPACE),
+            re.RIGHT_BRACKET,
+        ),
+    ),
+    flags=re.IGNORECASE,
+)
+
+_messages: Final = [
+    'good morning everyone',
+    'lol',
+    'anyone up for a game tonight?',
+    'I think the meeting got moved to 3:30, can someone confirm',
+    'https://example.com/watch?v=abc123 check this out',
+    'Has anyone read the new translation notes? They are pretty interesting',
+    'ok',
+    'we were talking about this in bible study last week and nobody agreed',
+    'John 3:16',
+    'see [Romans 8:28 ESV] for the context',
+    'I love Psalm 23:1-6, especially in the KJV',
+    'my kid said the funniest thing at dinner, I will tell you all later',
+    'brb',
+    'Matthew 5:3-12 and Luke 6:20-23 are the two versions of the beatitudes',
+    'it is 12:45 here and I still have not had lunch',
+    'thanks!',
+    (
+        'So I have been thinking a lot about what the pastor said on Sunday '
+        'about patience and I am not sure I fully agree with how he applied it '
+        'to the workplace, but I do see where he was coming from'
+    ),
+    '[1 Cor 13:4-7]',
+    'what time is the call? 7:00 or 7:30?',
+    'nice',
+    'haha :joy: :joy:',
+    'lunch at 11:30?',
+    'Can you send me the link again',
+    'prayer request: my grandmother goes into surgery tomorrow',
+    'https://www.youtube.com/watch?v=dQw4w9WgXcQ',
+    '@Erasmus Genesis 1:1-3',
+    'agreed',
+    'what does everyone think about [Jas 1:19 NIV]?',
+    'Note to self: buy milk',
+    'that was a great sermon on Hebrews 11',
+    ':thumbsup:',
+    'the score was 2:1 at halftime',
+    'I am on chapter 4 of the book now',
+    'see you all on sunday',
+    'ratio 16:9 looks better on my monitor',
+    'good night',
+]
+
+
+def _regex_scan(pattern: Pattern[str], string: str, /) -> int:
+    count = 0
+    position = 0
+
+    while (match := pattern.search(string, position)) is not None:
+        count += 1
+        position = match.end()
+
+    return count
+
+
+def _scanner_scan(string: str, /, *, only_bracketed: bool = False) -> int:
+    return sum(
+        1 for _ in _reference_scanner.scan(string, only_bracketed=only_bracketed)
+    )
+
+
+def _prefiltered_scan(string: str, /, *, only_bracketed: bool = False) -> int:
+    if not could_contain_reference(string, only_bracketed=only_bracketed):
+        return 0
+
+    return _scanner_scan(string, only_bracketed=only_bracketed)
+
+
+def _report_prefilter(number: int, /, *, only_bracketed: bool) -> None:
+    rejected = sum(
+        not could_contain_reference(message, only_bracketed=only_bracketed)
+        for message in _messages
+    )
+    times = [
+        timeit.timeit(
+            lambda scan=scan: [
+                scan(message, only_bracketed=only_bracketed) for message in _messages
+            ],
+            number=number,
+        )
+        / (number * len(_messages))
+        * 100_000
+        for scan in (_scanner_scan, _prefiltered_scan)
+    ]
+
+    click.echo(
+        f'prefilter (only_bracketed={only_bracketed}): rejects '
+        f'{rejected}/{len(_messages)} ({rejected / len(_messages):.0%}) messages, '
+        f'{times[0] * 1e3:.1f}ms -> {times[1] * 1e3:.1f}ms per 100k messages'
+    )
+
+
+@click.command()
+@click.option('--number', default=200, help='Passes over the sample messages')
+def main(number: int) -> None:
+    for message in _messages:
+        if _regex_scan(_reference_or_bracketed_with_version_re, message) != (
+            _scanner_scan(message)
+        ):
+            raise click.ClickException(f'Scanner and regex disagree on {message!r}')
+
+    regex_time = timeit.timeit(
+        lambda: [
+            _regex_scan(_reference_or_bracketed_with_version_re, message)
+            for message in _messages
+        ],
+        number=number,
+    )
+    scanner_time = timeit.timeit(
+        lambda: [_scanner_scan(message) for message in _messages], number=number
+    )
+    count = number * len(_messages)
+
+    click.echo(f'regex:   {regex_time / count * 1e6:8.2f} \N{MICRO SIGN}s/message')
+    click.echo(f'scanner: {scanner_time / count * 1e6:8.2f} \N{MICRO SIGN}s/message')
+    click.echo(f'speedup: {regex_time / scanner_time:8.1f}x')
+
+    _report_prefilter(number, only_bracketed=False)
+    _report_prefilter(number, only_bracketed=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import asyncio
+import timeit
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Final
+
+import click
+import pendulum
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from erasmus.db import bible, confession, passage
+from erasmus.db.bible import BibleVersion, DailyBread, GuildPref, UserPref
+from erasmus.db.confession import Confession, Section
+from erasmus.db.passage import StoredPassage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy import Executable
+
+type _Case = tuple[Callable[[], Executable], Executable, dict[str, Any]]
+
+_now: Final = pendulum.now(pendulum.UTC)
+
+# Each case is the statement as it was built on every call before being cached,
+# the cached statement and the parameters for the cached statement
+_cases: Final[dict[str, _Case]] = {
+    'BibleVersion.get_by_command': (
+        lambda: select(BibleVersion).where(BibleVersion.command == 'esv'),
+        bible._select_bible_by_command,
+        {'command': 'esv'},
+    ),
+    'BibleVersion.get_by_abbr': (
+        lambda: select(BibleVersion).where(
+            func.lower(BibleVersion.command) == func.lower('esv')
+        ),
+        bible._select_bible_by_abbr,
+        {'abbr': 'esv'},
+    ),
+    'PreferenceCache.get': (
+        lambda: select(
+            select(UserPref.bible_id).where(UserPref.user_id == 1).scalar_subquery(),
+            select(GuildPref.bible_id).where(GuildPref.guild_id == 1).scalar_subquery(),
+        ),
+        bible._select_preferences,
+        {'user_id': 1, 'guild_id': 1},
+    ),
+    'DailyBread.scheduled': (
+        lambda: select(DailyBread).where(DailyBread.next_scheduled <= _now),
+        bible._select_scheduled_daily_breads,
+        {'now': _now},
+    ),
+    'Confession.get_section': (
+        lambda: (
+            select(Section)
+            .where(Section.confession_id == 1)
+            .where(Section.number == 1)
+            .where(Section.subsection_number == 1)
+            .limit(1)
+        ),
+        confession._select_subsection,
+        {'confession_id': 1, 'number': 1, 'subsection_number': 1},
+    ),
+    'Confession.get_by_command': (
+        lambda: (
+            select(Confession)
+            .where(Confession.command == 'wcf')
+            .options(selectinload(Confession.sections))
+            .limit(1)
+        ),
+        confession._select_confession_with_sections_by_command,
+        {'command': 'wcf'},
+    ),
+    'StoredPassage.get': (
+        lambda: (
+            select(StoredPassage)
+            .where(StoredPassage.bible_id == 1)
+            .where(StoredPassage.osis == 'John.3.16')
+            .where(StoredPassage.expires_at > _now)
+        ),
+        passage._select_stored_passage,
+        {'bible_id': 1, 'osis': 'John.3.16', 'now': _now},
+    ),
+}
+
+
+def _report(name: str, before: float, after: float, /) -> None:
+    click.echo(f'{name:>28}: {before * 1e6:8.1f} -> {after * 1e6:8.1f} \N{MICRO SIGN}s')
+
+
+def _benchmark_construction(number: int, /) -> None:
+    # The Python-side work that caching removes: building the statement and
+    # generating the cache key SQLAlchemy uses to find its compiled form
+    click.echo('Statement construction and cache key, per call:')
+
+    for name, (build, cached, _) in _cases.items():
+        before = timeit.timeit(
+            lambda build=build: build()._generate_cache_key(),  # pyright: ignore[reportPrivateUsage]
+            number=number,
+        )
+        after = timeit.timeit(
+            lambda cached=cached: cached._generate_cache_key(),  # pyright: ignore[reportPrivateUsage]
+            number=number,
+        )
+        _report(name, before / number, after / number)
+
+
+async def _benchmark_database(db_url: str, number: int, /) -> None:
+    engine = create_async_engine(db_url)
+    sessionmaker = async_sessionmaker(engine)
+
+    click.echo('Execution against the database, per call:')
+
+    try:
+        async with sessionmaker() as session:
+            for name, (build, cached, params) in _cases.items():
+                # Warm up the compiled cache and asyncpg's prepared statements
+                await session.execute(build())
+                await session.execute(cached, params)
+
+                start = perf_counter()
+
+                for _ in range(number):
+                    await session.execute(build())
+
+                before = perf_counter() - start
+                start = perf_counter()
+
+                for _ in range(number):
+                    await session.execute(cached, params)
+
+                after = perf_counter() - start
+                _report(name, before / number, after / number)
+    finally:
+        await engine.dispose()
+
+
+@click.command()
+@click.option('--number', default=10000, help='Calls per statement')
+@click.option(
+    '--db-url',
+    default=None,
+    help='A postgresql+asyncpg URL of a migrated database to also time execution',
+)
+def main(number: int, db_url: str | None) -> None:
+    _benchmark_construction(number)
+
+    if db_url is not None:
+        asyncio.run(_benchmark_database(db_url, number))
+
+
+if __name__ == '__main__':
+    main()
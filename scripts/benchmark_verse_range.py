@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+from __future__ import annotations
+
+import timeit
+from typing import Final
+
+import click
+from attrs import frozen
+
+from erasmus.data import BookTable, VerseRange
+
+
+@frozen
+class _Bible:
+    name: str
+    book_table: BookTable | None
+
+
+_references: Final = [
+    'John 3:16',
+    'Genesis 1:1-3',
+    'Romans 8:28',
+    '1 Cor 13:4-7',
+    'Psalm 119:105',
+    'Matthew 5:3-7:29',
+    'Song of Three Young Men 1:1',
+]
+_bible: Final = _Bible(
+    'Example Bible', BookTable.from_mapping('Example Bible', {'PrAzar': 'Dan'})
+)
+
+
+def _lookup_key(reference: str, /) -> int:
+    verses = VerseRange.from_string(reference)
+    return hash((1, verses.for_bible(_bible).with_version(None)))
+
+
+@click.command()
+@click.option('--number', default=20000, help='Passes over the sample references')
+def main(number: int) -> None:
+    count = number * len(_references)
+    steps = {
+        'parse': lambda: [VerseRange.from_string(ref) for ref in _references],
+        'parse + for_bible + hash': lambda: [_lookup_key(ref) for ref in _references],
+    }
+    ranges = [VerseRange.from_string(ref) for ref in _references]
+    steps |= {
+        'for_bible': lambda: [verses.for_bible(_bible) for verses in ranges],
+        'with_version': lambda: [verses.with_version(None) for verses in ranges],
+        'hash': lambda: [hash(verses) for verses in ranges],
+        'eq': lambda: [verses == verses.with_version(None) for verses in ranges],
+    }
+
+    for name, step in steps.items():
+        seconds = timeit.timeit(step, number=number)
+        click.echo(f'{name:>25}: {seconds / count * 1e9:8.0f} ns/reference')
+
+
+if __name__ == '__main__':
+    main()
@@ -11,7 +11,7 @@ from erasmus.cogs.bible.daily_bread.daily_bread_group import (
     DailyBreadGroup,
     PassageFetcher,
 )
-from erasmus.data import SectionFlag, VerseRange
+from erasmus.data import BookTable, SectionFlag, VerseRange
 from erasmus.exceptions import (
     BookNotInVersionError,
     DoNotUnderstandError,
@@ -42,6 +42,10 @@ class MockBible:
     books: SectionFlag = SectionFlag.OT | SectionFlag.NT
     book_mapping: dict[str, str] | None = None
 
+    @property
+    def book_table(self) -> BookTable | None:
+        return BookTable.from_mapping(self.name, self.book_mapping)
+
 
 @pytest.fixture
 def mock_service_manager(mocker: MockerFixture) -> NonCallableMock:
@@ -88,7 +92,6 @@ class TestPassageFetcher:
 
         assert fetcher.verse_range == VerseRange.from_string('Genesis 1:2')
         assert fetcher.service_manager is mock_service_manager
-        assert fetcher.passage_map == {}
 
     async def test_call(
         self,
@@ -111,29 +114,6 @@ class TestPassageFetcher:
             ]
         )
 
-    async def test_call_cached(
-        self,
-        mocker: MockerFixture,
-        mock_service_manager: Mock,
-        bible1: Bible,
-        bible2: Bible,
-    ) -> None:
-        fetcher = PassageFetcher(
-            VerseRange.from_string('Genesis 1:2'), mock_service_manager
-        )
-
-        await fetcher(bible2)
-        await fetcher(bible1)
-        assert (await fetcher(bible2)) is mocker.sentinel.get_passage_return_1
-        assert (await fetcher(bible1)) is mocker.sentinel.get_passage_return_2
-
-        mock_service_manager.get_passage.assert_has_awaits(
-            [
-                mocker.call(bible2, VerseRange.from_string('Genesis 1:2')),
-                mocker.call(bible1, VerseRange.from_string('Genesis 1:2')),
-            ]
-        )
-
 
 class TestDailyBreadGroup:
     @pytest.fixture
@@ -612,8 +592,12 @@ class TestDailyBreadGroup:
                 ),
             ]
         )
-        mock_service_manager.get_passage.assert_awaited_once_with(
-            bible1, VerseRange.from_string('Psalm 18:1-2')
+        # Repeated lookups are deduplicated by the service manager's passage cache
+        mock_service_manager.get_passage.assert_has_awaits(
+            [
+                mocker.call(bible1, VerseRange.from_string('Psalm 18:1-2')),
+                mocker.call(bible1, VerseRange.from_string('Psalm 18:1-2')),
+            ]
         )
         mock_send_passage.assert_has_awaits(
             [
@@ -625,7 +609,7 @@ class TestDailyBreadGroup:
                 ),
                 mocker.call(
                     mocker.sentinel.webhook_2,
-                    mocker.sentinel.get_passage_return_1,
+                    mocker.sentinel.get_passage_return_2,
                     thread=discord.utils.MISSING,
                     avatar_url='https://i.imgur.com/XQ8N2vH.png',
                 ),
@@ -701,8 +685,12 @@ class TestDailyBreadGroup:
                 ),
             ]
         )
-        mock_service_manager.get_passage.assert_awaited_once_with(
-            bible1, VerseRange.from_string('Psalm 18:1-2')
+        # Repeated lookups are deduplicated by the service manager's passage cache
+        mock_service_manager.get_passage.assert_has_awaits(
+            [
+                mocker.call(bible1, VerseRange.from_string('Psalm 18:1-2')),
+                mocker.call(bible1, VerseRange.from_string('Psalm 18:1-2')),
+            ]
         )
         mock_send_passage.assert_has_awaits(
             [
@@ -714,7 +702,7 @@ class TestDailyBreadGroup:
                 ),
                 mocker.call(
                     mocker.sentinel.webhook_2,
-                    mocker.sentinel.get_passage_return_1,
+                    mocker.sentinel.get_passage_return_2,
                     thread=discord.utils.MISSING,
                     avatar_url='https://i.imgur.com/XQ8N2vH.png',
                 ),
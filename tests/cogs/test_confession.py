@@ -4,12 +4,20 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from erasmus.cogs.confession import Confession
+from erasmus.cogs.confession import Confession, _confession_lookup, _ConfessionOption
+from erasmus.db import (
+    Confession as ConfessionRecord,
+    ConfessionType,
+    NumberingType,
+    Section,
+)
 from erasmus.erasmus import Erasmus
+from erasmus.exceptions import NoSectionError
 from erasmus.l10n import Localizer
 from erasmus.types import Refreshable
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from unittest.mock import Mock
 
     from ..types import MockerFixture
@@ -25,3 +33,115 @@ class TestConfession:
         cog = Confession(mock_bot)
         assert cog is not None
         assert isinstance(cog, Refreshable)
+
+    async def test_refresh(self, mocker: MockerFixture, mock_bot: Erasmus) -> None:
+        record = ConfessionRecord(
+            command='wcf',
+            name='Westminster Confession of Faith',
+            type=ConfessionType.CHAPTERS,
+            numbering=NumberingType.ROMAN,
+            _subsection_numbering=None,
+        )
+        record.id = 1
+        record.sections = []
+
+        async def get_all(
+            *args: object, **kwargs: object
+        ) -> AsyncIterator[ConfessionRecord]:
+            yield record
+
+        mocker.patch.object(ConfessionRecord, 'get_all', get_all)
+        cog = Confession(mock_bot)
+
+        await cog.refresh(mocker.NonCallableMock())
+
+        assert cog.confessions == {1: record}
+        assert _confession_lookup.get('wcf') is not None
+
+        await cog.cog_unload()
+
+        assert cog.confessions == {}
+        assert _confession_lookup.get('wcf') is None
+
+
+def _section(
+    number: int, subsection_number: int | None, title: str | None, text: str, /
+) -> Section:
+    section = Section(
+        confession_id=1,
+        number=number,
+        subsection_number=subsection_number,
+        title=title,
+        text=text,
+    )
+    section.text_stripped = text
+    return section
+
+
+class TestConfessionOption:
+    @pytest.fixture
+    def option(self) -> _ConfessionOption:
+        confession = ConfessionRecord(
+            command='wcf',
+            name='Westminster Confession of Faith',
+            type=ConfessionType.CHAPTERS,
+            numbering=NumberingType.ROMAN,
+            _subsection_numbering=NumberingType.ARABIC,
+        )
+        confession.sections = [
+            _section(1, 1, None, 'Although the light of nature...'),
+            _section(1, 2, None, 'Under the name of Holy Scripture...'),
+            _section(2, 1, None, 'There is but one only, living, and true God...'),
+        ]
+        return _ConfessionOption.create(confession)
+
+    def test_cite(self, option: _ConfessionOption) -> None:
+        assert option.cite(1, 2) == (
+            None,
+            '**I.2**. Under the name of Holy Scripture...',
+        )
+
+    def test_cite_chapter(self, option: _ConfessionOption) -> None:
+        assert option.cite(1) == option.cite(1, 1)
+        assert option.cite(1) == (None, '**I.1**. Although the light of nature...')
+        assert option.cite(2) == (
+            None,
+            '**II.1**. There is but one only, living, and true God...',
+        )
+
+    def test_cite_numbered_sections(self) -> None:
+        confession = ConfessionRecord(
+            command='wsc',
+            name='Westminster Shorter Catechism',
+            type=ConfessionType.QA,
+            numbering=NumberingType.ARABIC,
+            _subsection_numbering=None,
+        )
+        confession.sections = [
+            _section(1, None, 'What is the chief end of man?', 'To glorify God.'),
+        ]
+        option = _ConfessionOption.create(confession)
+
+        assert option.cite(1) == ('1. What is the chief end of man?', 'To glorify God.')
+
+    @pytest.mark.parametrize(
+        'number,subsection_number,expected_section',
+        [(3, None, '3'), (1, 3, '1.3')],
+    )
+    def test_cite_no_section(
+        self,
+        option: _ConfessionOption,
+        number: int,
+        subsection_number: int | None,
+        expected_section: str,
+    ) -> None:
+        with pytest.raises(NoSectionError) as exc_info:
+            option.cite(number, subsection_number)
+
+        assert exc_info.value.confession == 'Westminster Confession of Faith'
+        assert exc_info.value.section == expected_section
+        assert exc_info.value.section_type == 'CHAPTERS'
+
+    def test_citations_immutable(self, option: _ConfessionOption) -> None:
+        with pytest.raises(TypeError):
+            option.citations[2, None] = (None, '')  # pyright: ignore[reportIndexIssue]
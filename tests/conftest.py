@@ -7,6 +7,8 @@ import aiohttp
 import pytest
 from attrs import define
 
+from erasmus.data import BookTable
+
 from .utils import create_async_context_manager
 
 if TYPE_CHECKING:
@@ -31,6 +33,10 @@ class MockBible:
     rtl: bool = False
     book_mapping: dict[str, str] | None = None
 
+    @property
+    def book_table(self) -> BookTable | None:
+        return BookTable.from_mapping(self.name, self.book_mapping)
+
 
 @pytest.fixture(name='MockBible', scope='session')
 def fixture_MockBible() -> type[MockBible]:
@@ -0,0 +1,378 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from erasmus.data import Book
+from erasmus.db.bible import (
+    BibleVersion,
+    BibleVersionRegistry,
+    PreferenceCache,
+    bible_versions,
+    preference_cache,
+)
+from erasmus.exceptions import BookMappingInvalid, InvalidVersionError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+    from unittest.mock import NonCallableMock
+
+    from pytest_mock import MockerFixture
+
+
+def _create(
+    command: str = 'lxx',
+    book_mapping: dict[str, str] | None = None,
+    /,
+    *,
+    id: int = 1,
+) -> BibleVersion:
+    bible = BibleVersion.create(
+        command=command,
+        name=f'{command.upper()} Bible',
+        abbr=command.upper(),
+        service='MyService',
+        service_version=command,
+        books='OT',
+        rtl=False,
+        book_mapping=book_mapping,
+    )
+    bible.id = id
+    return bible
+
+
+def _compile_sql(mock: NonCallableMock) -> str:
+    stmt, *params = mock.call_args.args
+
+    if params:
+        stmt = stmt.params(params[0])
+
+    return str(
+        stmt.compile(dialect=asyncpg.dialect(), compile_kwargs={'literal_binds': True})
+    )
+
+
+def _create_session(
+    mocker: MockerFixture, method: str, result: str, value: object, /
+) -> NonCallableMock:
+    mock_result = mocker.NonCallableMock()
+    mock_result.configure_mock(**{f'{result}.return_value': value})
+    session = mocker.NonCallableMock()
+    session.attach_mock(mocker.AsyncMock(return_value=mock_result), method)
+    return session
+
+
+@pytest.fixture
+def mock_session(mocker: MockerFixture) -> NonCallableMock:
+    return _create_session(mocker, 'execute', 'one', (None, None))
+
+
+class TestBibleVersion:
+    @pytest.fixture
+    def registry(self) -> Iterator[BibleVersionRegistry]:
+        bible_versions.set(
+            [_create('esv', id=1), _create('KJV', id=2), _create('nasb', id=3)]
+        )
+        yield bible_versions
+        bible_versions.clear()
+        preference_cache.clear()
+
+    def test_book_table(self) -> None:
+        bible = _create('lxx', {'Dan': 'DanGr'})
+
+        assert bible.book_table is not None
+        assert bible.book_table[Book.from_name('Daniel')].osis == 'DanGr'
+
+        bible.book_mapping = None
+
+        assert bible.book_table is None
+
+    def test_book_table_loaded(self) -> None:
+        bible = BibleVersion.__new__(BibleVersion)
+        bible.__dict__.update(name='Septuagint', book_mapping={'Esth': 'EsthGr'})
+
+        assert bible.book_table is not None
+        assert bible.book_table[Book.from_name('Esther')].osis == 'EsthGr'
+
+    def test_book_mapping_invalid(self) -> None:
+        with pytest.raises(BookMappingInvalid):
+            _create('lxx', {'John': 'HPotter'})
+
+        bible = _create()
+
+        with pytest.raises(BookMappingInvalid):
+            bible.book_mapping = {'John': 'HPotter'}
+
+    @pytest.mark.parametrize(
+        'user_bible_id,guild_bible_id,expected_command',
+        [
+            (None, None, 'esv'),
+            (2, None, 'KJV'),
+            (None, 3, 'nasb'),
+            (2, 3, 'KJV'),
+            (42, 3, 'nasb'),
+        ],
+    )
+    async def test_get_for(
+        self,
+        mocker: MockerFixture,
+        registry: BibleVersionRegistry,
+        mock_session: NonCallableMock,
+        user_bible_id: int | None,
+        guild_bible_id: int | None,
+        expected_command: str,
+    ) -> None:
+        mock_session.execute.return_value.one.return_value = (
+            user_bible_id,
+            guild_bible_id,
+        )
+
+        bible = await BibleVersion.get_for(
+            mock_session,
+            user=mocker.NonCallableMock(id=10),
+            guild=mocker.NonCallableMock(id=20),
+        )
+
+        assert bible is registry.get_by_command(expected_command)
+
+    async def test_get_for_query_count(
+        self,
+        mocker: MockerFixture,
+        registry: BibleVersionRegistry,
+        mock_session: NonCallableMock,
+    ) -> None:
+        user = mocker.NonCallableMock(id=10)
+        other_user = mocker.NonCallableMock(id=11)
+        guild = mocker.NonCallableMock(id=20)
+        mock_session.execute.return_value.one.return_value = (None, 3)
+
+        for _ in range(3):
+            bible = await BibleVersion.get_for(mock_session, user=user, guild=guild)
+            assert bible is registry.get(3)
+
+        assert mock_session.execute.await_count == 1
+
+        mock_session.execute.return_value.one.return_value = (2, None)
+
+        for _ in range(3):
+            bible = await BibleVersion.get_for(
+                mock_session, user=other_user, guild=guild
+            )
+            assert bible is registry.get(2)
+
+        assert mock_session.execute.await_count == 2
+        assert mock_session.execute.call_args.args[1] == {
+            'user_id': 11,
+            'guild_id': None,
+        }
+
+    @pytest.mark.parametrize(
+        'method,argument,expected_where',
+        [
+            ('get_by_command', 'kjv', "bible_versions.command = 'kjv'"),
+            (
+                'get_by_abbr',
+                'KJV',
+                "lower(bible_versions.command) = lower('KJV')",
+            ),
+        ],
+    )
+    async def test_get_by(
+        self,
+        mocker: MockerFixture,
+        method: str,
+        argument: str,
+        expected_where: str,
+    ) -> None:
+        mock_session = _create_session(
+            mocker, 'scalars', 'first', mocker.sentinel.bible
+        )
+
+        assert (
+            await getattr(BibleVersion, method)(mock_session, argument)
+            is mocker.sentinel.bible
+        )
+        assert _compile_sql(mock_session.scalars).endswith(
+            f'FROM bible_versions \nWHERE {expected_where}'
+        )
+
+    async def test_get_by_command_raises(self, mocker: MockerFixture) -> None:
+        mock_session = _create_session(mocker, 'scalars', 'first', None)
+
+        with pytest.raises(InvalidVersionError):
+            await BibleVersion.get_by_command(mock_session, 'kjv')
+
+    async def test_get_for_default(
+        self, registry: BibleVersionRegistry, mock_session: NonCallableMock
+    ) -> None:
+        assert await BibleVersion.get_for(mock_session) is registry.get(1)
+
+        mock_session.execute.assert_not_called()
+
+
+class TestBibleVersionRegistry:
+    @pytest.fixture
+    def registry(self) -> BibleVersionRegistry:
+        registry = BibleVersionRegistry()
+        registry.set([_create('esv', id=1), _create('KJV', id=2), _create('kjv', id=3)])
+        return registry
+
+    def test_iter(self, registry: BibleVersionRegistry) -> None:
+        assert [bible.command for bible in registry] == ['esv', 'KJV', 'kjv']
+        assert len(registry) == 3
+
+    def test_get(self, registry: BibleVersionRegistry) -> None:
+        assert registry.get(2) is not None
+        assert registry.get(2) is registry.get_by_command('KJV')
+        assert registry.get(42) is None
+        assert registry.get(None) is None
+
+    def test_get_by_command(self, registry: BibleVersionRegistry) -> None:
+        assert registry.get_by_command('kjv').id == 3
+
+        with pytest.raises(InvalidVersionError) as exc_info:
+            registry.get_by_command('ESV')
+
+        assert exc_info.value.version == 'ESV'
+
+    def test_get_by_abbr(self, registry: BibleVersionRegistry) -> None:
+        assert registry.get_by_abbr('ESV') is registry.get(1)
+        assert registry.get_by_abbr('kJv') is registry.get(2)
+        assert registry.get_by_abbr('nasb') is None
+
+    def test_resolve(self, registry: BibleVersionRegistry) -> None:
+        registry.set([*registry, _create('lxx', id=4)])
+
+        assert registry.resolve() is registry.get(1)
+        assert registry.resolve(None, 4) is registry.get(4)
+        assert registry.resolve(2, 4) is registry.get(2)
+        assert registry.resolve(42, None) is registry.get(1)
+
+    def test_resolve_no_default(self) -> None:
+        with pytest.raises(InvalidVersionError):
+            BibleVersionRegistry().resolve(1)
+
+    def test_set_builds_book_tables(self) -> None:
+        bible = BibleVersion.__new__(BibleVersion)
+        bible.__dict__.update(
+            id=4, command='lxx', name='Septuagint', book_mapping={'Esth': 'EsthGr'}
+        )
+        invalid = BibleVersion.__new__(BibleVersion)
+        invalid.__dict__.update(
+            id=5, command='bad', name='Bad', book_mapping={'John': 'HPotter'}
+        )
+        registry = BibleVersionRegistry()
+
+        registry.set([bible, invalid])
+
+        assert bible.__dict__['book_table'] is not None
+        assert 'book_table' not in invalid.__dict__
+        assert registry.get(5) is invalid
+
+    def test_clear(self, registry: BibleVersionRegistry) -> None:
+        registry.clear()
+
+        assert len(registry) == 0
+        assert registry.get(1) is None
+        assert registry.get_by_abbr('esv') is None
+
+    async def test_refresh(self, mocker: MockerFixture) -> None:
+        versions = [_create('esv', id=1), _create('kjv', id=2)]
+
+        async def get_all(
+            *args: object, **kwargs: object
+        ) -> AsyncIterator[BibleVersion]:
+            for version in versions:
+                yield version
+
+        mock_get_all = mocker.patch(
+            'erasmus.db.bible.BibleVersion.get_all', side_effect=get_all
+        )
+        registry = BibleVersionRegistry()
+        session = mocker.NonCallableMock()
+
+        await registry.refresh(session)
+
+        mock_get_all.assert_called_once_with(session, ordered=True)
+        assert list(registry) == versions
+
+
+class TestPreferenceCache:
+    async def test_get(self, mock_session: NonCallableMock) -> None:
+        cache = PreferenceCache()
+        mock_session.execute.return_value.one.return_value = (2, None)
+
+        assert await cache.get(mock_session, 10, 20) == (2, None)
+        assert _compile_sql(mock_session.execute) == (
+            'SELECT (SELECT user_prefs.bible_id \n'
+            'FROM user_prefs \n'
+            'WHERE user_prefs.user_id = 10) AS anon_1, '
+            '(SELECT guild_prefs.bible_id \n'
+            'FROM guild_prefs \n'
+            'WHERE guild_prefs.guild_id = 20) AS anon_2'
+        )
+
+        mock_session.execute.reset_mock()
+
+        assert await cache.get(mock_session, 10, 20) == (2, None)
+        mock_session.execute.assert_not_called()
+
+    async def test_get_partial(self, mock_session: NonCallableMock) -> None:
+        cache = PreferenceCache()
+        cache.users.set(10, 2)
+        mock_session.execute.return_value.one.return_value = (None, 3)
+
+        assert await cache.get(mock_session, 10, 20) == (2, 3)
+        assert mock_session.execute.call_args.args[1] == {
+            'user_id': None,
+            'guild_id': 20,
+        }
+
+    async def test_get_set_while_loading(self, mock_session: NonCallableMock) -> None:
+        cache = PreferenceCache()
+        result = mock_session.execute.return_value
+
+        async def execute(*args: object) -> object:
+            cache.set_user(10, 5)
+            cache.set_guild(20, None)
+            return result
+
+        mock_session.execute.side_effect = execute
+        result.one.return_value = (2, 3)
+
+        assert await cache.get(mock_session, 10, 20) == (5, None)
+        assert await cache.get(mock_session, 10, 20) == (5, None)
+        mock_session.execute.assert_awaited_once()
+
+    async def test_get_set_other_while_loading(
+        self, mock_session: NonCallableMock
+    ) -> None:
+        cache = PreferenceCache()
+        result = mock_session.execute.return_value
+
+        async def execute(*args: object) -> object:
+            cache.set_user(11, 5)
+            return result
+
+        mock_session.execute.side_effect = execute
+        result.one.return_value = (2, None)
+
+        assert await cache.get(mock_session, 10, None) == (2, None)
+        assert 10 not in cache.users
+
+    async def test_get_none(self, mock_session: NonCallableMock) -> None:
+        cache = PreferenceCache()
+
+        assert await cache.get(mock_session, None, None) == (None, None)
+        mock_session.execute.assert_not_called()
+
+    async def test_clear(self, mock_session: NonCallableMock) -> None:
+        cache = PreferenceCache()
+        cache.users.set(10, 2)
+        cache.guilds.set(20, None)
+        cache.clear()
+
+        assert await cache.get(mock_session, 10, 20) == (None, None)
+        mock_session.execute.assert_awaited_once()
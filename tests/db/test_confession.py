@@ -6,14 +6,16 @@ from typing import TYPE_CHECKING, Any
 import pytest
 from aioitertools.builtins import list as _alist
 from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.orm.context import FromStatement
 from sqlalchemy.orm.strategy_options import Load
 from sqlalchemy.sql.selectable import Select
 
-from erasmus.db.confession import Confession
+from erasmus.db.confession import Confession, Section, search_cache
 from erasmus.db.enums import ConfessionType, NumberingType
 from erasmus.exceptions import InvalidConfessionError, NoSectionError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from unittest.mock import NonCallableMagicMock, NonCallableMock
 
     from pytest_mock import MockerFixture
@@ -21,12 +23,106 @@ if TYPE_CHECKING:
 
 
 def _compile_sql(mock: NonCallableMock) -> Compiled:
-    return mock.call_args.args[0].compile(
+    stmt, *params = mock.call_args.args
+
+    if isinstance(stmt, FromStatement):
+        stmt = stmt.element
+
+    if params:
+        stmt = stmt.params(params[0])
+
+    return stmt.compile(
         dialect=asyncpg.dialect(), compile_kwargs={'literal_binds': True}
     )
 
 
+class TestSection:
+    @pytest.fixture(autouse=True)
+    def clear_search_cache(self) -> Iterator[None]:
+        yield
+        search_cache.clear()
+
+    @pytest.mark.parametrize(
+        'confession_id,expected_count_where,expected_where',
+        [
+            (
+                None,
+                'confession_sections.search_vector @@ '
+                "plainto_tsquery('english', 'light of nature')",
+                'confession_sections.search_vector @@ '
+                "plainto_tsquery('english', 'light of nature')",
+            ),
+            (
+                42,
+                'confession_sections.confession_id = 42 AND '
+                '(confession_sections.search_vector @@ '
+                "plainto_tsquery('english', 'light of nature'))",
+                '(confession_sections.search_vector @@ '
+                "plainto_tsquery('english', 'light of nature')) AND "
+                'confession_sections.confession_id = 42',
+            ),
+        ],
+        ids=['all confessions', 'one confession'],
+    )
+    async def test_search_ranked(
+        self,
+        mocker: MockerFixture,
+        confession_id: int | None,
+        expected_count_where: str,
+        expected_where: str,
+    ) -> None:
+        mock_session = mocker.NonCallableMock(
+            scalar=mocker.AsyncMock(return_value=40),
+            scalars=mocker.AsyncMock(
+                return_value=[mocker.sentinel.section_one, mocker.sentinel.section_two]
+            ),
+        )
+
+        page = await Section.search_ranked(
+            mock_session,
+            'Light of nature',
+            limit=5,
+            offset=5,
+            confession_id=confession_id,
+        )
+
+        assert page.total == 40
+        assert list(page) == [mocker.sentinel.section_one, mocker.sentinel.section_two]
+        assert str(_compile_sql(mock_session.scalar)) == (
+            'SELECT count(*) AS count_1 \n'
+            'FROM confession_sections \n'
+            f'WHERE {expected_count_where}'
+        )
+        assert str(_compile_sql(mock_session.scalars)).endswith(
+            'FROM confession_sections \n'
+            f'WHERE {expected_where} '
+            'ORDER BY ts_rank_cd(confession_sections.search_vector, '
+            "plainto_tsquery('english', 'light of nature')) DESC, "
+            'confession_sections.id ASC \n'
+            ' LIMIT 5 OFFSET 5) AS anon_1 '
+            'ORDER BY ts_rank_cd(anon_1.search_vector, '
+            "plainto_tsquery('english', 'light of nature')) DESC, anon_1.id ASC"
+        )
+
+        assert (
+            await Section.search_ranked(
+                mock_session,
+                'light of nature',
+                limit=5,
+                offset=5,
+                confession_id=confession_id,
+            )
+            is page
+        )
+        mock_session.scalars.assert_awaited_once()
+
+
 class TestConfession:
+    @pytest.fixture(autouse=True)
+    def clear_search_cache(self) -> Iterator[None]:
+        yield
+        search_cache.clear()
+
     @pytest.fixture
     def confession(self) -> Confession:
         confession = Confession(
@@ -62,41 +158,74 @@ class TestConfession:
         confession._subsection_numbering = NumberingType.ROMAN
         assert confession.subsection_numbering == NumberingType.ROMAN
 
-    async def test_search(
+    @pytest.mark.parametrize(
+        'after,expected_where,expected_limit',
+        [
+            (None, '', ' \n LIMIT 5 OFFSET 10'),
+            (
+                {'number': 4, 'subsection_number': None},
+                ' AND (confession_sections.number, '
+                'coalesce(confession_sections.subsection_number, -1)) > (4, -1)',
+                ' \n LIMIT 5',
+            ),
+            (
+                {'number': 4, 'subsection_number': 2},
+                ' AND (confession_sections.number, '
+                'coalesce(confession_sections.subsection_number, -1)) > (4, 2)',
+                ' \n LIMIT 5',
+            ),
+        ],
+        ids=['offset', 'after section', 'after subsection'],
+    )
+    async def test_search_page(
         self,
         mocker: MockerFixture,
         confession: Confession,
         mock_session: NonCallableMock,
+        after: dict[str, Any] | None,
+        expected_where: str,
+        expected_limit: str,
     ) -> None:
-        results = await confession.search(mock_session, 'light of nature')
-        assert results == [
+        mock_session.scalar = mocker.AsyncMock(return_value=12)
+
+        page = await confession.search_page(
+            mock_session,
+            'Light of nature',
+            limit=5,
+            offset=10,
+            after=None if after is None else mocker.NonCallableMock(**after),
+        )
+
+        assert page.total == 12
+        assert list(page) == [
             mocker.sentinel.scalar_result_one,
             mocker.sentinel.scalar_result_two,
         ]
-
-        compiled = _compile_sql(mock_session.scalars)
-
-        assert str(compiled) == (
-            'SELECT anon_1.id, anon_1.confession_id, anon_1.number, '
-            'anon_1.subsection_number, anon_1.text, '
-            "ts_headline('english', anon_1.title, plainto_tsquery('english', "
-            "'light of nature'), 'HighlightAll=true, StartSel=*, StopSel=*') "
-            "AS title, ts_headline('english', anon_1.text_stripped, "
-            "plainto_tsquery('english', 'light of nature'), 'StartSel=**, "
-            "StopSel=**') AS text_stripped, anon_1.search_vector \n"
-            'FROM (SELECT confession_sections.id AS id, '
-            'confession_sections.confession_id AS confession_id, '
-            'confession_sections.number AS number, '
-            'confession_sections.subsection_number AS subsection_number, '
-            'confession_sections.title AS title, confession_sections.text AS text, '
-            'confession_sections.text_stripped AS text_stripped, '
-            'confession_sections.search_vector AS search_vector \n'
+        assert str(_compile_sql(mock_session.scalar)) == (
+            'SELECT count(*) AS count_1 \n'
             'FROM confession_sections \n'
             'WHERE confession_sections.confession_id = 42 AND '
             "(confession_sections.search_vector @@ plainto_tsquery('english', "
-            "'light of nature')) ORDER BY confession_sections.number ASC, "
-            'confession_sections.subsection_number ASC NULLS FIRST) AS anon_1'
+            "'light of nature'))"
+        )
+        assert str(_compile_sql(mock_session.scalars)).endswith(
+            'FROM confession_sections \n'
+            'WHERE confession_sections.confession_id = 42 AND '
+            "(confession_sections.search_vector @@ plainto_tsquery('english', "
+            f"'light of nature')){expected_where} "
+            'ORDER BY confession_sections.number ASC, '
+            'confession_sections.subsection_number ASC NULLS FIRST'
+            f'{expected_limit}) AS anon_1 '
+            'ORDER BY anon_1.number ASC, anon_1.subsection_number ASC NULLS FIRST'
+        )
+
+        assert (
+            await confession.search_page(
+                mock_session, 'light of nature', limit=5, offset=10
+            )
+            is page
         )
+        mock_session.scalars.assert_awaited_once()
 
     @pytest.mark.parametrize(
         'number,subsection_number,expected',
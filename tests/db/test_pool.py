@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.util import greenlet_spawn
+
+from erasmus.db.pool import MeteredPool, PoolMetrics
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+class TestPoolMetrics:
+    def test_record_checkout(self) -> None:
+        metrics = PoolMetrics()
+        metrics.record_checkout(0.0005, overflow=False)
+        metrics.record_checkout(0.02, overflow=True)
+        metrics.record_checkout(7.0, overflow=False)
+        metrics.record_timeout()
+
+        assert metrics.checkouts == 3
+        assert metrics.overflow_checkouts == 1
+        assert metrics.timeouts == 1
+        assert metrics.max_wait == 7.0
+        assert metrics.histogram() == [
+            ('<= 1ms', 1),
+            ('<= 5ms', 0),
+            ('<= 10ms', 0),
+            ('<= 50ms', 1),
+            ('<= 100ms', 0),
+            ('<= 500ms', 0),
+            ('<= 1s', 0),
+            ('<= 5s', 0),
+            ('> 5s', 1),
+        ]
+
+    def test_report(self) -> None:
+        metrics = PoolMetrics()
+        metrics.record_checkout(0.0123, overflow=True)
+
+        assert metrics.report() == (
+            'Checkouts: 1, using overflow: 1, timeouts: 0, max wait: 12.3ms\n'
+            '   <= 1ms: 0\n'
+            '   <= 5ms: 0\n'
+            '  <= 10ms: 0\n'
+            '  <= 50ms: 1\n'
+            ' <= 100ms: 0\n'
+            ' <= 500ms: 0\n'
+            '    <= 1s: 0\n'
+            '    <= 5s: 0\n'
+            '     > 5s: 0'
+        )
+
+    def test_reset(self) -> None:
+        metrics = PoolMetrics()
+        metrics.record_checkout(0.5, overflow=True)
+        metrics.record_timeout()
+        metrics.reset()
+
+        assert metrics.checkouts == 0
+        assert metrics.overflow_checkouts == 0
+        assert metrics.timeouts == 0
+        assert metrics.max_wait == 0.0
+        assert all(count == 0 for _, count in metrics.histogram())
+
+
+class TestMeteredPool:
+    @pytest.fixture
+    def metrics(self, mocker: MockerFixture) -> PoolMetrics:
+        metrics = PoolMetrics()
+        mocker.patch('erasmus.db.pool.pool_metrics', metrics)
+        return metrics
+
+    async def test_connect(self, mocker: MockerFixture, metrics: PoolMetrics) -> None:
+        pool = MeteredPool(mocker.Mock, pool_size=1, max_overflow=1, timeout=0.01)
+
+        first = await greenlet_spawn(pool.connect)
+        second = await greenlet_spawn(pool.connect)
+
+        with pytest.raises(PoolTimeoutError):
+            await greenlet_spawn(pool.connect)
+
+        assert metrics.checkouts == 2
+        assert metrics.overflow_checkouts == 1
+        assert metrics.timeouts == 1
+        assert metrics.report(pool).startswith(
+            'Pool size: 1, checked out: 2, checked in: 0, overflow: 1\n'
+        )
+
+        first.close()
+        second.close()
+
+        assert metrics.report(pool).startswith(
+            'Pool size: 1, checked out: 0, checked in: 1, overflow: 0\n'
+        )
+
+    async def test_connect_overflow_returned(
+        self, mocker: MockerFixture, metrics: PoolMetrics
+    ) -> None:
+        pool = MeteredPool(mocker.Mock, pool_size=2, max_overflow=1, timeout=0.01)
+        connections = [await greenlet_spawn(pool.connect) for _ in range(3)]
+
+        # The overflow connection is kept in the pool once the others come back
+        connections[1].close()
+        connections[2].close()
+        connection = await greenlet_spawn(pool.connect)
+
+        assert pool.overflow() == 1
+        assert metrics.checkouts == 4
+        assert metrics.overflow_checkouts == 1
+
+        connection.close()
+        connections[0].close()
@@ -12,6 +12,8 @@ from erasmus.services.apibible import ApiBible
 from . import ServiceTest
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     import _pytest
     import _pytest.fixtures
     import aiohttp
@@ -327,10 +329,12 @@ class TestApiBible(ServiceTest):
         return 'KJV'
 
     @pytest.fixture
-    def service(
+    async def service(
         self, config: Any, aiohttp_client_session: aiohttp.ClientSession
-    ) -> Service:
-        return ApiBible.from_config(config, aiohttp_client_session)
+    ) -> AsyncIterator[Service]:
+        service = ApiBible.from_config(config, aiohttp_client_session)
+        yield service
+        await service.close()
 
     @pytest.mark.vcr
     @pytest.mark.parametrize(
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from erasmus.services.biblegateway import BibleGateway
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+
+class TestBaseService:
+    @pytest.mark.parametrize(
+        'text,rtl,expected',
+        [
+            (
+                '  __BOLD__1.__BOLD__ In the\n\tbeginning  ',
+                False,
+                '**1.** In the beginning',
+            ),
+            ('a , b .  c ;\nd : e', False, 'a, b. c; d: e'),
+            ('a , , b , . c', False, 'a, , b, . c'),
+            ('end .', False, 'end .'),
+            ('no\xa0break\u2003em\u3000space', False, 'no break em space'),
+            (
+                '**bold** `code` __ITALIC__add__ITALIC__',
+                False,
+                r'\*\*bold\*\* \`code\` _add_',
+            ),
+            (
+                '__BOLD__12.__BOLD__ text __BOLD__13.__BOLD__ more',
+                False,
+                '**12.** text **13.** more',
+            ),
+            (
+                '__BOLD__12.__BOLD__ text __BOLD__13.__BOLD__ more',
+                True,
+                '\u202b**12.**\u202c text \u202b**13.**\u202c more',
+            ),
+            (
+                '__BOLD__a__BOLD__12.__BOLD__b__BOLD__ *3.*',
+                True,
+                '**a\u202b**12.**\u202cb** \\*3.\\*',
+            ),
+        ],
+    )
+    def test_replace_special_escapes(
+        self,
+        MockBible: type[Any],
+        mock_client_session: MagicMock,
+        text: str,
+        rtl: bool,
+        expected: str,
+    ) -> None:
+        service = BibleGateway(config={}, session=mock_client_session)
+        bible = MockBible(
+            command='bib',
+            name='The Bible',
+            abbr='BIB',
+            service='BibleGateway',
+            service_version='BIB',
+            rtl=rtl,
+        )
+
+        assert service.replace_special_escapes(bible, text) == expected
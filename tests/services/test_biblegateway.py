@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, cast
 import pytest
 
 from erasmus.data import Passage, VerseRange
-from erasmus.services.biblegateway import BibleGateway
+from erasmus.services.biblegateway import BibleGateway, _PassageParser, _SearchParser
 
 from . import Galatians_3_10_11, Mark_5_1, ServiceTest
 
@@ -303,3 +303,60 @@ class TestBibleGateway(ServiceTest):
     @pytest.fixture
     def service(self, aiohttp_client_session: aiohttp.ClientSession) -> Service:
         return BibleGateway(config={}, session=aiohttp_client_session)
+
+
+class TestParsers:
+    def test_passage(self) -> None:
+        parser = _PassageParser()
+        parser.parse(
+            '<p>Skipped</p><div class="result-text-style-normal"><h1>Title</h1>'
+            '<h3>Heading</h3><p><span class="chapternum">5 </span>'
+            '<sup class="versenum">2 </sup>The <span class="small-caps">Lord <b>said'
+            '</b></span> &amp; &#147;hi&#x201d;<sup class="footnote">[a]</sup>'
+            '<br/><i>x</i>\n  \n<span class="selah">Selah</span>'
+            '<script>var a = "<b>";</script><!-- comment --></div>'
+            '<div class="result-text-style-rtl">Second</div>'
+        )
+
+        assert parser.verse_text is not None
+        assert parser.verse_text.get_text() == (
+            '__BOLD__1.__BOLD__ __BOLD__2.__BOLD__ The LORD __BOLD__SAID__BOLD__ & '
+            '\u201chi\u201d\n__ITALIC__x__ITALIC__\n__ITALIC__Selah__ITALIC__'
+        )
+
+    def test_passage_small_caps(self) -> None:
+        parser = _PassageParser()
+        parser.parse(
+            '<div class="result-text-style-normal"><span class="small-caps">Lord '
+            '<span><b>God</b> of <i>hosts</i></span></span> <b class="small-caps">'
+            'Lord</b> <sup class="versenum"><i>3</i> </sup>x</div>'
+        )
+
+        assert parser.verse_text is not None
+        assert parser.verse_text.get_text() == (
+            'LORD __BOLD__GOD__BOLD__ OF __ITALIC__HOSTS__ITALIC__ '
+            '__BOLD__LORD__BOLD__ __BOLD__3.__BOLD__ x'
+        )
+
+    def test_passage_missing(self) -> None:
+        parser = _PassageParser()
+        parser.parse('<div class="result-text-style">Text</div>')
+
+        assert parser.verse_text is None
+
+    def test_search(self) -> None:
+        parser = _SearchParser()
+        parser.parse(
+            '<div class="showing-results"> 12 <b>results</b> for x</div>'
+            '<div class="search-result-list"><article class="bible-item">'
+            '<div class="bible-item-extras">John 3:16</div>'
+            '<div class="bible-item-title">John 3:16</div>'
+            '<div class="bible-item-text"><h3>Heading</h3>For God</div></article>'
+            '</div>'
+        )
+
+        assert parser.total == '12 results for x'
+        assert [
+            (''.join(item.title or ()), item.verse_text and item.verse_text.get_text())
+            for item in parser.items
+        ] == [('John 3:16', '__ITALIC__Heading__ITALIC__For God')]
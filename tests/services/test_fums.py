@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import aiohttp
+import pytest
+
+from erasmus.services.fums import FumsReporter
+
+from ..utils import create_async_context_manager
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from ..types import MockerFixture
+
+
+@pytest.fixture
+def mock_session(mocker: MockerFixture) -> MagicMock:
+    return mocker.MagicMock(
+        **{
+            'get.return_value': create_async_context_manager(
+                mocker, mocker.NonCallableMock(read=mocker.AsyncMock())
+            )
+        }
+    )
+
+
+def _requested(mock_session: MagicMock, /) -> list[str]:
+    return [call.args[0] for call in mock_session.get.call_args_list]
+
+
+class TestFumsReporter:
+    async def test_report(self, mock_session: MagicMock) -> None:
+        reporter = FumsReporter(mock_session)
+
+        reporter.report('https://fums.example/nf1?t=1')
+
+        mock_session.get.assert_not_called()
+
+        await reporter.close()
+
+        assert _requested(mock_session) == ['https://fums.example/nf1?t=1']
+
+    async def test_report_batches(self, mock_session: MagicMock) -> None:
+        reporter = FumsReporter(mock_session, batch_size=2)
+
+        for url in ['a', 'b', 'a', 'c']:
+            reporter.report(url)
+
+        await reporter.close()
+
+        assert _requested(mock_session) == ['a', 'b', 'a', 'c']
+
+    async def test_report_deduplicates(self, mock_session: MagicMock) -> None:
+        reporter = FumsReporter(mock_session)
+
+        for url in ['a', 'b', 'a', 'c']:
+            reporter.report(url)
+
+        await reporter.close()
+
+        assert _requested(mock_session) == ['a', 'b', 'c']
+
+    async def test_report_queue_full(self, mock_session: MagicMock) -> None:
+        reporter = FumsReporter(mock_session, queue_size=2)
+
+        for url in ['a', 'b', 'c']:
+            reporter.report(url)
+
+        await reporter.close()
+
+        assert _requested(mock_session) == ['a', 'b']
+
+    async def test_report_error(self, mock_session: MagicMock) -> None:
+        response = mock_session.get.return_value
+        mock_session.get.side_effect = [aiohttp.ClientError(), response]
+        reporter = FumsReporter(mock_session, batch_size=1)
+
+        reporter.report('a')
+        reporter.report('b')
+        await reporter.close()
+
+        assert _requested(mock_session) == ['a', 'b']
+        response.__aenter__.return_value.read.assert_awaited_once_with()
+
+    async def test_close_timeout(
+        self, mocker: MockerFixture, mock_session: MagicMock
+    ) -> None:
+        never = asyncio.Event()
+        mock_session.get.return_value.__aenter__.return_value.read = mocker.AsyncMock(
+            side_effect=never.wait
+        )
+        reporter = FumsReporter(mock_session, flush_timeout=0.01)
+
+        reporter.report('a')
+        await reporter.close()
+
+        assert _requested(mock_session) == ['a']
+
+    async def test_close_unused(self, mock_session: MagicMock) -> None:
+        await FumsReporter(mock_session).close()
+
+        mock_session.get.assert_not_called()
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from erasmus.data import Passage, SearchResults, VerseRange
+from erasmus.exceptions import (
+    BibleNotSupportedError,
+    BookNotInVersionError,
+    DoNotUnderstandError,
+)
+from erasmus.services.localbible import LocalBible, build_corpus
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import MagicMock
+
+_verses = [
+    ('Gen', 1, 1, 'In the beginning God created the heaven and the earth.'),
+    ('Gen', 1, 2, 'And the earth was without form, and void.'),
+    ('Gen', 2, 1, 'Thus the heavens and the earth were finished.'),
+    ('Dan', 3, 23, 'And these three men fell down bound.'),
+    ('John', 3, 16, 'For God so loved the world, that he gave his only begotten Son'),
+    ('John', 3, 17, 'For God sent not his Son into the world to condemn the world'),
+    ('Gal', 3, 10, 'for it is written, Cursed __ITALIC__is__ITALIC__ every one'),
+]
+
+
+class TestLocalBible:
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path) -> Path:
+        build_corpus(tmp_path / 'KJV.bin', _verses)
+        return tmp_path
+
+    @pytest.fixture
+    def service(self, data_dir: Path, mock_client_session: MagicMock) -> LocalBible:
+        return LocalBible.from_config({'data_dir': str(data_dir)}, mock_client_session)
+
+    @pytest.fixture
+    def bible(self, MockBible: type[Any]) -> Any:
+        return MockBible(
+            command='kjv',
+            name='King James Version',
+            abbr='KJV',
+            service='LocalBible',
+            service_version='KJV',
+        )
+
+    @pytest.mark.parametrize(
+        'verse,expected',
+        [
+            (
+                'Genesis 1:1',
+                '**1.** In the beginning God created the heaven and the earth.',
+            ),
+            (
+                'Genesis 1:1-2',
+                '**1.** In the beginning God created the heaven and the earth. '
+                '**2.** And the earth was without form, and void.',
+            ),
+            (
+                'Genesis 1:2-2:1',
+                '**2.** And the earth was without form, and void. **1.** Thus the '
+                'heavens and the earth were finished.',
+            ),
+            (
+                'Galatians 3:10',
+                '**10.** for it is written, Cursed _is_ every one',
+            ),
+        ],
+    )
+    async def test_get_passage(
+        self, service: LocalBible, bible: Any, verse: str, expected: str
+    ) -> None:
+        verses = VerseRange.from_string(verse)
+
+        assert await service.get_passage(bible, verses) == Passage(
+            expected, verses, 'KJV'
+        )
+
+    async def test_get_passage_mapping(self, service: LocalBible, bible: Any) -> None:
+        bible.book_mapping = {'PrAzar': 'Dan'}
+        verses = VerseRange.from_string('Song of Three Young Men 3:23')
+
+        assert await service.get_passage(bible, verses) == Passage(
+            '**23.** And these three men fell down bound.', verses, 'KJV'
+        )
+
+    async def test_get_passage_no_passages(
+        self, service: LocalBible, bible: Any
+    ) -> None:
+        with pytest.raises(DoNotUnderstandError):
+            await service.get_passage(bible, VerseRange.from_string('John 50:1-4'))
+
+    async def test_get_passage_book_not_in_version(
+        self, service: LocalBible, bible: Any
+    ) -> None:
+        with pytest.raises(BookNotInVersionError):
+            await service.get_passage(bible, VerseRange.from_string('Mark 5:1'))
+
+    async def test_get_passage_no_corpus(self, service: LocalBible, bible: Any) -> None:
+        bible.service_version = 'ASV'
+
+        with pytest.raises(BibleNotSupportedError):
+            await service.get_passage(bible, VerseRange.from_string('Genesis 1:1'))
+
+    async def test_search(self, service: LocalBible, bible: Any) -> None:
+        assert await service.search(bible, ['God', 'world']) == SearchResults(
+            [
+                Passage(
+                    'For God so loved the world, that he gave his only begotten Son',
+                    VerseRange.from_string('John 3:16'),
+                    'KJV',
+                ),
+                Passage(
+                    'For God sent not his Son into the world to condemn the world',
+                    VerseRange.from_string('John 3:17'),
+                    'KJV',
+                ),
+            ],
+            2,
+        )
+
+    @pytest.mark.parametrize(
+        'terms,expected',
+        [
+            (['heaven'], ['Genesis 1:1']),
+            (['"loved', 'the', 'world"'], ['John 3:16']),
+            (['"the', 'world"'], ['John 3:16', 'John 3:17']),
+            (['"world', 'that"', 'son'], ['John 3:16']),
+            (['is', 'written'], ['Galatians 3:10']),
+            (['"the', 'heaven', 'earth"'], []),
+            (['darkness'], []),
+            (['', '"'], []),
+        ],
+    )
+    async def test_search_words_and_phrases(
+        self, service: LocalBible, bible: Any, terms: list[str], expected: list[str]
+    ) -> None:
+        result = await service.search(bible, terms)
+
+        assert [str(passage.range) for passage in result] == expected
+        assert result.total == len(expected)
+
+    async def test_search_limit_offset(self, service: LocalBible, bible: Any) -> None:
+        result = await service.search(bible, ['earth'], limit=1, offset=1)
+
+        assert result == SearchResults(
+            [
+                Passage(
+                    'And the earth was without form, and void.',
+                    VerseRange.from_string('Genesis 1:2'),
+                    'KJV',
+                )
+            ],
+            3,
+        )
+
+    @pytest.mark.parametrize('config', [None, {}, {'data_dir': None}])
+    def test_from_config_default_data_dir(
+        self, config: Any, mock_client_session: MagicMock
+    ) -> None:
+        service = LocalBible.from_config(config, mock_client_session)
+
+        assert str(service.data_dir) == 'bibles'
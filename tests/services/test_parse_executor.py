@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from erasmus.services.parse_executor import ParseExecutor, ParseMetrics, parse_metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import Any
+
+
+def _join(*parts: str) -> str:
+    return ''.join(parts)
+
+
+class TestParseMetrics:
+    def test_report(self) -> None:
+        metrics = ParseMetrics()
+        metrics.record_inline(0.002)
+        metrics.record_inline(0.0125)
+        metrics.record_offloaded(0.03, 0.0314)
+
+        assert metrics.report() == (
+            'Inline: 2 parses, loop blocked 14.5ms (max 12.5ms)\n'
+            'Offloaded: 1 parses, 30.0ms in workers (max 30.0ms), '
+            '31.4ms until parsed (max 31.4ms)'
+        )
+
+    def test_reset(self) -> None:
+        metrics = ParseMetrics()
+        metrics.record_inline(0.002)
+        metrics.record_offloaded(0.03, 0.0314)
+        metrics.reset()
+
+        assert metrics.report() == ParseMetrics().report()
+
+
+class TestParseExecutor:
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self) -> Iterator[None]:
+        parse_metrics.reset()
+        yield
+        parse_metrics.reset()
+
+    async def test_run_inline(self) -> None:
+        executor = ParseExecutor()
+
+        assert await executor.run(1 << 20, _join, 'a', 'b') == 'ab'
+        assert parse_metrics.inline_parses == 1
+        assert parse_metrics.offloaded_parses == 0
+
+    async def test_run_below_threshold(self) -> None:
+        with ThreadPoolExecutor(1) as pool:
+            executor = ParseExecutor(pool, 10)
+
+            assert await executor.run(9, _join, 'a', 'b') == 'ab'
+
+        assert parse_metrics.inline_parses == 1
+        assert parse_metrics.offloaded_parses == 0
+
+    async def test_run_offloaded(self) -> None:
+        with ThreadPoolExecutor(1) as pool:
+            executor = ParseExecutor(pool, 10)
+
+            assert await executor.run(10, _join, 'a', 'b') == 'ab'
+
+        assert parse_metrics.inline_parses == 0
+        assert parse_metrics.offloaded_parses == 1
+        assert parse_metrics.wait_time >= parse_metrics.offloaded_time
+
+    def test_shutdown(self) -> None:
+        pool = ThreadPoolExecutor(1)
+        ParseExecutor(pool).shutdown()
+
+        with pytest.raises(RuntimeError):
+            pool.submit(_join, 'a')
+
+    @pytest.mark.parametrize(
+        'config,executor_type,threshold',
+        [
+            ({}, ThreadPoolExecutor, 16384),
+            ({'parse_executor': 'inline'}, type(None), 16384),
+            ({'parse_executor': 'fiber'}, ThreadPoolExecutor, 16384),
+            (
+                {'parse_workers': '2', 'parse_threshold': '100'},
+                ThreadPoolExecutor,
+                16384,
+            ),
+            (
+                {'parse_executor': 'thread', 'parse_threshold': 100},
+                ThreadPoolExecutor,
+                100,
+            ),
+            (
+                {'parse_executor': 'process', 'parse_workers': 1},
+                ProcessPoolExecutor,
+                16384,
+            ),
+        ],
+    )
+    def test_from_config(
+        self, config: Any, executor_type: type[object], threshold: int
+    ) -> None:
+        executor = ParseExecutor.from_config(config)
+
+        assert type(executor.executor) is executor_type
+        assert executor.threshold == threshold
+
+        executor.shutdown()
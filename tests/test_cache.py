@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from erasmus.cache import LRUCache
+
+if TYPE_CHECKING:
+    from unittest.mock import Mock
+
+    from .types import MockerFixture
+
+
+class TestLRUCache:
+    @pytest.fixture
+    def mock_monotonic(self, mocker: MockerFixture) -> Mock:
+        return mocker.patch('erasmus.cache.monotonic', return_value=100.0)
+
+    def test_get_set(self) -> None:
+        cache = LRUCache[str, int]()
+
+        assert cache.get('one') is None
+        cache.set('one', 1)
+        assert cache.get('one') == 1
+        assert 'one' in cache
+        assert len(cache) == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_ratio == 0.5
+
+    def test_get_default(self) -> None:
+        cache = LRUCache[str, int | None]()
+        sentinel = object()
+
+        assert cache.get('one', sentinel) is sentinel
+        cache.set('one', None)
+        assert cache.get('one', sentinel) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = LRUCache[str, int](maxsize=2)
+
+        cache.set('one', 1)
+        cache.set('two', 2)
+        assert cache.get('one') == 1
+        cache.set('three', 3)
+
+        assert 'one' in cache
+        assert 'two' not in cache
+        assert 'three' in cache
+        assert len(cache) == 2
+
+    def test_ttl(self, mock_monotonic: Mock) -> None:
+        cache = LRUCache[str, int](ttl=10)
+
+        cache.set('one', 1)
+        mock_monotonic.return_value = 109.0
+        assert cache.get('one') == 1
+
+        mock_monotonic.return_value = 110.0
+        assert 'one' not in cache
+        assert cache.get('one') is None
+        assert len(cache) == 0
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_discard_and_clear(self) -> None:
+        cache = LRUCache[str, int]()
+
+        cache.set('one', 1)
+        cache.set('two', 2)
+        cache.discard('one')
+        cache.discard('missing')
+        assert 'one' not in cache
+        assert len(cache) == 1
+
+        cache.clear()
+        assert len(cache) == 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pickle
 from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypedDict
@@ -8,7 +9,15 @@ import orjson
 import pytest
 
 from erasmus import data
-from erasmus.data import Book, Passage, SearchResults, SectionFlag, Verse, VerseRange
+from erasmus.data import (
+    Book,
+    BookTable,
+    Passage,
+    SearchResults,
+    SectionFlag,
+    Verse,
+    VerseRange,
+)
 from erasmus.exceptions import (
     BookMappingInvalid,
     BookNotUnderstoodError,
@@ -105,6 +114,34 @@ class TestBook:
         with pytest.raises(BookNotUnderstoodError):
             assert Book.from_name('Harry Potter')
 
+    def test_index(self) -> None:
+        assert Book.from_name('Genesis').index == 0
+        assert Book.from_index(Book.from_name('Revelation').index).osis == 'Rev'
+
+        for index, book in enumerate(_book_data):
+            assert Book.from_index(index).osis == book['osis']
+
+
+class TestBookTable:
+    def test_from_mapping(self) -> None:
+        table = BookTable.from_mapping('Bible', {'Dan': 'DanGr', 'Nope': 'Gen'})
+
+        assert table is not None
+        assert table[Book.from_name('Daniel')] is Book.from_name('DanGr')
+        assert table[Book.from_name('John')] is Book.from_name('John')
+
+    @pytest.mark.parametrize('book_mapping', [None, {}])
+    def test_from_mapping_empty(self, book_mapping: dict[str, str] | None) -> None:
+        assert BookTable.from_mapping('Bible', book_mapping) is None
+
+    def test_from_mapping_raises(self) -> None:
+        with pytest.raises(BookMappingInvalid) as exc_info:
+            BookTable.from_mapping('Bible', {'John': 'HPotter'})
+
+        assert exc_info.value.version == 'Bible'
+        assert exc_info.value.from_book is Book.from_name('John')
+        assert exc_info.value.to_osis == 'HPotter'
+
 
 class TestVerse:
     def test_init(self) -> None:
@@ -130,6 +167,24 @@ class TestVerse:
     def test__ne__(self, verse: Verse, expected: Any) -> None:
         assert verse != expected
 
+    def test_packed(self) -> None:
+        assert Verse(3, 16) == (3 << 10) | 16
+        assert Verse(2, 1) > Verse(1, 176)
+        assert hash(Verse(3, 16)) == hash(Verse(3, 16))
+        assert repr(Verse(3, 16)) == 'Verse(chapter=3, verse=16)'
+
+    def test_pickle(self) -> None:
+        verse = pickle.loads(pickle.dumps(Verse(3, 16)))  # noqa: S301
+
+        assert type(verse) is Verse
+        assert verse.chapter == 3
+        assert verse.verse == 16
+
+    @pytest.mark.parametrize('chapter,verse', [(1, 1024), (1, -1), (-1, 1)])
+    def test_init_raises(self, chapter: int, verse: int) -> None:
+        with pytest.raises(ReferenceNotUnderstoodError):
+            Verse(chapter, verse)
+
 
 class TestVerseRange:
     def test_create(self) -> None:
@@ -168,7 +223,7 @@ class TestVerseRange:
         expected_name = 'Exodus' if osis == 'Gen' else 'Genesis'
 
         mock_bible = mocker.Mock()
-        mock_bible.book_mapping = {osis: osis_to_map}
+        mock_bible.book_table = BookTable.from_mapping('Bible', {osis: osis_to_map})
 
         verse_range = VerseRange.create(book_name, Verse(1, 1), Verse(1, 4))
 
@@ -176,31 +231,39 @@ class TestVerseRange:
 
     def test_for_bible(self, mocker: MockerFixture) -> None:
         mock_bible = mocker.Mock()
-        mock_bible.book_mapping = None
+        mock_bible.book_table = None
 
         verse_range = VerseRange.create('Daniel', Verse(1, 1), Verse(1, 4))
 
         assert verse_range.for_bible(mock_bible) is verse_range
 
-        mock_bible.book_mapping = {'Esth': 'EsthGr'}
+        mock_bible.book_table = BookTable.from_mapping('Bible', {'Esth': 'EsthGr'})
 
         assert verse_range.for_bible(mock_bible) is verse_range
 
-        mock_bible.book_mapping = {'Dan': 'DanGr'}
+        mock_bible.book_table = BookTable.from_mapping('Bible', {'Dan': 'DanGr'})
 
         mapped_verse_range = verse_range.for_bible(mock_bible)
 
         assert mapped_verse_range is not verse_range
         assert mapped_verse_range.book.osis == 'DanGr'
 
-    def test_for_bible_raises(self, mocker: MockerFixture) -> None:
+    def test_with_version(self) -> None:
+        verse_range = VerseRange.create('John', Verse(3, 16), None, 'KJV')
+
+        assert verse_range.with_version('KJV') is verse_range
+        assert verse_range.with_version(None) == VerseRange.create('John', Verse(3, 16))
+        assert hash(verse_range.with_version(None)) == hash(
+            VerseRange.create('John', Verse(3, 16))
+        )
+
+    def test_for_bible_identity(self, mocker: MockerFixture) -> None:
         mock_bible = mocker.Mock()
-        mock_bible.book_mapping = {'John': 'HPotter'}
+        mock_bible.book_table = BookTable.from_mapping('Bible', {'Dan': 'Dan'})
 
-        verse_range = VerseRange.create('John', Verse(1, 1), Verse(1, 4))
+        verse_range = VerseRange.create('Daniel', Verse(1, 1), Verse(1, 4))
 
-        with pytest.raises(BookMappingInvalid):
-            verse_range.for_bible(mock_bible)
+        assert verse_range.for_bible(mock_bible) is verse_range
 
     @pytest.mark.parametrize(
         'passage,expected',
@@ -213,6 +276,20 @@ class TestVerseRange:
     def test__str__(self, passage: VerseRange, expected: str) -> None:
         assert str(passage) == expected
 
+    @pytest.mark.parametrize(
+        'passage,expected',
+        [
+            (VerseRange.create('John', Verse(1, 1)), 'John.1.1'),
+            (
+                VerseRange.create('1 John', Verse(1, 1), Verse(1, 4)),
+                '1John.1.1-1John.1.4',
+            ),
+            (VerseRange.create('John', Verse(1, 1), Verse(2, 2)), 'John.1.1-John.2.2'),
+        ],
+    )
+    def test_osis_range(self, passage: VerseRange, expected: str) -> None:
+        assert passage.osis_range == expected
+
     @pytest.mark.parametrize(
         'passage,expected',
         [
@@ -451,6 +528,65 @@ class TestVerseRange:
 
         assert passages == expected[index]
 
+    def test_parse_many(self) -> None:
+        results = list(
+            VerseRange.parse_many(
+                [
+                    'John 3:16 and [Mark 2:1-4 KJV]',
+                    'nothing to see here',
+                    'Harry Potter 1:1',
+                    'Acts 3:5-6:7',
+                ]
+            )
+        )
+
+        assert results[:2] == [
+            (0, VerseRange.create('John', Verse(3, 16))),
+            (0, VerseRange.create('Mark', Verse(2, 1), Verse(2, 4), 'KJV')),
+        ]
+        assert results[2][0] == 3
+        assert results[2][1] == VerseRange.create('Acts', Verse(3, 5), Verse(6, 7))
+        assert len(results) == 3
+
+    def test_parse_many_errors(self) -> None:
+        strings = ['Gen 1:1 \u0130saiah 1:1']
+        results = list(VerseRange.parse_many(strings))
+
+        assert len(results) == 2
+        assert results[0] == (0, VerseRange.create('Genesis', Verse(1, 1)))
+        assert results[1][0] == 0
+        assert isinstance(results[1][1], BookNotUnderstoodError)
+        assert list(VerseRange.parse_many(strings, compact=True)) == [
+            (0, Book.from_name('Genesis').index, 1, 1, 0, 0)
+        ]
+
+    def test_parse_many_compact(self) -> None:
+        john = Book.from_name('John').index
+        mark = Book.from_name('Mark').index
+        acts = Book.from_name('Acts').index
+
+        assert list(
+            VerseRange.parse_many(
+                ['John 3:16 and [Mark 2:1-4 KJV]', 'hello', 'Acts 3:5-6:7'],
+                compact=True,
+            )
+        ) == [
+            (0, john, 3, 16, 0, 0),
+            (0, mark, 2, 1, 2, 4),
+            (2, acts, 3, 5, 6, 7),
+        ]
+
+    def test_parse_many_compact_only_bracketed(self) -> None:
+        mark = Book.from_name('Mark').index
+
+        assert list(
+            VerseRange.parse_many(
+                ['John 3:16 and [Mark 2:1-4 KJV]', '[Acts 3:5-6:7'],
+                only_bracketed=True,
+                compact=True,
+            )
+        ) == [(0, mark, 2, 1, 2, 4)]
+
 
 class TestPassage:
     def test_init(self) -> None:
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import random
+from itertools import count
+from typing import TYPE_CHECKING, Final
+
+import pytest
+from botus_receptus import re
+
+from erasmus.data import (
+    Book,
+    _reference_re,
+    _reference_scanner,
+    _reference_with_version_re,
+    _version_group,
+)
+from erasmus.reference_scanner import ReferenceMatch, could_contain_reference
+
+if TYPE_CHECKING:
+    from re import Pattern
+
+# The regular expressions the scanner replaced
+_reference_or_bracketed_with_version_re: Final = re.compile(
+    re.optional(
+        re.named_group('bracket')(re.LEFT_BRACKET, re.any_number_of(re.WHITESPACE))
+    ),
+    _reference_re,
+    re.if_group(
+        'bracket',
+        re.group(
+            re.optional(
+                re.one_or_more(re.WHITESPACE),
+                _version_group(re.one_or_more(re.ALPHANUMERICS)),
+            ),
+            re.any_number_of(re.WHITESPACE),
+            re.RIGHT_BRACKET,
+        ),
+    ),
+    flags=re.IGNORECASE,
+)
+
+_bracketed_reference_with_version_re: Final = re.compile(
+    re.LEFT_BRACKET,
+    re.any_number_of(re.WHITESPACE),
+    _reference_with_version_re,
+    re.any_number_of(re.WHITESPACE),
+    re.RIGHT_BRACKET,
+    flags=re.IGNORECASE,
+)
+
+
+def _book_names() -> list[str]:
+    names: set[str] = set()
+
+    for index in count():
+        try:
+            book = Book.from_index(index)
+        except IndexError:
+            break
+
+        names.update(name.lower() for name in {book.name, book.osis, *book.alt})
+
+    return sorted(names)
+
+
+_books: Final = [
+    *_book_names(),
+    'JOHN',
+    'Psalm 151',
+    'g\u0130n',
+    'mar\u212a',
+    'ru\u017fs',
+]
+_whitespace: Final = ['', '', ' ', ' ', '  ', '\t', '\n', '\u00a0']
+_digits: Final = ['', '1', '3', '16', '151', '\u0663']
+_dashes: Final = ['-', '\u2013', '\u2014', '', 'x']
+_versions: Final = ['', 'kjv', 'ESV', '17', 'x-y', '.']
+_noise: Final = ['', '', 'x', '.', '[', ']', ':', '(', '12:30', 'https://a.b']
+
+_cases: Final = [
+    '',
+    'no references here',
+    'John 3:16',
+    'john 3:16-17',
+    'John 3:16 - 4:2',
+    'John 3:16 - 4:',
+    'John 3:16 -',
+    '1 John 1:1 and John 1:1',
+    'xjohn 3:16',
+    '1John 3:16',
+    'Gen 1:1 john 2:3',
+    'Gen 1:1john 2:3',
+    'Gen. 1:1',
+    'Gen .1:1',
+    'Gen 1 :  1',
+    'Psalm 151:1 Psalm 151 1:1',
+    'Song of Songs 1:1, Song of Solomon 2:1',
+    '[John 3:16]',
+    '[ John 3:16 ]',
+    '[John 3:16 ESV]',
+    '[John 3:16ESV]',
+    '[John 3:16 17]',
+    '[John 3:16-17 kjv]',
+    '[John 3:16- kjv]',
+    '[John 3:16 - 4:1 kjv ]',
+    '[John 3:16 kjv',
+    '[[John 3:16]]',
+    '[1 John 3:16] [John 3:16]',
+    '[[ John 3:16 x]',
+    'mar\u212a 1:1',
+    'g\u0130n 1:1',
+    'ru\u017fs 1:1',
+    'John \u0663:\u0661\u0666',
+    'John\u00a03:16',
+    'John 3:16\u20134:1 [Mark 1:1\u20142 kjv]',
+    'At 12:30 we read Romans 8:28 (https://example.com)',
+]
+
+
+def _regex_matches(pattern: Pattern[str], string: str, /) -> list[ReferenceMatch]:
+    matches: list[ReferenceMatch] = []
+    position = 0
+
+    while (match := pattern.search(string, position)) is not None:
+        groups = match.groupdict()
+        matches.append(
+            ReferenceMatch(
+                book=groups['book'],
+                chapter_start=groups['chapter_start'],
+                verse_start=groups['verse_start'],
+                chapter_end=groups['chapter_end'],
+                verse_end=groups['verse_end'],
+                version=groups['version'],
+                start=match.start(),
+                end=match.end(),
+            )
+        )
+        position = match.end()
+
+    return matches
+
+
+def _random_reference(rng: random.Random, /) -> str:
+    def choice(items: list[str], /) -> str:
+        return rng.choice(items)
+
+    def optional(string: str, /) -> str:
+        return string if rng.random() < 0.5 else ''
+
+    def ws() -> str:
+        return choice(_whitespace)
+
+    return ''.join(
+        [
+            optional('[' + ws()),
+            choice(_books),
+            optional('.'),
+            ws(),
+            choice(_digits),
+            ws(),
+            choice([':', ':', ':', '']),
+            ws(),
+            choice(_digits),
+            optional(
+                ws()
+                + choice(_dashes)
+                + ws()
+                + optional(choice(_digits) + ws() + ':' + ws())
+                + choice(_digits)
+            ),
+            optional(ws() + choice(_versions)),
+            optional(ws() + ']'),
+        ]
+    )
+
+
+def _random_cases(count: int, /) -> list[str]:
+    rng = random.Random(1517)  # noqa: S311
+
+    return [
+        ''.join(
+            _random_reference(rng) + rng.choice(_noise) + rng.choice(_whitespace)
+            for _ in range(rng.randint(1, 4))
+        )
+        for _ in range(count)
+    ]
+
+
+class TestReferenceScanner:
+    @pytest.mark.parametrize('string', _cases)
+    def test_scan(self, string: str) -> None:
+        assert list(_reference_scanner.scan(string)) == _regex_matches(
+            _reference_or_bracketed_with_version_re, string
+        )
+
+    @pytest.mark.parametrize('string', _cases)
+    def test_scan_only_bracketed(self, string: str) -> None:
+        assert list(
+            _reference_scanner.scan(string, only_bracketed=True)
+        ) == _regex_matches(_bracketed_reference_with_version_re, string)
+
+    def test_scan_random(self) -> None:
+        for string in _random_cases(5000):
+            assert list(_reference_scanner.scan(string)) == _regex_matches(
+                _reference_or_bracketed_with_version_re, string
+            ), string
+            assert list(
+                _reference_scanner.scan(string, only_bracketed=True)
+            ) == _regex_matches(_bracketed_reference_with_version_re, string), string
+
+
+@pytest.mark.parametrize(
+    'string,only_bracketed,expected',
+    [
+        ('', False, False),
+        ('good morning', False, False),
+        ('see you at 3 : 30', False, True),
+        ('see you at 3:30', True, False),
+        ('https://example.com :smile:', False, False),
+        ('John 3:16', False, True),
+        ('John 3:16', True, False),
+        ('[John 3:16', True, False),
+        ('[John 3:16]', True, True),
+        ('John \u0663:\u0661', False, True),
+    ],
+)
+def test_could_contain_reference(
+    string: str, only_bracketed: bool, expected: bool
+) -> None:
+    assert could_contain_reference(string, only_bracketed=only_bracketed) is expected
+
+
+def test_could_contain_reference_no_false_negatives() -> None:
+    for string in [*_cases, *_random_cases(5000)]:
+        for only_bracketed in (False, True):
+            if any(_reference_scanner.scan(string, only_bracketed=only_bracketed)):
+                assert could_contain_reference(string, only_bracketed=only_bracketed), (
+                    string
+                )
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Any, Self, cast
 import pytest
 from attrs import define, field
 
-from erasmus.data import Passage, SearchResults, SectionFlag, VerseRange
+from erasmus.data import BookTable, Passage, SearchResults, SectionFlag, VerseRange
 from erasmus.exceptions import (
     ServiceLookupTimeout,
     ServiceNotSupportedError,
@@ -44,6 +44,10 @@ class MockBible:
     books: SectionFlag = field(default=SectionFlag.OT)
     book_mapping: dict[str, str] | None = field(default=None)
 
+    @property
+    def book_table(self) -> BookTable | None:
+        return BookTable.from_mapping(self.name, self.book_mapping)
+
 
 class TestServiceManager:
     @pytest.fixture(autouse=True)
@@ -119,13 +123,71 @@ class TestServiceManager:
         manager = ServiceManager.from_config(config, mock_client_session)
 
         services['ServiceOne'].from_config.assert_called_once_with(
-            None, mock_client_session
+            None, mock_client_session, parse_executor=manager.parse_executor
         )
         services['ServiceTwo'].from_config.assert_called_once_with(
-            config['services']['ServiceTwo'], mock_client_session
+            config['services']['ServiceTwo'],
+            mock_client_session,
+            parse_executor=manager.parse_executor,
         )
         assert manager.service_map['ServiceOne'] == mocker.sentinel.SERVICE_ONE
         assert manager.service_map['ServiceTwo'] == mocker.sentinel.SERVICE_TWO
+        assert manager.passage_cache.maxsize == 1024
+        assert manager.passage_cache.ttl == 3600
+
+    def test_from_config_passage_cache(
+        self, config: Any, mock_client_session: MagicMock
+    ) -> None:
+        config['passage_cache_size'] = 10
+        config['passage_cache_ttl'] = 60
+
+        manager = ServiceManager.from_config(config, mock_client_session)
+
+        assert manager.passage_cache.maxsize == 10
+        assert manager.passage_cache.ttl == 60
+
+    def test_from_config_unstored_services(
+        self, services: dict[str, Any], config: Any, mock_client_session: MagicMock
+    ) -> None:
+        services['ServiceOne'].store_passages = False
+        config['services']['ServiceTwo']['passage_store'] = False
+
+        manager = ServiceManager.from_config(config, mock_client_session)
+
+        assert manager.unstored_services == {'ServiceOne', 'ServiceTwo'}
+
+        config['services']['ServiceOne'] = {'passage_store': True}
+
+        manager = ServiceManager.from_config(config, mock_client_session)
+
+        assert manager.unstored_services == {'ServiceTwo'}
+
+    def test_from_config_parse_executor(
+        self, config: Any, mock_client_session: MagicMock
+    ) -> None:
+        config['parse_executor'] = 'inline'
+        config['parse_threshold'] = 100
+
+        manager = ServiceManager.from_config(config, mock_client_session)
+
+        assert manager.parse_executor.executor is None
+        assert manager.parse_executor.threshold == 100
+
+    async def test_close(self, mocker: MockerFixture) -> None:
+        passage_store = mocker.NonCallableMock(close=mocker.AsyncMock())
+        parse_executor = mocker.NonCallableMock()
+        closable_service = mocker.NonCallableMock(close=mocker.AsyncMock())
+        manager = ServiceManager(
+            {'MyService': MockService.create(mocker), 'ApiBible': closable_service},
+            passage_store=passage_store,
+            parse_executor=parse_executor,
+        )
+
+        await manager.close()
+
+        closable_service.close.assert_awaited_once_with()
+        passage_store.close.assert_awaited_once_with()
+        parse_executor.shutdown.assert_called_once_with()
 
     def test_container_methods(
         self, config: Any, mock_client_session: MagicMock
@@ -160,6 +222,210 @@ class TestServiceManager:
             bible2, VerseRange.from_string('Genesis 1:2')
         )
 
+    async def test_get_passage_cached(
+        self,
+        bible1: Bible,
+        bible2: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        manager = ServiceManager({'ServiceOne': service_one, 'ServiceTwo': service_two})
+        service_one.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+        service_two.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB2'
+        )
+
+        result1 = await manager.get_passage(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        result2 = await manager.get_passage(
+            bible1, VerseRange.from_string_with_version('Genesis 1:2 BIB1')
+        )
+        result3 = await manager.get_passage(
+            bible2, VerseRange.from_string('Genesis 1:2')
+        )
+
+        assert result1 is result2
+        assert result3 == Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB2'
+        )
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        service_two.get_passage.assert_called_once_with(
+            bible2, VerseRange.from_string('Genesis 1:2')
+        )
+        assert manager.passage_cache.hits == 1
+        assert manager.passage_cache.misses == 2
+
+    async def test_get_passage_timeout_not_cached(
+        self,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        async def get_passage(*args: Any, **kwargs: Any) -> None:
+            await asyncio.sleep(0.5)
+
+        manager = ServiceManager(
+            {'ServiceOne': service_one, 'ServiceTwo': service_two}, timeout=0.1
+        )
+        service_one.get_passage.side_effect = get_passage
+
+        with pytest.raises(ServiceLookupTimeout):
+            await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+
+        assert len(manager.passage_cache) == 0
+
+    async def test_get_passage_coalesced(
+        self,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        async def get_passage(bible: Bible, verses: VerseRange) -> Passage:
+            await asyncio.sleep(0.05)
+            return Passage('blah', verses, version=bible.abbr)
+
+        manager = ServiceManager({'ServiceOne': service_one, 'ServiceTwo': service_two})
+        service_one.get_passage.side_effect = get_passage
+
+        results = await asyncio.gather(
+            *[
+                manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+                for _ in range(5)
+            ]
+        )
+
+        assert all(result is results[0] for result in results)
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        assert manager._inflight == {}
+
+    async def test_get_passage_coalesced_cancel_one(
+        self,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        async def get_passage(bible: Bible, verses: VerseRange) -> Passage:
+            await asyncio.sleep(0.05)
+            return Passage('blah', verses, version=bible.abbr)
+
+        manager = ServiceManager({'ServiceOne': service_one, 'ServiceTwo': service_two})
+        service_one.get_passage.side_effect = get_passage
+
+        task1 = asyncio.create_task(
+            manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+        )
+        task2 = asyncio.create_task(
+            manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+        )
+        await asyncio.sleep(0.01)
+        task1.cancel()
+
+        assert (await task2) == Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+        assert task1.cancelled()
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+
+    async def test_get_passage_from_store(
+        self,
+        mocker: MockerFixture,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        passage_store = mocker.NonCallableMock(
+            get=mocker.AsyncMock(return_value='stored text'), put=mocker.Mock()
+        )
+        manager = ServiceManager(
+            {'ServiceOne': service_one, 'ServiceTwo': service_two},
+            passage_store=passage_store,
+        )
+
+        result = await manager.get_passage(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+
+        assert result == Passage(
+            'stored text', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+        passage_store.get.assert_awaited_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        passage_store.put.assert_not_called()
+        service_one.get_passage.assert_not_called()
+        assert (
+            manager.passage_cache.get((1, VerseRange.from_string('Genesis 1:2')))
+            is result
+        )
+
+    async def test_get_passage_store_miss(
+        self,
+        mocker: MockerFixture,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        passage_store = mocker.NonCallableMock(
+            get=mocker.AsyncMock(return_value=None), put=mocker.Mock()
+        )
+        manager = ServiceManager(
+            {'ServiceOne': service_one, 'ServiceTwo': service_two},
+            passage_store=passage_store,
+        )
+        service_one.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+
+        result = await manager.get_passage(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+
+        assert result == Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        passage_store.put.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2'), 'blah'
+        )
+
+    async def test_get_passage_unstored_service(
+        self,
+        mocker: MockerFixture,
+        bible1: Bible,
+        service_one: MockService,
+        service_two: MockService,
+    ) -> None:
+        passage_store = mocker.NonCallableMock(
+            get=mocker.AsyncMock(), put=mocker.Mock()
+        )
+        manager = ServiceManager(
+            {'ServiceOne': service_one, 'ServiceTwo': service_two},
+            passage_store=passage_store,
+            unstored_services=frozenset({'ServiceOne'}),
+        )
+        service_one.get_passage.return_value = Passage(
+            'blah', VerseRange.from_string('Genesis 1:2'), version='BIB1'
+        )
+
+        await manager.get_passage(bible1, VerseRange.from_string('Genesis 1:2'))
+
+        service_one.get_passage.assert_called_once_with(
+            bible1, VerseRange.from_string('Genesis 1:2')
+        )
+        passage_store.get.assert_not_called()
+        passage_store.put.assert_not_called()
+
     async def test_get_passage_raises(
         self, service_one: MockService, service_two: MockService, bible3: MockBible
     ) -> None: